@@ -0,0 +1,85 @@
+"""Measure adjusted vs raw price reads from a Parquet store with split/dividend events.
+
+Usage: ``python -m benchmarks.bench_adjustments --symbols 50 --bars 10000 --events 40``
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from typing import Callable
+
+import numpy as np
+
+from trading_app.data.schemas import CorporateAction
+from trading_app.data.sources.synthetic import SyntheticMarketDataSource
+from trading_app.data.storage.parquet_store import ParquetDataStore
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--symbols", type=int, default=50)
+    parser.add_argument("--bars", type=int, default=10_000, help="Bars per symbol")
+    parser.add_argument("--events", type=int, default=40, help="Corporate actions per symbol")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    source = SyntheticMarketDataSource(bars=args.bars)
+    symbols = source.universe(args.symbols)
+    timestamps = source.fetch_history_frame(symbols[:1])["timestamp"]
+    rng = np.random.default_rng(0)
+
+    with tempfile.TemporaryDirectory() as root:
+        store = ParquetDataStore(root)
+        source.write_to_store(store, symbols)
+        for symbol in symbols:
+            days = rng.choice(len(timestamps), size=args.events, replace=False)
+            store.save_actions(
+                CorporateAction(
+                    symbol=symbol,
+                    ex_date=timestamps.iloc[day].to_pydatetime(),
+                    kind="split" if index % 10 == 0 else "dividend",
+                    value=2.0 if index % 10 == 0 else 0.25,
+                )
+                for index, day in enumerate(days)
+            )
+
+        rows = args.symbols * args.bars
+        print(
+            f"{rows:,} rows ({args.symbols} symbols x {args.bars} bars), {args.events} events each"
+        )
+        raw = _best_seconds(lambda: _read(store, symbols, adjusted=False), args.repeats)
+
+        def cold() -> None:
+            for symbol in symbols:
+                store.adjustments.invalidate(symbol)
+            _read(store, symbols, adjusted=True)
+
+        cold_seconds = _best_seconds(cold, args.repeats)
+        cached = _best_seconds(lambda: _read(store, symbols, adjusted=True), args.repeats)
+        print(f"{'read':<26}{'seconds':>10}{'Mrows/s':>10}")
+        for label, seconds in (
+            ("raw", raw),
+            ("adjusted, factors rebuilt", cold_seconds),
+            ("adjusted, factors cached", cached),
+        ):
+            print(f"{label:<26}{seconds:>10.3f}{rows / seconds / 1e6:>10.2f}")
+
+
+def _read(store: ParquetDataStore, symbols: list[str], adjusted: bool) -> None:
+    for symbol in symbols:
+        store.load_prices(symbol, adjusted=adjusted)
+
+
+def _best_seconds(run: Callable[[], object], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Measure ``SimulatedBroker`` throughput on a large batch of orders.
+
+Orders are split across symbols and types (market, limit, stop), submitted in
+one batch, matched over several rounds of bars (with a participation cap, so
+large orders fill partially), and whatever is left is cancelled by symbol.
+
+Usage: ``python -m benchmarks.bench_broker --orders 1000000 --symbols 1000 --rounds 5``
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from trading_app.data.schemas import PriceBar
+from trading_app.execution.costs import FixedBpsSlippage, PerShareCommission
+from trading_app.execution.orders import Order, OrderSide, OrderType
+from trading_app.execution.simulated_broker import SimulatedBroker
+from trading_app.portfolio.models import PortfolioState, Position
+
+START = datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=1_000_000)
+    parser.add_argument("--symbols", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=5, help="Bars per symbol")
+    parser.add_argument("--participation", type=float, default=0.25)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    symbols = [f"S{index:05d}" for index in range(args.symbols)]
+    orders = [_random_order(rng, rng.choice(symbols)) for _ in range(args.orders)]
+    state = PortfolioState(
+        cash=1e15, positions={symbol: Position(symbol, 1e9, 100.0) for symbol in symbols}
+    )
+    broker = SimulatedBroker(
+        commission_model=PerShareCommission(per_share=0.005, minimum=1.0),
+        slippage_model=FixedBpsSlippage(bps=2),
+        max_participation=args.participation,
+    )
+    volume = 4.0 * args.orders / args.symbols  # shares traded per bar
+
+    started = time.perf_counter()
+    broker.submit_orders(orders, state)
+    submit_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for minute in range(args.rounds):
+        for symbol in symbols:
+            close = 100.0 + rng.uniform(-2.0, 2.0)
+            stamp = START + timedelta(minutes=minute)
+            bar = PriceBar(symbol, stamp, close, close, close, close, volume=volume)
+            broker.process_bar(bar, state)
+    match_seconds = time.perf_counter() - started
+    bars = args.rounds * args.symbols
+
+    open_orders = len(broker.open_orders())
+    started = time.perf_counter()
+    broker.cancel_all(symbols)
+    cancel_seconds = time.perf_counter() - started
+
+    stats = broker.stats
+    print(f"{args.orders:,} orders over {args.symbols} symbols, {bars:,} bars")
+    print(f"{'stage':<8}{'seconds':>10}{'per second':>14}")
+    print(f"{'submit':<8}{submit_seconds:>10.3f}{args.orders / submit_seconds:>14,.0f} orders")
+    print(f"{'match':<8}{match_seconds:>10.3f}{stats.fills / match_seconds:>14,.0f} fills")
+    print(f"{'cancel':<8}{cancel_seconds:>10.3f}{open_orders / cancel_seconds:>14,.0f} orders")
+    print(
+        f"fills={stats.fills:,} rejected={stats.rejected:,} cancelled={stats.cancelled:,} "
+        f"bars/s={bars / match_seconds:,.0f}"
+    )
+
+
+def _random_order(rng: random.Random, symbol: str) -> Order:
+    side = OrderSide.BUY if rng.random() < 0.5 else OrderSide.SELL
+    quantity = float(rng.randint(1, 10))
+    kind = rng.random()
+    if kind < 0.5:
+        return Order(symbol, quantity, side)
+    price = round(100.0 + rng.uniform(-3.0, 3.0), 2)
+    if kind < 0.8:
+        return Order(symbol, quantity, side, type=OrderType.LIMIT, limit_price=price)
+    return Order(symbol, quantity, side, type=OrderType.STOP, stop_price=price)
+
+
+if __name__ == "__main__":
+    main()
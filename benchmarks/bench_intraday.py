@@ -0,0 +1,79 @@
+"""Compare the datetime path with the int64-nanosecond path on minute bars.
+
+Covers store writes and reads, replay, the backtest engine and metrics.
+
+Usage: ``python -m benchmarks.bench_intraday --symbols 20 --days 20``
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Callable
+
+from trading_app.backtesting.engine import BacktestEngine
+from trading_app.backtesting.metrics import summarize
+from trading_app.data.frames import frame_to_bars, frame_to_compact_bars
+from trading_app.data.sources.replay import ReplayMarketDataSource
+from trading_app.data.sources.synthetic import SyntheticMarketDataSource
+from trading_app.data.storage.parquet_store import ParquetDataStore
+from trading_app.strategies.sma_crossover import SmaCrossoverStrategy
+
+MINUTES_PER_DAY = 390
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--symbols", type=int, default=20)
+    parser.add_argument("--days", type=int, default=20, help="Sessions of 390 minute bars")
+    args = parser.parse_args()
+
+    source = SyntheticMarketDataSource(
+        bars=args.days * MINUTES_PER_DAY,
+        interval=timedelta(minutes=1),
+        bars_per_year=252 * MINUTES_PER_DAY,
+    )
+    symbols = source.universe(args.symbols)
+    frame = source.fetch_history_frame(symbols)
+    print(f"{len(frame):,} minute bars ({args.symbols} symbols x {args.days} sessions)")
+    print(f"{'stage':<10}{'datetime s':>12}{'ns s':>10}{'speedup':>9}")
+
+    with tempfile.TemporaryDirectory() as root:
+        paths = {}
+        for mode, build in (("datetime", frame_to_bars), ("ns", frame_to_compact_bars)):
+            bars = build(frame)
+            store = ParquetDataStore(str(Path(root) / mode))
+            paths[mode] = {"write": _seconds(lambda: store.save_prices(bars))}
+            paths[mode]["read"] = _seconds(
+                lambda: [
+                    store.load_compact_bars(symbol) if mode == "ns" else store.load_prices(symbol)
+                    for symbol in symbols
+                ]
+            )
+            replay = ReplayMarketDataSource(store, ns=mode == "ns")
+            stream: list[object] = []
+            paths[mode]["replay"] = _seconds(lambda: stream.extend(replay.stream_live(symbols)))
+            strategy = SmaCrossoverStrategy(symbol=symbols[0], short_window=20, long_window=60)
+            engine = BacktestEngine(strategy, ns=mode == "ns")
+            result = []
+            paths[mode]["engine"] = _seconds(lambda: result.append(engine.run(stream)))
+            paths[mode]["metrics"] = _seconds(lambda: summarize(result[0]))
+
+    for stage in ("write", "read", "replay", "engine", "metrics"):
+        slow, fast = paths["datetime"][stage], paths["ns"][stage]
+        print(f"{stage:<10}{slow:>12.3f}{fast:>10.3f}{slow / fast:>8.1f}x")
+    slow, fast = sum(paths["datetime"].values()), sum(paths["ns"].values())
+    print(f"{'total':<10}{slow:>12.3f}{fast:>10.3f}{slow / fast:>8.1f}x")
+
+
+def _seconds(run: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    run()
+    return time.perf_counter() - started
+
+
+if __name__ == "__main__":
+    main()
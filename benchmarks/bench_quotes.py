@@ -0,0 +1,70 @@
+"""Compare sequential and concurrent quote fetching against an injected-latency source.
+
+Usage: ``python -m benchmarks.bench_quotes --symbols 500 --latency 0.05 --concurrency 1 8 32 64``
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Iterable, Sequence
+
+from trading_app.data.schemas import PriceBar, Quote
+from trading_app.data.sources.base import MarketDataSource
+
+
+class LatencySource(MarketDataSource):
+    """Stand-in source whose quote lookups block for a fixed network-like latency."""
+
+    name = "latency"
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+
+    def fetch_history(
+        self, symbols: Sequence[str], start: datetime | None = None, end: datetime | None = None
+    ) -> Iterable[PriceBar]:
+        return []
+
+    def stream_live(self, symbols: Sequence[str]) -> Iterable[PriceBar]:
+        return []
+
+    def fetch_quotes(self, symbols: Sequence[str]) -> Iterable[Quote]:
+        for symbol in symbols:
+            time.sleep(self.latency)
+            yield Quote(symbol, datetime.now(timezone.utc), 1.0, 1.1, provider=self.name)
+
+
+async def _drain(source: MarketDataSource, symbols: list[str], concurrency: int) -> int:
+    return len([quote async for quote in source.afetch_quotes(symbols, concurrency=concurrency)])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--symbols", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds per quote call")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 64])
+    args = parser.parse_args()
+
+    source = LatencySource(args.latency)
+    symbols = [f"SYM{i:04d}" for i in range(args.symbols)]
+
+    started = time.perf_counter()
+    count = len(list(source.fetch_quotes(symbols)))
+    sequential = time.perf_counter() - started
+
+    print(f"{args.symbols} symbols at {args.latency * 1000:.0f}ms latency (seconds)")
+    print(f"{'mode':<16}{'quotes':>8}{'seconds':>10}{'speedup':>10}")
+    print(f"{'sequential':<16}{count:>8}{sequential:>10.3f}{1.0:>10.1f}")
+    for concurrency in args.concurrency:
+        started = time.perf_counter()
+        count = asyncio.run(_drain(source, symbols, concurrency))
+        elapsed = time.perf_counter() - started
+        label = f"async x{concurrency}"
+        print(f"{label:<16}{count:>8}{elapsed:>10.3f}{sequential / elapsed:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Time ``TargetWeightRebalancer`` on a large universe against a per-symbol loop.
+
+Usage: ``python -m benchmarks.bench_rebalance --symbols 5000 --held 4000 --repeat 20``
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import time
+from typing import Callable
+
+from trading_app.execution.orders import Order, OrderSide
+from trading_app.portfolio.models import PortfolioState, Position
+from trading_app.portfolio.rebalance import TargetWeightRebalancer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--symbols", type=int, default=5000)
+    parser.add_argument("--held", type=int, default=4000, help="Symbols currently held")
+    parser.add_argument("--band", type=float, default=0.0001, help="No-trade band (weight)")
+    parser.add_argument("--min-notional", type=float, default=100.0)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    symbols = [f"S{index:05d}" for index in range(args.symbols)]
+    prices = {symbol: rng.uniform(5.0, 500.0) for symbol in symbols}
+    positions = {
+        symbol: Position(symbol, float(rng.randint(10, 500)), prices[symbol])
+        for symbol in rng.sample(symbols, args.held)
+    }
+    state = PortfolioState(cash=1_000_000.0, positions=positions)
+    raw = {symbol: rng.random() for symbol in rng.sample(symbols, int(args.symbols * 0.9))}
+    total = sum(raw.values())
+    targets = {symbol: weight / total for symbol, weight in raw.items()}
+
+    rebalancer = TargetWeightRebalancer(
+        lot_size=1.0, min_trade_notional=args.min_notional, no_trade_band=args.band
+    )
+    vectorized = _best_seconds(lambda: rebalancer.rebalance(targets, state, prices), args.repeat)
+    looped = _best_seconds(
+        lambda: _per_symbol(targets, state, prices, args.band, args.min_notional), args.repeat
+    )
+    orders = rebalancer.rebalance(targets, state, prices)
+    sells = sum(order.side is OrderSide.SELL for order in orders)
+    print(f"{args.symbols:,} symbols, {args.held:,} held -> {len(orders):,} orders ({sells} sells)")
+    print(f"{'method':<12}{'ms':>10}{'us/symbol':>11}")
+    for label, seconds in (("vectorized", vectorized), ("per-symbol", looped)):
+        print(f"{label:<12}{seconds * 1e3:>10.2f}{seconds * 1e6 / args.symbols:>11.2f}")
+    print(f"speedup {looped / vectorized:.1f}x")
+
+
+def _per_symbol(
+    targets: dict[str, float],
+    state: PortfolioState,
+    prices: dict[str, float],
+    band: float,
+    min_notional: float,
+) -> list[Order]:
+    """Reference loop: one symbol at a time, same rules, sells sorted before buys."""
+    equity = state.cash + sum(
+        position.quantity * prices[symbol] for symbol, position in state.positions.items()
+    )
+    trades = []
+    for symbol in set(targets) | set(state.positions):
+        price = prices[symbol]
+        position = state.positions.get(symbol)
+        held = position.quantity if position is not None else 0.0
+        target = targets.get(symbol, 0.0)
+        if target == 0 and held > 0:
+            trades.append((held * price, Order(symbol, held, OrderSide.SELL)))
+            continue
+        if abs(target - held * price / equity) <= band:
+            continue
+        delta = math.trunc(target * equity / price - held)
+        if delta != 0 and abs(delta) * price >= min_notional:
+            side = OrderSide.BUY if delta > 0 else OrderSide.SELL
+            trades.append((abs(delta) * price, Order(symbol, float(abs(delta)), side)))
+    trades.sort(key=lambda trade: (trade[1].side is OrderSide.BUY, -trade[0]))
+    return [order for _, order in trades]
+
+
+def _best_seconds(run: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+if __name__ == "__main__":
+    main()
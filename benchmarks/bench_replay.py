@@ -0,0 +1,74 @@
+"""Load-test a consumer with ReplayMarketDataSource at different replay speeds.
+
+Usage: ``python -m benchmarks.bench_replay --symbols 20 --bars 390 --speeds 0 600 6000 --work-us 50``
+
+Speed ``0`` means as fast as possible; ``--work-us`` simulates per-bar consumer work.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from trading_app.data.schemas import PriceBar
+from trading_app.data.sources.replay import ReplayMarketDataSource
+from trading_app.data.storage.parquet_store import ParquetDataStore
+
+_OPEN = datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc)
+
+
+def _minute_bars(symbol: str, count: int) -> list[PriceBar]:
+    return [
+        PriceBar(
+            symbol=symbol,
+            timestamp=_OPEN + timedelta(minutes=minute),
+            open=100.0,
+            high=101.0,
+            low=99.0,
+            close=100.0 + minute * 0.01,
+            volume=1_000.0,
+            provider="bench",
+        )
+        for minute in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--symbols", type=int, default=20)
+    parser.add_argument("--bars", type=int, default=390, help="Minute bars per symbol")
+    parser.add_argument("--speeds", type=float, nargs="+", default=[0.0, 600.0, 6000.0])
+    parser.add_argument("--work-us", type=float, default=0.0, help="Consumer work per bar (us)")
+    args = parser.parse_args()
+
+    symbols = [f"SYM{i:04d}" for i in range(args.symbols)]
+    work_seconds = args.work_us / 1_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ParquetDataStore(tmp)
+        for symbol in symbols:
+            store.save_prices(_minute_bars(symbol, args.bars))
+
+        print(f"{args.symbols} symbols x {args.bars} minute bars, {args.work_us:.0f}us work/bar")
+        print(
+            f"{'speed':<10}{'bars':>8}{'seconds':>10}{'bars/s':>12}{'mean lag':>12}{'max lag':>12}"
+        )
+        for speed in args.speeds:
+            replay = ReplayMarketDataSource(store, speed=speed or None)
+            for _bar in replay.stream_live(symbols):
+                if work_seconds:
+                    deadline = time.perf_counter() + work_seconds
+                    while time.perf_counter() < deadline:
+                        pass
+            stats = replay.stats
+            label = f"{speed:g}x" if speed else "max"
+            print(
+                f"{label:<10}{stats.bars:>8}{stats.elapsed_seconds:>10.3f}"
+                f"{stats.throughput:>12.0f}{stats.mean_lag_seconds * 1000:>10.2f}ms"
+                f"{stats.max_lag_seconds * 1000:>10.2f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Measure vectorized resampling against pandas and incremental updates against rebuilds.
+
+Usage: ``python -m benchmarks.bench_resampling --symbols 500 --bars 2520 --store-symbols 20``
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+
+from trading_app.data.resampling import BarResampler, resample_frame
+from trading_app.data.sources.synthetic import SyntheticMarketDataSource
+from trading_app.data.storage.parquet_store import ParquetDataStore
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--symbols", type=int, default=500)
+    parser.add_argument("--bars", type=int, default=2520, help="Daily bars per symbol")
+    parser.add_argument("--store-symbols", type=int, default=20, help="Symbols in the store run")
+    parser.add_argument("--store-bars", type=int, default=200_000, help="Minute bars per symbol")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    source = SyntheticMarketDataSource(bars=args.bars)
+    frame = source.fetch_history_frame(source.universe(args.symbols))
+    print(f"{len(frame):,} daily rows ({args.symbols} symbols x {args.bars} bars)")
+    print(f"{'frequency':<12}{'vectorized s':>14}{'pandas s':>10}{'speedup':>9}")
+    for frequency in ("W-FRI", "ME"):
+        ours = _best_seconds(lambda: resample_frame(frame, frequency), args.repeats)
+        reference = _best_seconds(lambda: _pandas_resample(frame, frequency), 1)
+        print(f"{frequency:<12}{ours:>14.3f}{reference:>10.3f}{reference / ours:>8.1f}x")
+
+    # Minute bars into daily and weekly bins: update cost should not grow with history.
+    minutes = SyntheticMarketDataSource(bars=args.store_bars, interval=timedelta(minutes=1))
+    symbols = minutes.universe(args.store_symbols)
+    stamps = minutes.fetch_history_frame(symbols[:1])["timestamp"]
+    last_hour = stamps.iloc[-60].to_pydatetime()
+    with tempfile.TemporaryDirectory() as root:
+        store = ParquetDataStore(str(Path(root) / "store"))
+        minutes.write_to_store(store, symbols, end=last_hour)
+        resampler = BarResampler(store, Path(root) / "aggregates", frequencies=["1D", "W"])
+        started = time.perf_counter()
+        resampler.build(symbols)
+        full = time.perf_counter() - started
+
+        minutes.write_to_store(store, symbols, start=last_hour)
+        started = time.perf_counter()
+        rewritten = resampler.update(symbols)
+        incremental = time.perf_counter() - started
+    print(
+        f"store: {args.store_symbols} symbols x {args.store_bars:,} minute bars "
+        "-> 1D + W aggregates"
+    )
+    print(f"full build          {full:>8.3f}s")
+    print(f"append one hour     {incremental:>8.3f}s ({rewritten} bins rewritten)")
+
+
+def _pandas_resample(frame: pd.DataFrame, frequency: str) -> pd.DataFrame:
+    return (
+        frame.set_index("timestamp")
+        .groupby("symbol")
+        .resample(frequency, closed="right", label="right")
+        .agg({"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"})
+    )
+
+
+def _best_seconds(run: Callable[[], object], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Measure ``PreTradeRiskModel`` checks on large rebalance batches.
+
+Compares the vectorized batch check with a per-order Python loop applying the
+same limits one order at a time.
+
+Usage: ``python -m benchmarks.bench_risk --orders 5000 --symbols 5000 --repeat 20``
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Callable
+
+from trading_app.execution.orders import Order, OrderSide
+from trading_app.portfolio.models import PortfolioState, Position
+from trading_app.portfolio.risk import PreTradeRiskModel, RiskLimits
+
+SECTORS = 11
+LIMITS = RiskLimits(
+    max_order_notional=50_000.0,
+    max_position_weight=0.02,
+    max_sector_weight=0.25,
+    max_gross_exposure=1.0,
+    max_net_exposure=1.0,
+    lot_size=1.0,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=5000)
+    parser.add_argument("--symbols", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    symbols = [f"S{index:05d}" for index in range(args.symbols)]
+    prices = {symbol: rng.uniform(5.0, 500.0) for symbol in symbols}
+    sectors = {symbol: f"sector{rng.randrange(SECTORS)}" for symbol in symbols}
+    positions = {
+        symbol: Position(symbol, float(rng.randint(1, 200)), prices[symbol])
+        for symbol in rng.sample(symbols, len(symbols) // 2)
+    }
+    state = PortfolioState(cash=2_000_000.0, positions=positions)
+    state.equity = state.cash + sum(p.quantity * prices[s] for s, p in positions.items())
+    orders = [
+        (
+            Order(symbol, float(rng.randint(1, 500)), OrderSide.BUY)
+            if symbol not in positions or rng.random() < 0.6
+            else Order(symbol, positions[symbol].quantity / 2, OrderSide.SELL)
+        )
+        for symbol in rng.choices(symbols, k=args.orders)
+    ]
+    model = PreTradeRiskModel(LIMITS, sectors=sectors, prices=prices)
+
+    vectorized = _best_seconds(lambda: model.check(orders, state), args.repeat)
+    looped = _best_seconds(lambda: _per_order(orders, state, prices, sectors), args.repeat)
+    check = model.check(orders, state)
+    print(f"{args.orders:,} orders over {args.symbols:,} symbols, {len(positions):,} positions")
+    print(f"binding: {check.binding}, approved {len(check.orders):,}")
+    print(f"{'method':<12}{'ms/batch':>10}{'us/order':>10}")
+    for label, seconds in (("vectorized", vectorized), ("per-order", looped)):
+        print(f"{label:<12}{seconds * 1e3:>10.2f}{seconds * 1e6 / args.orders:>10.2f}")
+    print(f"speedup {looped / vectorized:.1f}x")
+
+
+def _per_order(
+    orders: list[Order],
+    state: PortfolioState,
+    prices: dict[str, float],
+    sectors: dict[str, str],
+) -> list[Order]:
+    """Greedy reference: each order takes whatever room the earlier ones left."""
+    equity = state.equity or 0.0
+    exposure = {s: p.quantity * prices[s] for s, p in state.positions.items()}
+    sector_exposure: dict[str, float] = {}
+    for symbol, value in exposure.items():
+        sector_exposure[sectors[symbol]] = sector_exposure.get(sectors[symbol], 0.0) + value
+    gross = sum(exposure.values())
+    cash = state.cash
+    approved = []
+    for order in sorted(orders, key=lambda order: order.side is OrderSide.BUY):
+        price = prices[order.symbol]
+        quantity = min(order.quantity, LIMITS.max_order_notional / price)
+        sector = sectors[order.symbol]
+        if order.side is OrderSide.SELL:
+            value = min(quantity * price, exposure.get(order.symbol, 0.0))
+            exposure[order.symbol] = exposure.get(order.symbol, 0.0) - value
+            sector_exposure[sector] -= value
+            gross -= value
+            cash += value
+        else:
+            room = min(
+                LIMITS.max_position_weight * equity - exposure.get(order.symbol, 0.0),
+                LIMITS.max_sector_weight * equity - sector_exposure.get(sector, 0.0),
+                LIMITS.max_gross_exposure * equity - gross,
+                cash,
+            )
+            value = max(0.0, min(quantity * price, room))
+            quantity = float(int(value / price))
+            value = quantity * price
+            exposure[order.symbol] = exposure.get(order.symbol, 0.0) + value
+            sector_exposure[sector] = sector_exposure.get(sector, 0.0) + value
+            gross += value
+            cash -= value
+        if quantity > 0:
+            approved.append(Order(order.symbol, quantity, order.side))
+    return approved
+
+
+def _best_seconds(run: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+if __name__ == "__main__":
+    main()
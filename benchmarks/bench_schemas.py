@@ -0,0 +1,66 @@
+"""Measure memory per bar and attribute access for ``PriceBar`` vs ``CompactPriceBar``.
+
+Usage: ``python -m benchmarks.bench_schemas --bars 1000000 --symbols 500 --target 50000000``
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import operator
+import time
+import tracemalloc
+from typing import Callable, Sequence
+
+from trading_app.data.frames import frame_to_bars, frame_to_compact_bars
+from trading_app.data.sources.synthetic import SyntheticMarketDataSource
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bars", type=int, default=1_000_000, help="Bars held in memory")
+    parser.add_argument("--symbols", type=int, default=500)
+    parser.add_argument("--target", type=int, default=50_000_000, help="Extrapolate to N bars")
+    args = parser.parse_args()
+
+    per_symbol = max(1, args.bars // args.symbols)
+    source = SyntheticMarketDataSource(bars=per_symbol)
+    frame = source.fetch_history_frame(source.universe(args.symbols))
+    print(f"{len(frame):,} bars ({args.symbols} symbols x {per_symbol} bars)")
+    print(
+        f"{'schema':<16}{'build s':>9}{'bytes/bar':>11}{'GiB @ target':>14}"
+        f"{'close ns':>10}{'symbol ns':>11}{'time ns':>9}"
+    )
+    for label, build, stamp in (
+        ("PriceBar", frame_to_bars, "timestamp"),
+        ("CompactPriceBar", frame_to_compact_bars, "ts_ns"),
+    ):
+        gc.collect()
+        tracemalloc.start()
+        started = time.perf_counter()
+        bars = build(frame)
+        seconds = time.perf_counter() - started
+        held, _peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        per_bar = held / len(bars)
+        close = _access_ns(bars, operator.attrgetter("close"))
+        symbol = _access_ns(bars, operator.attrgetter("symbol"))
+        when = _access_ns(bars, operator.attrgetter(stamp))
+        print(
+            f"{label:<16}{seconds:>9.2f}{per_bar:>11.0f}{per_bar * args.target / 2**30:>14.1f}"
+            f"{close:>10.1f}{symbol:>11.1f}{when:>9.1f}"
+        )
+        del bars
+
+
+def _access_ns(bars: Sequence[object], read: Callable[[object], object]) -> float:
+    """Nanoseconds per attribute read over the first million bars."""
+    sample = bars[:1_000_000]
+    started = time.perf_counter()
+    for bar in sample:
+        read(bar)
+    return (time.perf_counter() - started) / len(sample) * 1e9
+
+
+if __name__ == "__main__":
+    main()
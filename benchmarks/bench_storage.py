@@ -0,0 +1,96 @@
+"""Compare ParquetDataStore and SQLiteDataStore on common access patterns.
+
+Usage: ``python -m benchmarks.bench_storage --symbols 50 --bars 2520 --appends 20``
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable
+
+from trading_app.data.sources.synthetic import SyntheticMarketDataSource
+from trading_app.data.storage.base import DataStore
+from trading_app.data.storage.parquet_store import ParquetDataStore
+from trading_app.data.storage.sqlite_store import SQLiteDataStore
+
+_START = datetime(2000, 1, 3, tzinfo=timezone.utc)
+
+
+def _timed(fn: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def run_benchmarks(
+    store: DataStore, symbols: list[str], bars_per_symbol: int, appends: int
+) -> dict[str, float]:
+    """Return wall-clock seconds for each scenario against ``store``."""
+    source = SyntheticMarketDataSource(bars=bars_per_symbol + appends, start=_START)
+    history = list(source.fetch_history(symbols, end=_START + timedelta(days=bars_per_symbol)))
+    days = [
+        list(
+            source.fetch_history(
+                symbols,
+                start=_START + timedelta(days=day),
+                end=_START + timedelta(days=day + 1),
+            )
+        )
+        for day in range(bars_per_symbol, bars_per_symbol + appends)
+    ]
+    results = {"bulk_load": _timed(lambda: store.save_prices(history))}
+
+    def daily_append() -> None:
+        for bars in days:
+            store.save_prices(bars)
+
+    results["daily_append"] = _timed(daily_append)
+
+    latest: Callable[[str], object] = getattr(store, "latest_bar", None) or (
+        lambda symbol: store.load_prices(symbol, limit=1)
+    )
+    results["latest_bar"] = _timed(lambda: [latest(symbol) for symbol in symbols])
+
+    window_start = _START + timedelta(days=bars_per_symbol // 2)
+    window_end = window_start + timedelta(days=252)
+    results["range_scan_1y"] = _timed(
+        lambda: [
+            store.load_prices(symbol, start=window_start, end=window_end) for symbol in symbols
+        ]
+    )
+    results["full_scan"] = _timed(lambda: [store.load_prices(symbol) for symbol in symbols])
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--symbols", type=int, default=50)
+    parser.add_argument("--bars", type=int, default=2520, help="Daily bars per symbol")
+    parser.add_argument("--appends", type=int, default=20, help="Daily append rounds")
+    args = parser.parse_args()
+
+    symbols = SyntheticMarketDataSource.universe(args.symbols)
+    with tempfile.TemporaryDirectory() as tmp:
+        with SQLiteDataStore(str(Path(tmp) / "store.db")) as sqlite_store:
+            stores: dict[str, DataStore] = {
+                "parquet": ParquetDataStore(str(Path(tmp) / "parquet")),
+                "sqlite": sqlite_store,
+            }
+            rows = {
+                name: run_benchmarks(store, symbols, args.bars, args.appends)
+                for name, store in stores.items()
+            }
+
+    scenarios = list(next(iter(rows.values())))
+    print(f"{args.symbols} symbols x {args.bars} bars, {args.appends} daily appends (seconds)")
+    print(f"{'scenario':<16}" + "".join(f"{name:>12}" for name in rows))
+    for scenario in scenarios:
+        print(f"{scenario:<16}" + "".join(f"{rows[name][scenario]:>12.4f}" for name in rows))
+
+
+if __name__ == "__main__":
+    main()
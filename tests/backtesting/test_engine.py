@@ -5,11 +5,13 @@ from datetime import datetime, timezone
 import pytest
 
 from trading_app.backtesting.engine import BacktestEngine
-from trading_app.data.schemas import PriceBar
+from trading_app.backtesting.metrics import summarize
+from trading_app.data.schemas import CompactPriceBar, PriceBar
 from trading_app.execution.orders import Order, OrderSide, OrderType
 from trading_app.portfolio.models import PortfolioState
 from trading_app.strategies.buy_and_hold import BuyAndHoldStrategy
 from trading_app.strategies.sma_crossover import SmaCrossoverStrategy
+from trading_app.utils.time import to_datetime
 
 pytestmark = pytest.mark.unit
 
@@ -89,6 +91,38 @@ class _BuyThenSellStrategy:
         return None
 
 
+class _LimitThenStopStrategy:
+    """Bids below the market, then protects the position with a stop once filled."""
+
+    name = "limit_then_stop"
+
+    def on_start(self, state: PortfolioState) -> list[Order]:
+        return [Order("AAPL", 10.0, OrderSide.BUY, type=OrderType.LIMIT, limit_price=95.0)]
+
+    def on_bar(self, bar: PriceBar, state: PortfolioState) -> list[Order]:
+        if "AAPL" in state.positions and bar.close == 94.0:
+            return [Order("AAPL", 10.0, OrderSide.SELL, type=OrderType.STOP, stop_price=93.0)]
+        return []
+
+    def on_finish(self, state: PortfolioState) -> None:
+        return None
+
+
+def test_limit_and_stop_orders_rest_until_the_price_reaches_them() -> None:
+    bars = [
+        _bar("AAPL", close, day) for day, close in enumerate([100.0, 97.0, 94.0, 99.0, 92.0], 1)
+    ]
+
+    result = BacktestEngine(strategy=_LimitThenStopStrategy()).run(bars, starting_cash=1_000.0)
+
+    assert [
+        (trade.timestamp.day, trade.side, trade.price, trade.cash_after, trade.position_after)
+        for trade in result.trade_log
+    ] == [(3, OrderSide.BUY, 94.0, 60.0, 10.0), (5, OrderSide.SELL, 92.0, 980.0, 0.0)]
+    assert result.final_state.positions == {}
+    assert result.final_state.equity == pytest.approx(980.0)
+
+
 def test_engine_executes_market_buy_and_updates_equity() -> None:
     bars = [_bar("AAPL", 100.0, 1), _bar("AAPL", 110.0, 2)]
     engine = BacktestEngine(strategy=_OneShotBuyStrategy())
@@ -156,3 +190,26 @@ def test_sma_crossover_strategy_integrates_with_engine() -> None:
     assert state.cash == pytest.approx(970.0)
     assert state.equity == pytest.approx(970.0)
     assert len(result.fills) == 2
+
+
+def test_ns_mode_keeps_integer_timestamps_and_matches_datetime_mode() -> None:
+    bars = [
+        _bar("AAPL", close, day) for day, close in enumerate([10.0, 9.0, 8.0, 12.0, 7.0, 6.0], 1)
+    ]
+    compact = [CompactPriceBar.from_bar(bar) for bar in bars]
+
+    def run(engine_bars, ns: bool):
+        strategy = SmaCrossoverStrategy(symbol="AAPL", short_window=2, long_window=3, quantity=5.0)
+        return BacktestEngine(strategy=strategy, ns=ns).run(engine_bars, starting_cash=1_000.0)
+
+    regular = run(bars, ns=False)
+    fast = run(compact, ns=True)
+
+    assert [point.timestamp for point in fast.equity_curve] == [bar.ts_ns for bar in compact]
+    assert [to_datetime(trade.timestamp) for trade in fast.trade_log] == [
+        trade.timestamp for trade in regular.trade_log
+    ]
+    assert [point.equity for point in fast.equity_curve] == [
+        point.equity for point in regular.equity_curve
+    ]
+    assert summarize(fast) == pytest.approx(summarize(regular))
@@ -1,37 +1,41 @@
 from __future__ import annotations
 
+import json
 import os
 from datetime import datetime, timezone
 
 import pytest
 
 from trading_app.cli.main import main
+from trading_app.data.frames import bars_to_frame
 from trading_app.data.schemas import PriceBar
 from trading_app.data.storage.parquet_store import ParquetDataStore
 
 
 @pytest.mark.unit
 def test_ingest_history_uses_source_and_writes_parquet(tmp_path, monkeypatch) -> None:
-    def fake_fetch_history(self, symbols, start=None, end=None):
+    def fake_fetch_history_frame(self, symbols, start=None, end=None):
         assert symbols == ["AAPL"]
         assert start == datetime(2024, 1, 1)
         assert end == datetime(2024, 1, 3)
-        return [
-            PriceBar(
-                symbol="AAPL",
-                timestamp=datetime(2024, 1, 2, tzinfo=timezone.utc),
-                open=100.0,
-                high=101.0,
-                low=99.0,
-                close=100.5,
-                volume=1000.0,
-                provider="yfinance",
-            )
-        ]
+        return bars_to_frame(
+            [
+                PriceBar(
+                    symbol="AAPL",
+                    timestamp=datetime(2024, 1, 2, tzinfo=timezone.utc),
+                    open=100.0,
+                    high=101.0,
+                    low=99.0,
+                    close=100.5,
+                    volume=1000.0,
+                    provider="yfinance",
+                )
+            ]
+        )
 
     monkeypatch.setattr(
-        "trading_app.cli.main.YFinanceSource.fetch_history",
-        fake_fetch_history,
+        "trading_app.cli.main.YFinanceSource.fetch_history_frame",
+        fake_fetch_history_frame,
     )
 
     exit_code = main(
@@ -53,6 +57,106 @@ def test_ingest_history_uses_source_and_writes_parquet(tmp_path, monkeypatch) ->
     assert loaded[0].close == 100.5
 
 
+@pytest.mark.unit
+def test_ingest_history_incremental_requests_only_new_bars(tmp_path, monkeypatch) -> None:
+    store = ParquetDataStore(str(tmp_path))
+    last_stored = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    store.save_prices(
+        [
+            PriceBar(
+                symbol="AAPL",
+                timestamp=last_stored,
+                open=100.0,
+                high=101.0,
+                low=99.0,
+                close=100.5,
+                volume=1000.0,
+                provider="yfinance",
+            )
+        ]
+    )
+    requests = []
+
+    def fake_fetch_history_frame(self, symbols, start=None, end=None):
+        requests.append((list(symbols), start, end))
+        return bars_to_frame([])
+
+    monkeypatch.setattr(
+        "trading_app.cli.main.YFinanceSource.fetch_history_frame",
+        fake_fetch_history_frame,
+    )
+
+    exit_code = main(["ingest-history", "AAPL", "--store-path", str(tmp_path), "--incremental"])
+
+    assert exit_code == 0
+    assert requests == [(["AAPL"], last_stored, None)]
+
+
+@pytest.mark.unit
+def test_ingest_history_reports_failed_chunks_and_resumes(tmp_path, monkeypatch, capsys) -> None:
+    calls = []
+    failures = {"MSFT": 1}
+
+    def flaky_fetch_history_frame(self, symbols, start=None, end=None):
+        calls.append(list(symbols))
+        if failures.get(symbols[0], 0) > 0:
+            failures[symbols[0]] -= 1
+            raise ConnectionError("rate limited")
+        return bars_to_frame([])
+
+    monkeypatch.setattr(
+        "trading_app.cli.main.YFinanceSource.fetch_history_frame",
+        flaky_fetch_history_frame,
+    )
+    args = ["ingest-history", "AAPL", "MSFT", "--store-path", str(tmp_path)]
+    options = ["--chunk-size", "1", "--workers", "1", "--max-retries", "0"]
+
+    assert main([*args, *options]) == 1
+    assert "Failed chunk" in capsys.readouterr().out
+
+    calls.clear()
+    assert main([*args, *options, "--resume"]) == 0
+    assert calls == [["MSFT"]]
+
+
+@pytest.mark.unit
+def test_ingest_history_offline_uses_only_the_response_cache(tmp_path, monkeypatch) -> None:
+    calls = []
+
+    def fake_fetch_history_frame(self, symbols, start=None, end=None):
+        calls.append(list(symbols))
+        return bars_to_frame(
+            [
+                PriceBar(
+                    symbol="AAPL",
+                    timestamp=datetime(2024, 1, 2, tzinfo=timezone.utc),
+                    open=100.0,
+                    high=101.0,
+                    low=99.0,
+                    close=100.5,
+                    volume=1000.0,
+                    provider="yfinance",
+                )
+            ]
+        )
+
+    monkeypatch.setattr(
+        "trading_app.cli.main.YFinanceSource.fetch_history_frame",
+        fake_fetch_history_frame,
+    )
+    cache_dir = str(tmp_path / "cache")
+    window = ["--start", "2024-01-01", "--end", "2024-01-03"]
+
+    online = ["ingest-history", "AAPL", "--store-path", str(tmp_path / "a"), *window]
+    assert main([*online, "--cache-dir", cache_dir]) == 0
+    offline = ["ingest-history", "AAPL", "--store-path", str(tmp_path / "b"), *window]
+    assert main([*offline, "--cache-dir", cache_dir, "--offline"]) == 0
+
+    assert calls == [["AAPL"]]
+    assert len(ParquetDataStore(str(tmp_path / "b")).load_prices("AAPL")) == 1
+    assert main([*offline, "--cache-dir", cache_dir, "--offline", "--end", "2024-02-01"]) == 1
+
+
 @pytest.mark.integration
 @pytest.mark.network
 def test_ingest_history_real_network_fetch(tmp_path) -> None:
@@ -75,3 +179,42 @@ def test_ingest_history_real_network_fetch(tmp_path) -> None:
     loaded = ParquetDataStore(str(tmp_path)).load_prices("MSFT")
     assert exit_code == 0
     assert loaded
+
+
+@pytest.mark.unit
+def test_ingest_history_writes_run_report(tmp_path, monkeypatch) -> None:
+    def fake_fetch_history_frame(self, symbols, start=None, end=None):
+        return bars_to_frame(
+            [
+                PriceBar(
+                    symbol="AAPL",
+                    timestamp=datetime(2024, 1, 2, tzinfo=timezone.utc),
+                    open=100.0,
+                    high=101.0,
+                    low=99.0,
+                    close=100.5,
+                    volume=1000.0,
+                    provider="yfinance",
+                )
+            ]
+        )
+
+    monkeypatch.setattr(
+        "trading_app.cli.main.YFinanceSource.fetch_history_frame",
+        fake_fetch_history_frame,
+    )
+    report_path = tmp_path / "run.json"
+
+    exit_code = main(
+        ["ingest-history", "AAPL", "--store-path", str(tmp_path), "--report", str(report_path)]
+    )
+
+    payload = json.loads(report_path.read_text())
+    assert exit_code == 0
+    assert {row["stage"] for row in payload["stages"]} == {
+        "fetch",
+        "transform",
+        "validate",
+        "dedup",
+        "write",
+    }
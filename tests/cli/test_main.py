@@ -58,3 +58,52 @@ def test_show_latest_prices_prints_latest_bar(tmp_path, capsys) -> None:
     assert exit_code == 0
     assert "AAPL:" in out
     assert "C=100.5000" in out
+
+
+def test_compact_store_reports_savings(tmp_path, capsys) -> None:
+    store = ParquetDataStore(str(tmp_path))
+    store.save_prices(
+        [
+            PriceBar(
+                symbol="AAPL",
+                timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                open=100.0,
+                high=101.0,
+                low=99.0,
+                close=100.5,
+                volume=1000.0,
+                provider="test",
+            )
+        ]
+    )
+
+    exit_code = main(["compact-store", "--store-path", str(tmp_path), "--workers", "1"])
+
+    out = capsys.readouterr().out
+    assert exit_code == 0
+    assert "Compacted 1 file(s)" in out
+    assert "bytes_saved=" in out
+    assert "read_speedup=" in out
+    assert store.load_prices("AAPL")[0].close == 100.5
+
+
+def test_generate_synthetic_writes_universe(tmp_path, capsys) -> None:
+    args = ["generate-synthetic", "--store-path", str(tmp_path), "--symbols", "3", "--bars", "10"]
+
+    exit_code = main(args)
+
+    store = ParquetDataStore(str(tmp_path))
+    assert exit_code == 0
+    assert store.list_symbols() == ["SYN00000", "SYN00001", "SYN00002"]
+    assert len(store.load_prices("SYN00002")) == 10
+    assert "Wrote 30 synthetic bars" in capsys.readouterr().out
+
+
+def test_resample_writes_aggregates_for_stored_symbols(tmp_path, capsys) -> None:
+    main(["generate-synthetic", "--store-path", str(tmp_path), "--symbols", "2", "--bars", "14"])
+
+    exit_code = main(["resample", "--store-path", str(tmp_path), "--frequency", "W"])
+
+    assert exit_code == 0
+    assert "Wrote 6 W-FRI bin(s) for 2 symbol(s)" in capsys.readouterr().out
+    assert (tmp_path / "aggregates" / "W-FRI" / "SYN00001.parquet").exists()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_app.data.adjustments import AdjustmentFactors, actions_to_frame, previous_closes
+from trading_app.data.pipeline import DataPipeline
+from trading_app.data.schemas import CorporateAction, PriceBar
+from trading_app.data.storage.parquet_store import ParquetDataStore
+from trading_app.data.storage.sqlite_store import SQLiteDataStore
+
+pytestmark = pytest.mark.unit
+
+
+def _day(day: int) -> datetime:
+    return datetime(2024, 1, day, tzinfo=timezone.utc)
+
+
+def _bar(day: int, close: float) -> PriceBar:
+    return PriceBar(
+        symbol="AAPL",
+        timestamp=_day(day),
+        open=close,
+        high=close,
+        low=close,
+        close=close,
+        volume=100.0,
+        provider="test",
+    )
+
+
+BARS = [_bar(1, 200.0), _bar(2, 100.0), _bar(3, 50.0), _bar(4, 48.0)]
+SPLIT = CorporateAction(symbol="AAPL", ex_date=_day(3), kind="split", value=2.0)
+DIVIDEND = CorporateAction(symbol="AAPL", ex_date=_day(2), kind="dividend", value=10.0)
+
+
+@pytest.fixture(params=["parquet", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "parquet":
+        yield ParquetDataStore(str(tmp_path))
+        return
+    with SQLiteDataStore(str(tmp_path / "store.db")) as sqlite_store:
+        yield sqlite_store
+
+
+def test_factors_compound_splits_and_dividends() -> None:
+    actions = actions_to_frame([DIVIDEND, SPLIT])
+    timestamps = pd.Series(pd.to_datetime([bar.timestamp for bar in BARS], utc=True))
+    closes = np.array([bar.close for bar in BARS])
+
+    factors = AdjustmentFactors.from_actions(
+        actions, previous_closes(actions["ex_date"], timestamps, closes)
+    )
+    price, volume = factors.factors_at(timestamps)
+
+    # Dividend of 10 on a 200 close: 0.95; the later 2:1 split halves earlier prices.
+    np.testing.assert_allclose(price, [0.475, 0.5, 1.0, 1.0])
+    np.testing.assert_allclose(volume, [2.0, 2.0, 1.0, 1.0])
+
+
+def test_invalid_actions_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        actions_to_frame([CorporateAction("AAPL", _day(1), "merger", 1.0)])  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        actions_to_frame([CorporateAction("AAPL", _day(1), "split", 0.0)])
+
+
+def test_adjusted_reads_leave_raw_prices_untouched(store) -> None:
+    store.save_prices(BARS)
+    store.save_actions([SPLIT, DIVIDEND])
+
+    adjusted = store.load_prices("AAPL", adjusted=True)
+
+    assert [bar.close for bar in adjusted] == pytest.approx([95.0, 50.0, 50.0, 48.0])
+    assert [bar.volume for bar in adjusted] == [200.0, 200.0, 100.0, 100.0]
+    assert store.load_prices("AAPL") == BARS
+    assert store.load_actions("AAPL") == [DIVIDEND, SPLIT]
+
+
+def test_new_events_invalidate_cached_factors(store) -> None:
+    store.save_prices(BARS)
+    store.save_actions([SPLIT])
+    assert store.load_prices("AAPL", adjusted=True)[0].close == 100.0
+    assert "AAPL" in store.adjustments
+
+    store.save_actions([DIVIDEND, SPLIT])
+
+    assert "AAPL" not in store.adjustments
+    assert store.load_prices("AAPL", adjusted=True)[0].close == pytest.approx(95.0)
+    assert len(store.load_actions("AAPL")) == 2
+
+
+def test_symbols_without_events_are_returned_unadjusted(store) -> None:
+    store.save_prices(BARS)
+
+    assert store.load_prices("AAPL", adjusted=True) == BARS
+
+
+class _ActionSource:
+    name = "actions"
+
+    def fetch_actions(self, symbols, start=None, end=None) -> list[CorporateAction]:
+        return [SPLIT]
+
+
+def test_pipeline_ingests_actions_from_capable_sources(tmp_path) -> None:
+    store = ParquetDataStore(str(tmp_path))
+    pipeline = DataPipeline(store=store, market_sources=[_ActionSource()])  # type: ignore[list-item]
+
+    assert pipeline.ingest_actions(["AAPL"]) == 1
+    assert store.load_actions("AAPL") == [SPLIT]
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Iterable, Sequence
+
+import pytest
+
+from trading_app.data.schemas import PriceBar, Quote
+from trading_app.data.sources.aio import as_completed_in_threads
+from trading_app.data.sources.base import MarketDataSource
+from trading_app.data.sources.caching import CachingMarketDataSource
+from trading_app.data.sources.replay import ReplayMarketDataSource
+from trading_app.data.sources.synthetic import SyntheticMarketDataSource
+from trading_app.data.sources.yfinance_source import YFinanceSource
+from trading_app.data.storage.parquet_store import ParquetDataStore
+
+pytestmark = pytest.mark.unit
+
+
+class LatencySource(MarketDataSource):
+    """Local stand-in that blocks for a per-symbol latency before returning a quote."""
+
+    name = "latency"
+
+    def __init__(self, latency: dict[str, float], default: float = 0.05) -> None:
+        self.latency = latency
+        self.default = default
+
+    def fetch_history(
+        self, symbols: Sequence[str], start: datetime | None = None, end: datetime | None = None
+    ) -> Iterable[PriceBar]:
+        return []
+
+    def stream_live(self, symbols: Sequence[str]) -> Iterable[PriceBar]:
+        return []
+
+    def fetch_quotes(self, symbols: Sequence[str]) -> Iterable[Quote]:
+        for symbol in symbols:
+            time.sleep(self.latency.get(symbol, self.default))
+            yield Quote(symbol, datetime.now(timezone.utc), 1.0, 1.1, provider=self.name)
+
+
+async def _collect(stream) -> list[Quote]:
+    return [quote async for quote in stream]
+
+
+def test_afetch_quotes_overlaps_latency_within_concurrency_bound() -> None:
+    source = LatencySource({}, default=0.05)
+    symbols = [f"S{index:02d}" for index in range(20)]
+
+    started = time.perf_counter()
+    quotes = asyncio.run(_collect(source.afetch_quotes(symbols, concurrency=10)))
+    elapsed = time.perf_counter() - started
+
+    assert sorted(quote.symbol for quote in quotes) == symbols
+    # Serially this is 20 * 50ms = 1s; ten at a time needs about two rounds.
+    assert elapsed < 0.5
+
+
+def test_afetch_quotes_yields_in_completion_order_and_skips_timeouts() -> None:
+    source = LatencySource({"SLOW": 0.15, "MID": 0.05, "FAST": 0.0, "HUNG": 1.0})
+
+    quotes = asyncio.run(
+        _collect(source.afetch_quotes(["SLOW", "MID", "FAST", "HUNG"], timeout=0.5))
+    )
+
+    assert [quote.symbol for quote in quotes] == ["FAST", "MID", "SLOW"]
+
+
+def test_timeout_starts_when_a_worker_picks_the_call_up() -> None:
+    def fetch_one(symbol: str) -> str:
+        time.sleep(0.5 if symbol == "HUNG" else 0.05)
+        return symbol
+
+    # The only worker is stuck on HUNG for 0.5s; QUEUED waits for it, then runs in 0.05s.
+    results = asyncio.run(
+        _collect(as_completed_in_threads(fetch_one, ["HUNG", "QUEUED"], concurrency=1, timeout=0.2))
+    )
+
+    assert results == ["QUEUED"]
+
+
+def test_replay_and_synthetic_sources_quote_asynchronously(tmp_path) -> None:
+    synthetic = SyntheticMarketDataSource(bars=5)
+    store = ParquetDataStore(str(tmp_path))
+    synthetic.write_to_store(store, ["AAA", "BBB"])
+    replay = ReplayMarketDataSource(store)
+    list(replay.stream_live(["AAA", "BBB"]))
+
+    for source in (synthetic, replay):
+        quotes = asyncio.run(_collect(source.afetch_quotes(["AAA", "BBB"])))
+        assert quotes == list(source.fetch_quotes(["AAA", "BBB"]))
+
+
+def test_yfinance_afetch_quotes_uses_the_single_symbol_path(monkeypatch) -> None:
+    class FakeTicker:
+        def __init__(self, symbol: str) -> None:
+            self.fast_info = {
+                "bid": None,
+                "ask": None,
+                "last_price": 10.0 if symbol != "X" else None,
+            }
+
+    monkeypatch.setattr("trading_app.data.sources.yfinance_source.yf.Ticker", FakeTicker)
+
+    quotes = asyncio.run(_collect(YFinanceSource().afetch_quotes(["AAPL", "X", "MSFT"])))
+
+    assert sorted(quote.symbol for quote in quotes) == ["AAPL", "MSFT"]
+    assert all(quote.bid == quote.ask == 10.0 for quote in quotes)
+
+
+def test_caching_source_streams_cached_quotes_before_fetching_the_rest(tmp_path) -> None:
+    cached = CachingMarketDataSource(LatencySource({}, default=0.0), str(tmp_path))
+    list(cached.fetch_quotes(["AAPL"]))
+
+    quotes = asyncio.run(_collect(cached.afetch_quotes(["MSFT", "AAPL"])))
+
+    assert [quote.symbol for quote in quotes] == ["AAPL", "MSFT"]
+    assert [quote.symbol for quote in cached.fetch_quotes(["MSFT"])] == ["MSFT"]
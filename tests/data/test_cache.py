@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import os
+from datetime import datetime, timezone
+
+import pandas as pd
+import pytest
+
+from trading_app.data.schemas import PriceBar
+from trading_app.data.storage.cache import FrameCache
+from trading_app.data.storage.parquet_store import ParquetDataStore
+
+pytestmark = pytest.mark.unit
+
+
+def _bar(symbol: str, day: int, close: float) -> PriceBar:
+    return PriceBar(
+        symbol=symbol,
+        timestamp=datetime(2024, 1, day, tzinfo=timezone.utc),
+        open=close,
+        high=close + 1.0,
+        low=close - 1.0,
+        close=close,
+        volume=100.0,
+        provider="test",
+    )
+
+
+def test_repeated_loads_are_served_from_cache(tmp_path) -> None:
+    cache = FrameCache()
+    store = ParquetDataStore(str(tmp_path), cache=cache)
+    store.save_prices([_bar("AAPL", 1, 10.0), _bar("AAPL", 2, 11.0)])
+
+    first = store.load_prices("AAPL")
+    second = store.load_prices("AAPL")
+
+    assert first == second
+    assert cache.stats.misses == 1
+    assert cache.stats.hits == 1
+
+
+def test_save_invalidates_cached_frame(tmp_path) -> None:
+    cache = FrameCache()
+    store = ParquetDataStore(str(tmp_path), cache=cache)
+    store.save_prices([_bar("AAPL", 1, 10.0)])
+    store.load_prices("AAPL")
+
+    store.save_prices([_bar("AAPL", 2, 11.0)])
+    loaded = store.load_prices("AAPL")
+
+    assert [bar.close for bar in loaded] == [10.0, 11.0]
+    assert cache.stats.invalidations >= 1
+
+
+def test_external_rewrite_is_detected_by_file_signature(tmp_path) -> None:
+    cache = FrameCache()
+    store = ParquetDataStore(str(tmp_path), cache=cache)
+    store.save_prices([_bar("AAPL", 1, 10.0)])
+    store.load_prices("AAPL")
+
+    # Another writer replaces the file behind the cache's back.
+    other = ParquetDataStore(str(tmp_path))
+    other.save_prices([_bar("AAPL", 2, 11.0), _bar("AAPL", 3, 12.0)])
+    path = store._prices_path("AAPL")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    loaded = store.load_prices("AAPL")
+
+    assert len(loaded) == 3
+    assert cache.stats.invalidations == 1
+
+
+def test_byte_budget_evicts_least_recently_used(tmp_path) -> None:
+    frame = pd.DataFrame({"value": range(1_000)})
+    nbytes = int(frame.memory_usage(index=True, deep=True).sum())
+    cache = FrameCache(max_bytes=nbytes * 2)
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.parquet"
+        frame.to_parquet(path, index=False)
+        paths.append(path)
+
+    cache.load(paths[0], lambda: frame)
+    cache.load(paths[1], lambda: frame)
+    cache.load(paths[0], lambda: frame)  # touch "a" so "b" is least recent
+    cache.load(paths[2], lambda: frame)
+
+    assert cache.stats.evictions == 1
+    assert cache.current_bytes <= cache.max_bytes
+    cache.load(paths[0], lambda: frame)
+    assert cache.stats.hits == 2
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Sequence
+
+import pytest
+
+from trading_app.data.schemas import PriceBar, Quote
+from trading_app.data.sources.caching import (
+    CacheMissError,
+    CachingMarketDataSource,
+    uncovered_ranges,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _day(day: int) -> datetime:
+    return datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(days=day)
+
+
+class CountingSource:
+    """Fake upstream with one daily bar per symbol that records every request."""
+
+    name = "fake"
+
+    def __init__(self) -> None:
+        self.history_requests: list[tuple[list[str], datetime | None, datetime | None]] = []
+        self.quote_requests: list[list[str]] = []
+        self.revision = 0.0
+        self.unlisted: set[str] = set()
+
+    def fetch_history(
+        self, symbols: Sequence[str], start: datetime | None = None, end: datetime | None = None
+    ) -> Iterable[PriceBar]:
+        self.history_requests.append((list(symbols), start, end))
+        return [
+            PriceBar(symbol, _day(day), 1.0, 2.0, 0.5, 1.0 + day + self.revision, 10.0, self.name)
+            for symbol in symbols
+            if symbol not in self.unlisted
+            for day in range(0, 60)
+            if (start is None or _day(day) >= start) and _day(day) < end
+        ]
+
+    def stream_live(self, symbols: Sequence[str]) -> Iterable[PriceBar]:
+        return []
+
+    def fetch_quotes(self, symbols: Sequence[str]) -> Iterable[Quote]:
+        self.quote_requests.append(list(symbols))
+        return [Quote(symbol, _day(0), 1.0, 1.1, provider=self.name) for symbol in symbols]
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = _day(100)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def test_uncovered_ranges_merges_overlapping_and_adjacent_coverage() -> None:
+    covered = [
+        (_day(5), _day(10)),
+        (_day(10), _day(12)),
+        (_day(11), _day(20)),
+        (_day(25), _day(30)),
+    ]
+
+    assert uncovered_ranges(covered, _day(0), _day(40)) == [
+        (_day(0), _day(5)),
+        (_day(20), _day(25)),
+        (_day(30), _day(40)),
+    ]
+    assert uncovered_ranges(covered, _day(6), _day(19)) == []
+    assert uncovered_ranges([(None, _day(3))], None, _day(5)) == [(_day(3), _day(5))]
+
+
+def test_covered_requests_need_no_upstream_call(tmp_path) -> None:
+    source = CountingSource()
+    cached = CachingMarketDataSource(source, str(tmp_path), clock=Clock())
+
+    first = list(cached.fetch_history(["AAPL", "MSFT"], start=_day(0), end=_day(10)))
+    again = list(cached.fetch_history(["AAPL"], start=_day(2), end=_day(8)))
+
+    assert len(source.history_requests) == 1
+    assert len(first) == 20
+    assert [bar.timestamp for bar in again] == [_day(day) for day in range(2, 8)]
+
+
+def test_partially_covered_request_fetches_only_the_gap(tmp_path) -> None:
+    source = CountingSource()
+    cached = CachingMarketDataSource(source, str(tmp_path), clock=Clock())
+    cached.fetch_history(["AAPL"], start=_day(0), end=_day(10))
+    cached.fetch_history(["AAPL"], start=_day(20), end=_day(30))
+
+    bars = list(cached.fetch_history(["AAPL"], start=_day(5), end=_day(25)))
+
+    assert source.history_requests[-1] == (["AAPL"], _day(10), _day(20))
+    assert len(bars) == 20
+
+
+def test_expired_coverage_is_refetched(tmp_path) -> None:
+    source = CountingSource()
+    clock = Clock()
+    cached = CachingMarketDataSource(
+        source, str(tmp_path), history_ttl=timedelta(hours=1), clock=clock
+    )
+    cached.fetch_history(["AAPL"], start=_day(0), end=_day(5))
+
+    clock.now += timedelta(minutes=30)
+    cached.fetch_history(["AAPL"], start=_day(0), end=_day(5))
+    assert len(source.history_requests) == 1
+
+    clock.now += timedelta(hours=1)
+    cached.fetch_history(["AAPL"], start=_day(0), end=_day(5))
+    assert len(source.history_requests) == 2
+
+
+def test_refetched_bars_replace_revised_ones(tmp_path) -> None:
+    source = CountingSource()
+    clock = Clock()
+    cached = CachingMarketDataSource(
+        source, str(tmp_path), history_ttl=timedelta(hours=1), clock=clock
+    )
+    cached.fetch_history(["AAPL"], start=_day(0), end=_day(5))
+
+    source.revision = 0.25
+    clock.now += timedelta(hours=2)
+    bars = list(cached.fetch_history(["AAPL"], start=_day(0), end=_day(5)))
+
+    assert [bar.close for bar in bars] == [1.25, 2.25, 3.25, 4.25, 5.25]
+
+
+def test_empty_upstream_results_are_not_recorded_as_covered(tmp_path) -> None:
+    source = CountingSource()
+    source.unlisted = {"NEW"}
+    cached = CachingMarketDataSource(source, str(tmp_path), clock=Clock())
+
+    assert list(cached.fetch_history(["NEW", "AAPL"], start=_day(0), end=_day(5)))
+    source.unlisted = set()
+    bars = list(cached.fetch_history(["NEW", "AAPL"], start=_day(0), end=_day(5)))
+
+    assert source.history_requests[-1] == (["NEW"], _day(0), _day(5))
+    assert len(bars) == 10
+
+
+def test_offline_mode_serves_cache_and_rejects_misses(tmp_path) -> None:
+    source = CountingSource()
+    CachingMarketDataSource(source, str(tmp_path), clock=Clock()).fetch_history(
+        ["AAPL"], start=_day(0), end=_day(5)
+    )
+    offline = CachingMarketDataSource(CountingSource(), str(tmp_path), offline=True)
+
+    assert len(list(offline.fetch_history(["AAPL"], start=_day(1), end=_day(4)))) == 3
+    with pytest.raises(CacheMissError):
+        offline.fetch_history(["AAPL"], start=_day(0), end=_day(10))
+    assert offline.source.history_requests == []
+
+
+def test_offline_open_ended_request_serves_everything_cached(tmp_path) -> None:
+    CachingMarketDataSource(CountingSource(), str(tmp_path), clock=Clock()).fetch_history(
+        ["AAPL"], start=_day(0)
+    )
+    offline = CachingMarketDataSource(CountingSource(), str(tmp_path), offline=True)
+
+    assert len(list(offline.fetch_history(["AAPL"], start=_day(0)))) == 60
+    with pytest.raises(CacheMissError):
+        offline.fetch_history(["MSFT"], start=_day(0))
+
+
+def test_quotes_are_cached_for_their_ttl(tmp_path) -> None:
+    source = CountingSource()
+    clock = Clock()
+    cached = CachingMarketDataSource(
+        source, str(tmp_path), quote_ttl=timedelta(seconds=30), clock=clock
+    )
+
+    cached.fetch_quotes(["AAPL"])
+    quotes = list(cached.fetch_quotes(["AAPL", "MSFT"]))
+    clock.now += timedelta(minutes=1)
+    cached.fetch_quotes(["AAPL"])
+
+    assert [quote.symbol for quote in quotes] == ["AAPL", "MSFT"]
+    assert quotes[0] == Quote("AAPL", _day(0), 1.0, 1.1, provider="fake")
+    assert source.quote_requests == [["AAPL"], ["MSFT"], ["AAPL"]]
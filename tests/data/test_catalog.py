@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from trading_app.data.schemas import PriceBar
+from trading_app.data.storage.parquet_store import ParquetDataStore
+
+pytestmark = pytest.mark.unit
+
+
+def _bar(symbol: str, ts: datetime, close: float) -> PriceBar:
+    return PriceBar(
+        symbol=symbol,
+        timestamp=ts,
+        open=close,
+        high=close + 1.0,
+        low=close - 1.0,
+        close=close,
+        volume=100.0,
+        provider="test",
+    )
+
+
+def _day(day: int) -> datetime:
+    return datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(days=day)
+
+
+def test_catalog_tracks_coverage_across_writes(tmp_path) -> None:
+    store = ParquetDataStore(str(tmp_path))
+    store.save_prices([_bar("AAPL", _day(1), 10.0), _bar("AAPL", _day(0), 9.0)])
+    store.save_prices([_bar("AAPL", _day(2), 11.0), _bar("MSFT", _day(0), 50.0)])
+
+    entry = store.coverage("AAPL")
+
+    assert entry is not None
+    assert entry.first_timestamp == _day(0)
+    assert entry.last_timestamp == _day(2)
+    assert entry.row_count == 3
+    assert entry.last_bar == _bar("AAPL", _day(2), 11.0)
+    assert store.list_symbols() == ["AAPL", "MSFT"]
+
+
+def test_latest_bar_is_answered_without_reading_data_files(tmp_path) -> None:
+    store = ParquetDataStore(str(tmp_path))
+    store.save_prices([_bar("AAPL", _day(0), 9.0), _bar("AAPL", _day(1), 10.0)])
+    store._prices_path("AAPL").unlink()
+
+    reopened = ParquetDataStore(str(tmp_path))
+
+    assert reopened.latest_bar("AAPL") == _bar("AAPL", _day(1), 10.0)
+
+
+def test_content_hash_changes_only_when_data_changes(tmp_path) -> None:
+    store = ParquetDataStore(str(tmp_path))
+    store.save_prices([_bar("AAPL", _day(0), 9.0)])
+    first_hash = store.coverage("AAPL").content_hash
+
+    store.save_prices([_bar("AAPL", _day(0), 9.0)])  # duplicate, no new rows
+    assert store.coverage("AAPL").content_hash == first_hash
+
+    store.save_prices([_bar("AAPL", _day(1), 10.0)])
+    assert store.coverage("AAPL").content_hash != first_hash
+
+
+def test_missing_ranges_report_gaps_and_uncovered_edges(tmp_path) -> None:
+    store = ParquetDataStore(str(tmp_path), gap_threshold=timedelta(days=7))
+    store.save_prices([_bar("AAPL", _day(10), 1.0), _bar("AAPL", _day(30), 2.0)])
+
+    windows = store.missing_ranges("AAPL", start=_day(0), end=_day(40))
+
+    assert windows == [(_day(0), _day(10)), (_day(10), _day(30)), (_day(30), _day(40))]
+    assert store.missing_ranges("MSFT", start=_day(0)) == [(_day(0), None)]
+
+
+def test_rebuild_catalog_recovers_from_missing_manifest(tmp_path) -> None:
+    store = ParquetDataStore(str(tmp_path))
+    store.save_prices([_bar("AAPL", _day(0), 9.0), _bar("AAPL", _day(1), 10.0)])
+    expected = store.coverage("AAPL")
+    (tmp_path / "catalog.json").unlink()
+
+    reopened = ParquetDataStore(str(tmp_path))
+    assert reopened.coverage("AAPL") is None
+
+    assert reopened.rebuild_catalog() == 1
+    assert reopened.coverage("AAPL") == expected
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import json
+import threading
+from datetime import datetime, timezone
+from typing import Iterable, Sequence
+
+import pytest
+
+from trading_app.data.ingestion import IngestionScheduler, RetryPolicy, TokenBucket
+from trading_app.data.pipeline import DataPipeline
+from trading_app.data.schemas import PriceBar, Quote
+from trading_app.data.storage.parquet_store import ParquetDataStore
+
+pytestmark = pytest.mark.unit
+
+
+def _bar(symbol: str, day: int) -> PriceBar:
+    return PriceBar(
+        symbol=symbol,
+        timestamp=datetime(2024, 1, day, tzinfo=timezone.utc),
+        open=1.0,
+        high=2.0,
+        low=0.5,
+        close=1.5,
+        volume=10.0,
+        provider="fake",
+    )
+
+
+class FlakyMarketSource:
+    """Fake source that fails the first ``failures[symbol]`` requests touching a symbol."""
+
+    name = "fake"
+
+    def __init__(self, failures: dict[str, int] | None = None) -> None:
+        self.failures = dict(failures or {})
+        self.requests: list[list[str]] = []
+        self._lock = threading.Lock()
+
+    def fetch_history(
+        self, symbols: Sequence[str], start: datetime | None = None, end: datetime | None = None
+    ) -> Iterable[PriceBar]:
+        with self._lock:
+            self.requests.append(list(symbols))
+            for symbol in symbols:
+                if self.failures.get(symbol, 0) > 0:
+                    self.failures[symbol] -= 1
+                    raise ConnectionError(f"upstream error for {symbol}")
+        return [_bar(symbol, day) for symbol in symbols for day in (2, 3)]
+
+    def stream_live(self, symbols: Sequence[str]) -> Iterable[PriceBar]:
+        return []
+
+    def fetch_quotes(self, symbols: Sequence[str]) -> Iterable[Quote]:
+        return []
+
+
+def _scheduler(tmp_path, source, **kwargs) -> tuple[IngestionScheduler, ParquetDataStore]:
+    store = ParquetDataStore(str(tmp_path / "store"))
+    pipeline = DataPipeline(store=store, market_sources=[source])
+    scheduler = IngestionScheduler(
+        pipeline, status_path=tmp_path / "status.json", sleep=lambda _seconds: None, **kwargs
+    )
+    return scheduler, store
+
+
+def test_scheduler_splits_universe_into_chunks_and_stores_each(tmp_path) -> None:
+    source = FlakyMarketSource()
+    scheduler, store = _scheduler(tmp_path, source, chunk_size=2, workers=3)
+    symbols = ["AAA", "BBB", "CCC", "DDD", "EEE"]
+
+    report = scheduler.run(symbols)
+
+    assert sorted(source.requests) == [["AAA", "BBB"], ["CCC", "DDD"], ["EEE"]]
+    assert report.rows == 10
+    assert not report.failed
+    assert store.list_symbols() == symbols
+
+
+def test_scheduler_retries_transient_failures_with_backoff(tmp_path) -> None:
+    source = FlakyMarketSource(failures={"BBB": 2})
+    store = ParquetDataStore(str(tmp_path / "store"))
+    delays: list[float] = []
+    scheduler = IngestionScheduler(
+        DataPipeline(store=store, market_sources=[source]),
+        chunk_size=1,
+        retry=RetryPolicy(max_attempts=3, base_delay=0.5),
+        sleep=delays.append,
+    )
+
+    report = scheduler.run(["AAA", "BBB"])
+
+    assert not report.failed
+    assert [chunk.attempts for chunk in report.chunks] == [1, 3]
+    assert delays == [0.5, 1.0]
+    assert len(store.load_prices("BBB")) == 2
+
+
+def test_failed_chunks_are_recorded_and_resumed(tmp_path) -> None:
+    source = FlakyMarketSource(failures={"CCC": 2})
+    scheduler, store = _scheduler(tmp_path, source, chunk_size=2, retry=RetryPolicy(max_attempts=2))
+
+    report = scheduler.run(["AAA", "BBB", "CCC", "DDD"])
+
+    assert [chunk.key.split("|")[-1] for chunk in report.failed] == ["CCC,DDD"]
+    assert "ConnectionError" in report.failed[0].error
+    status = json.loads((tmp_path / "status.json").read_text())
+    assert sorted(chunk["state"] for chunk in status["chunks"]) == ["done", "failed"]
+
+    source.requests.clear()
+    resumed = scheduler.run(["AAA", "BBB", "CCC", "DDD"], resume=True)
+
+    assert source.requests == [["CCC", "DDD"]]
+    assert resumed.skipped == 1
+    assert not resumed.failed
+    assert store.list_symbols() == ["AAA", "BBB", "CCC", "DDD"]
+
+
+def test_token_bucket_limits_sustained_rate() -> None:
+    now = [0.0]
+
+    def sleep(seconds: float) -> None:
+        now[0] += seconds
+
+    bucket = TokenBucket(rate=2.0, capacity=2.0, clock=lambda: now[0], sleep=sleep)
+    for _ in range(6):
+        bucket.acquire()
+
+    # Two tokens are available up front; the remaining four arrive at 2 per second.
+    assert now[0] == pytest.approx(2.0)
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Sequence
+
+import pandas as pd
+import pytest
+
+from trading_app.data.ingestion import IngestionScheduler, RetryPolicy
+from trading_app.data.instrumentation import PipelineContext, measure
+from trading_app.data.pipeline import DataPipeline
+from trading_app.data.schemas import PriceBar, Quote
+from trading_app.data.storage.parquet_store import ParquetDataStore
+
+pytestmark = pytest.mark.unit
+
+
+class TickingClock:
+    def __init__(self, step: float) -> None:
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self) -> float:
+        self.now += self.step
+        return self.now
+
+
+class BarSource:
+    name = "bars"
+
+    def __init__(self, hours: int, failures: int = 0) -> None:
+        self.hours = hours
+        self.failures = failures
+
+    def fetch_history(
+        self, symbols: Sequence[str], start: datetime | None = None, end: datetime | None = None
+    ) -> Iterable[PriceBar]:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("reset by peer")
+        base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        return [
+            PriceBar(symbol, base + timedelta(hours=hour), 1.0, 2.0, 0.5, 1.5, 10.0, self.name)
+            for symbol in symbols
+            for hour in range(self.hours)
+        ]
+
+    def stream_live(self, symbols: Sequence[str]) -> Iterable[PriceBar]:
+        return []
+
+    def fetch_quotes(self, symbols: Sequence[str]) -> Iterable[Quote]:
+        return []
+
+
+def test_stage_accumulates_calls_time_and_throughput() -> None:
+    context = PipelineContext(run_id="run-1", clock=TickingClock(0.5))
+
+    for _ in range(2):
+        with context.stage("fetch", source="yf") as stage:
+            stage.rows = 100
+    context.record("fetch", source="yf", retries=2)
+
+    [stats] = context.stats()
+    assert (stats.calls, stats.rows, stats.retries) == (2, 200, 2)
+    assert stats.wall_seconds == pytest.approx(1.0)
+    assert stats.rows_per_second == pytest.approx(200.0)
+
+
+def test_measure_without_context_is_a_no_op() -> None:
+    with measure(None, "write", symbol="AAPL") as stage:
+        stage.rows = 5
+    assert stage.rows == 5
+
+
+def test_pipeline_run_reports_every_stage(tmp_path) -> None:
+    store = ParquetDataStore(str(tmp_path))
+    pipeline = DataPipeline(store=store, market_sources=[BarSource(24)], batch_size=10)
+
+    pipeline.ingest_history(["AAPL", "MSFT"])
+
+    assert store.context is None
+    summary = pipeline.context.summary()
+    assert list(summary.index) == ["fetch", "transform", "dedup", "write"]
+    assert summary.loc["fetch", "rows"] == 48
+    report = pipeline.context.report()
+    writes = report[report["stage"] == "write"].set_index("symbol")
+    assert sorted(writes.index) == ["AAPL", "MSFT"]
+    assert (writes["bytes_written"] > 0).all()
+    assert set(report.loc[report["stage"] == "fetch", "source"]) == {"bars"}
+    assert set(pipeline.context.slowest_symbols().index) == {"AAPL", "MSFT"}
+
+
+def test_pipelines_sharing_a_store_report_into_their_own_context(tmp_path) -> None:
+    store = ParquetDataStore(str(tmp_path))
+    first = DataPipeline(store=store, market_sources=[BarSource(4)])
+    second = DataPipeline(store=store, market_sources=[BarSource(4)])
+
+    first.ingest_history(["AAPL"])
+    second.ingest_history(["MSFT"])
+
+    for pipeline, symbol in ((first, "AAPL"), (second, "MSFT")):
+        report = pipeline.context.report()
+        assert set(report.loc[report["stage"] == "write", "symbol"]) == {symbol}
+
+
+def test_scheduler_retries_are_recorded_per_symbol(tmp_path) -> None:
+    pipeline = DataPipeline(
+        store=ParquetDataStore(str(tmp_path)), market_sources=[BarSource(2, failures=1)]
+    )
+    scheduler = IngestionScheduler(
+        pipeline, retry=RetryPolicy(max_attempts=3), sleep=lambda _seconds: None
+    )
+
+    scheduler.run(["AAPL", "MSFT"])
+
+    retries = pipeline.context.slowest_symbols()["retries"]
+    assert retries.to_dict() == {"AAPL": 1, "MSFT": 1}
+
+
+@pytest.mark.parametrize("suffix", [".json", ".parquet"])
+def test_write_report_round_trips(tmp_path, suffix) -> None:
+    context = PipelineContext(run_id="nightly")
+    with context.stage("write", symbol="AAPL") as stage:
+        stage.rows = 10
+        stage.bytes_written = 2048
+
+    path = context.write_report(tmp_path / "reports" / f"run{suffix}")
+
+    if suffix == ".json":
+        payload = json.loads(path.read_text())
+        assert payload["run_id"] == "nightly"
+        rows = payload["stages"]
+    else:
+        rows = pd.read_parquet(path).to_dict(orient="records")
+    assert rows[0]["stage"] == "write"
+    assert rows[0]["symbol"] == "AAPL"
+    assert rows[0]["bytes_written"] == 2048
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+from trading_app.data.schemas import PriceBar
+from trading_app.data.storage.parquet_store import ParquetDataStore
+
+pytestmark = pytest.mark.unit
+
+_START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _bar(symbol: str, day: int) -> PriceBar:
+    return PriceBar(
+        symbol=symbol,
+        timestamp=_START + timedelta(days=day),
+        open=1.0,
+        high=2.0,
+        low=0.5,
+        close=1.5,
+        volume=10.0,
+        provider="test",
+    )
+
+
+def _write_days(root: str, days: list[int]) -> None:
+    store = ParquetDataStore(root)
+    for day in days:
+        store.save_prices([_bar("AAPL", day)])
+
+
+def test_concurrent_thread_writers_do_not_lose_rows(tmp_path) -> None:
+    chunks = [list(range(start, 80, 4)) for start in range(4)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda days: _write_days(str(tmp_path), days), chunks))
+
+    store = ParquetDataStore(str(tmp_path))
+    assert len(store.load_prices("AAPL")) == 80
+    assert store.coverage("AAPL").row_count == 80
+
+
+def test_concurrent_process_writers_do_not_lose_rows(tmp_path) -> None:
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=_write_days, args=(str(tmp_path), list(range(start, 20, 2))))
+        for start in range(2)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    assert len(ParquetDataStore(str(tmp_path)).load_prices("AAPL")) == 20
+
+
+def test_failed_write_leaves_previous_file_intact(tmp_path, monkeypatch) -> None:
+    store = ParquetDataStore(str(tmp_path))
+    store.save_prices([_bar("AAPL", 0)])
+    original = store._prices_path("AAPL").read_bytes()
+
+    def crash(self, path, *args, **kwargs):
+        with open(path, "wb") as handle:
+            handle.write(b"partial")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(pd.DataFrame, "to_parquet", crash)
+    with pytest.raises(OSError):
+        store.save_prices([_bar("AAPL", 1)])
+    monkeypatch.undo()
+
+    assert store._prices_path("AAPL").read_bytes() == original
+    assert [p.name for p in (tmp_path / "prices").iterdir() if p.suffix == ".tmp"] == []
+    assert len(ParquetDataStore(str(tmp_path)).load_prices("AAPL")) == 1
+    # The failed bar stays buffered (and readable) until a flush succeeds.
+    assert len(store.load_prices("AAPL")) == 2
+    store.flush_prices()
+    assert len(ParquetDataStore(str(tmp_path)).load_prices("AAPL")) == 2
+
+
+def test_coalesced_writes_merge_small_saves_into_one_write(tmp_path, monkeypatch) -> None:
+    store = ParquetDataStore(str(tmp_path))
+    written: list[str] = []
+    original = ParquetDataStore._write_deduped
+
+    def spy(self, path, *args, **kwargs):
+        written.append(path.stem)
+        return original(self, path, *args, **kwargs)
+
+    monkeypatch.setattr(ParquetDataStore, "_write_deduped", spy)
+
+    with store.coalesced_writes():
+        for day in range(10):
+            store.save_prices([_bar("AAPL", day), _bar("MSFT", day)])
+        # Buffered bars are visible before the flush.
+        assert len(store.load_prices("AAPL")) == 10
+        assert written == []
+
+    assert sorted(written) == ["AAPL", "MSFT"]
+    assert len(store.load_prices("MSFT")) == 10
+
+
+def test_price_buffer_flushes_at_row_threshold(tmp_path) -> None:
+    store = ParquetDataStore(str(tmp_path), price_buffer_rows=5)
+
+    store.save_prices([_bar("AAPL", day) for day in range(3)])
+    assert not store._prices_path("AAPL").exists()
+
+    store.save_prices([_bar("AAPL", day) for day in range(3, 6)])
+    assert store._prices_path("AAPL").exists()
+
+    store.save_prices([_bar("AAPL", 6)])
+    store.close()
+    assert len(ParquetDataStore(str(tmp_path)).load_prices("AAPL")) == 7
+
+
+def test_flush_waits_for_a_flush_already_writing_its_bars(tmp_path, monkeypatch) -> None:
+    store = ParquetDataStore(str(tmp_path), price_buffer_rows=100)
+    store.save_prices([_bar("AAPL", day) for day in range(3)])
+    writing, release = threading.Event(), threading.Event()
+    original = ParquetDataStore._write_deduped
+
+    def slow(self, *args, **kwargs):
+        writing.set()
+        release.wait(5)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(ParquetDataStore, "_write_deduped", slow)
+    first = threading.Thread(target=store.flush_prices)
+    first.start()
+    writing.wait(5)
+    second = threading.Thread(target=store.flush_prices)
+    second.start()
+    second.join(0.2)
+
+    # The second flush must not return before the bars are on disk.
+    assert second.is_alive()
+    assert len(store.load_prices("AAPL")) == 3
+    release.set()
+    first.join(5)
+    second.join(5)
+    assert len(ParquetDataStore(str(tmp_path)).load_prices("AAPL")) == 3
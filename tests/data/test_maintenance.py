@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pyarrow.parquet as pq
+import pytest
+
+from trading_app.data.schemas import NewsItem, PriceBar, Quote
+from trading_app.data.storage.maintenance import compact_partition, compact_store
+from trading_app.data.storage.parquet_store import ParquetDataStore
+
+pytestmark = pytest.mark.unit
+
+
+def _bars(symbol: str, count: int) -> list[PriceBar]:
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    return [
+        PriceBar(
+            symbol=symbol,
+            timestamp=start + timedelta(days=i),
+            open=100.0 + i,
+            high=101.0 + i,
+            low=99.0 + i,
+            close=100.5 + i,
+            volume=1_000.0,
+            provider="test",
+        )
+        for i in range(count)
+    ]
+
+
+def test_compaction_rewrites_layout_and_preserves_data(tmp_path) -> None:
+    store = ParquetDataStore(str(tmp_path))
+    for symbol in ("AAPL", "MSFT"):
+        bars = _bars(symbol, 300)
+        for offset in range(0, len(bars), 50):
+            store.save_prices(bars[offset : offset + 50])
+    expected = {symbol: store.load_prices(symbol) for symbol in ("AAPL", "MSFT")}
+
+    report = compact_store(store, row_group_size=64, compression="zstd", workers=2)
+
+    assert len(report.files) == 2
+    assert report.bytes_before > 0 and report.bytes_after > 0
+    assert report.read_speedup > 0
+    metadata = pq.ParquetFile(store._prices_path("AAPL")).metadata
+    assert metadata.num_row_groups == 5
+    column = metadata.row_group(0).column(0)
+    assert column.compression == "ZSTD"
+    assert any("DICTIONARY" in encoding for encoding in column.encodings)
+    for symbol, bars in expected.items():
+        assert store.load_prices(symbol) == bars
+
+
+def test_compaction_can_target_specific_symbols(tmp_path) -> None:
+    store = ParquetDataStore(str(tmp_path))
+    store.save_prices(_bars("AAPL", 10) + _bars("MSFT", 10))
+
+    report = compact_store(store, symbols=["MSFT"])
+
+    assert [result.path.stem for result in report.files] == ["MSFT"]
+
+
+def test_compaction_merges_quote_part_files(tmp_path) -> None:
+    store = ParquetDataStore(str(tmp_path))
+    base = datetime(2024, 1, 1, 15, tzinfo=timezone.utc)
+    for minute in range(5):
+        store.save_quotes(
+            [
+                Quote(
+                    symbol="AAPL",
+                    timestamp=base + timedelta(minutes=minute),
+                    bid=100.0 + minute,
+                    ask=101.0 + minute,
+                    provider="q",
+                )
+            ]
+        )
+    partition = tmp_path / "quotes" / "symbol=AAPL" / "date=2024-01-01"
+    assert len(list(partition.glob("part-*.parquet"))) == 5
+
+    report = compact_store(store, symbols=["AAPL"])
+
+    assert [result.path for result in report.files] == [partition]
+    assert len(list(partition.glob("part-*.parquet"))) == 1
+    assert [quote.bid for quote in store.load_quotes("AAPL")] == [100.0, 101.0, 102.0, 103.0, 104.0]
+
+
+def test_compaction_keeps_news_row_groups_and_index_usable(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr("trading_app.data.storage.parquet_store.NEWS_ROW_GROUP_SIZE", 4)
+    monkeypatch.setattr("trading_app.data.storage.maintenance.NEWS_ROW_GROUP_SIZE", 4)
+    store = ParquetDataStore(str(tmp_path))
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    # Saved newest first, so compaction's sort moves every row.
+    for day in reversed(range(12)):
+        store.save_news(
+            [
+                NewsItem(
+                    id=str(day),
+                    symbol=None,
+                    published_at=start + timedelta(days=day),
+                    title=f"title {day}",
+                    summary="s",
+                    source="wire",
+                    sentiment=None,
+                    tickers=["AAPL"] if day % 5 == 0 else ["MSFT"],
+                )
+            ]
+        )
+
+    compact_store(store, row_group_size=1_000)
+
+    news_file = pq.ParquetFile(tmp_path / "news" / "all.parquet")
+    assert news_file.metadata.num_row_groups == 3
+    assert [item.id for item in store.load_news("AAPL")] == ["0", "5", "10"]
+    assert len(store.load_news("MSFT")) == 9
+
+
+def test_compacting_an_empty_partition_is_a_no_op(tmp_path) -> None:
+    partition = tmp_path / "quotes" / "symbol=AAPL" / "date=2024-01-01"
+    partition.mkdir(parents=True)
+
+    assert compact_partition(partition, sort_column="timestamp") is None
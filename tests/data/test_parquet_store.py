@@ -3,9 +3,12 @@ from __future__ import annotations
 from datetime import datetime, timezone
 
 import pandas as pd
+import pyarrow.parquet as pq
 import pytest
 
-from trading_app.data.schemas import NewsItem, PriceBar, Quote
+from trading_app.data.frames import bars_to_frame
+from trading_app.data.schemas import CompactPriceBar, NewsItem, PriceBar, Quote
+from trading_app.data.storage.maintenance import compact_file
 from trading_app.data.storage.parquet_store import ParquetDataStore
 
 pytestmark = pytest.mark.unit
@@ -57,6 +60,51 @@ def test_save_prices_deduplicates_and_orders(tmp_path) -> None:
     assert loaded == [bar_earlier, bar_latest]
 
 
+def test_save_price_frame_matches_save_prices(tmp_path) -> None:
+    store = ParquetDataStore(str(tmp_path))
+    ts1 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    ts2 = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    bars = [_bar("AAPL", ts1, 150.0), _bar("MSFT", ts1, 300.0), _bar("AAPL", ts2, 151.0)]
+
+    store.save_price_frame(bars_to_frame(bars))
+
+    assert store.load_prices("AAPL") == [bars[0], bars[2]]
+    assert store.load_prices("MSFT") == [bars[1]]
+    assert store.latest_bar("AAPL") == bars[2]
+
+
+def test_ns_path_round_trips_compact_bars_and_integer_timestamps(tmp_path) -> None:
+    bars = [_bar("AAPL", datetime(2024, 1, day, tzinfo=timezone.utc), float(day)) for day in (1, 2)]
+    store = ParquetDataStore(str(tmp_path))
+    store.save_prices([CompactPriceBar.from_bar(bars[0])])
+    frame = bars_to_frame(bars[1:])
+    frame["timestamp"] = frame["timestamp"].dt.as_unit("ns").astype("int64")
+    store.save_price_frame(frame)
+
+    compact = store.load_compact_bars("AAPL")
+
+    assert [bar.ts_ns for bar in compact] == [1_704_067_200_000_000_000, 1_704_153_600_000_000_000]
+    assert [bar.to_bar() for bar in compact] == bars
+    assert store.load_prices("AAPL") == bars
+
+
+def test_iter_price_frames_streams_the_window_in_batches(tmp_path) -> None:
+    store = ParquetDataStore(str(tmp_path))
+    days = pd.date_range("2024-01-01", periods=30, freq="D", tz="UTC")
+    store.save_prices([_bar("AAPL", day.to_pydatetime(), float(i)) for i, day in enumerate(days)])
+    compact_file(store._prices_path("AAPL"), sort_column="timestamp", row_group_size=8)
+    start, end = days[5].to_pydatetime(), days[21].to_pydatetime()
+
+    frames = list(store.iter_price_frames("AAPL", start=start, end=end, batch_size=4))
+
+    assert all(len(frame) <= 4 for frame in frames)
+    pd.testing.assert_frame_equal(
+        pd.concat(frames, ignore_index=True),
+        store.load_price_frame("AAPL", start=start, end=end),
+    )
+    assert list(store.iter_price_frames("AAPL", start=days[-1] + pd.Timedelta(days=1))) == []
+
+
 def test_save_quotes_deduplicates_by_symbol_and_timestamp(tmp_path) -> None:
     store = ParquetDataStore(str(tmp_path))
     ts = datetime(2024, 1, 1, tzinfo=timezone.utc)
@@ -68,11 +116,75 @@ def test_save_quotes_deduplicates_by_symbol_and_timestamp(tmp_path) -> None:
     store.save_quotes(quotes)
     store.save_quotes([_quote("AAPL", ts, 100.0, 101.0)])  # duplicate again
 
-    df = pd.read_parquet(store._quotes_path(), engine="pyarrow")
+    loaded = store.load_quotes("AAPL")
+
+    assert len(loaded) == 1
+    assert loaded[0].symbol == "AAPL"
+    assert loaded[0].timestamp == ts
+
 
-    assert len(df) == 1
-    assert df.iloc[0].symbol == "AAPL"
-    assert pd.to_datetime(df.iloc[0].timestamp, utc=True) == ts
+def test_save_quotes_appends_partitions_without_rewriting(tmp_path) -> None:
+    store = ParquetDataStore(str(tmp_path))
+    day1 = datetime(2024, 1, 1, 15, tzinfo=timezone.utc)
+    day2 = datetime(2024, 1, 2, 15, tzinfo=timezone.utc)
+
+    store.save_quotes([_quote("AAPL", day1, 100.0, 101.0), _quote("MSFT", day1, 10.0, 11.0)])
+    first_part = next((tmp_path / "quotes" / "symbol=AAPL" / "date=2024-01-01").glob("*.parquet"))
+    first_mtime = first_part.stat().st_mtime_ns
+    store.save_quotes([_quote("AAPL", day2, 102.0, 103.0)])
+
+    assert first_part.stat().st_mtime_ns == first_mtime
+    assert sorted(p.name for p in (tmp_path / "quotes" / "symbol=AAPL").iterdir()) == [
+        "date=2024-01-01",
+        "date=2024-01-02",
+    ]
+    assert [q.bid for q in store.load_quotes("AAPL")] == [100.0, 102.0]
+    assert [q.bid for q in store.load_quotes("AAPL", start=day2)] == [102.0]
+    assert [q.bid for q in store.load_quotes("AAPL", end=day2)] == [100.0]
+
+
+def test_quote_buffer_flushes_in_batches(tmp_path) -> None:
+    store = ParquetDataStore(str(tmp_path), quote_buffer_rows=3)
+    base = datetime(2024, 1, 1, 15, tzinfo=timezone.utc)
+
+    store.save_quotes([_quote("AAPL", base.replace(minute=i), 100.0 + i, 101.0) for i in range(2)])
+    assert not (tmp_path / "quotes").exists()
+    # Buffered quotes are still visible to readers.
+    assert len(store.load_quotes("AAPL")) == 2
+
+    store.save_quotes([_quote("AAPL", base.replace(minute=2), 102.0, 103.0)])
+    assert len(list((tmp_path / "quotes").rglob("part-*.parquet"))) == 1
+
+    store.save_quotes([_quote("AAPL", base.replace(minute=3), 103.0, 104.0)])
+    store.flush()
+    assert len(list((tmp_path / "quotes").rglob("part-*.parquet"))) == 2
+    assert len(ParquetDataStore(str(tmp_path)).load_quotes("AAPL")) == 4
+
+
+def test_quote_asof_returns_latest_quote_at_or_before(tmp_path) -> None:
+    store = ParquetDataStore(str(tmp_path))
+    day1 = datetime(2024, 1, 1, 15, tzinfo=timezone.utc)
+    day3 = datetime(2024, 1, 3, 15, tzinfo=timezone.utc)
+    store.save_quotes([_quote("AAPL", day1, 100.0, 101.0), _quote("AAPL", day3, 103.0, 104.0)])
+
+    assert store.quote_asof("AAPL", datetime(2024, 1, 2, tzinfo=timezone.utc)).bid == 100.0
+    assert store.quote_asof("AAPL", day3).bid == 103.0
+    assert store.quote_asof("AAPL", datetime(2023, 12, 31, tzinfo=timezone.utc)) is None
+
+
+def test_legacy_quotes_file_is_still_readable(tmp_path) -> None:
+    ts = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    legacy = pd.DataFrame(
+        [
+            {"symbol": "AAPL", "timestamp": ts, "bid": 1.0, "ask": 2.0},
+            {"symbol": "MSFT", "timestamp": ts, "bid": 3.0, "ask": 4.0},
+        ]
+    ).assign(bid_size=None, ask_size=None, provider="q")
+    legacy.to_parquet(tmp_path / "quotes.parquet", index=False)
+
+    store = ParquetDataStore(str(tmp_path))
+
+    assert [q.bid for q in store.load_quotes("MSFT")] == [3.0]
 
 
 def test_save_news_groups_by_symbol_and_deduplicates(tmp_path) -> None:
@@ -111,3 +223,71 @@ def test_save_news_groups_by_symbol_and_deduplicates(tmp_path) -> None:
 
     assert [item.id for item in aapl_news] == ["1"]
     assert [item.id for item in general_news] == ["2"]
+
+
+def _news(item_id: str, symbol: str | None, day: int, tickers: list[str] | None) -> NewsItem:
+    return NewsItem(
+        id=item_id,
+        symbol=symbol,
+        published_at=datetime(2024, 1, day, tzinfo=timezone.utc),
+        title=f"title {item_id}",
+        summary="s",
+        source="wire",
+        sentiment=None,
+        tickers=tickers,
+    )
+
+
+def test_load_news_uses_ticker_index_for_multi_ticker_articles(tmp_path) -> None:
+    store = ParquetDataStore(str(tmp_path))
+    store.save_news(
+        [
+            _news("1", "AAPL", 1, ["AAPL"]),
+            _news("2", "MSFT", 2, ["MSFT", "AAPL"]),
+            _news("3", None, 3, ["AAPL", "GOOG"]),
+            _news("4", "MSFT", 4, ["MSFT"]),
+        ]
+    )
+
+    assert [item.id for item in store.load_news("AAPL")] == ["1", "2", "3"]
+    assert [item.id for item in store.load_news("GOOG")] == ["3"]
+    assert [item.id for item in store.load_news("MSFT", limit=1)] == ["4"]
+    assert store.load_news("TSLA") == []
+    window = store.load_news(
+        "AAPL",
+        start=datetime(2024, 1, 2, tzinfo=timezone.utc),
+        end=datetime(2024, 1, 3, tzinfo=timezone.utc),
+    )
+    assert [item.id for item in window] == ["2"]
+    assert window[0].tickers == ["MSFT", "AAPL"]
+
+
+def test_indexed_news_reads_only_matching_row_groups(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr("trading_app.data.storage.parquet_store.NEWS_ROW_GROUP_SIZE", 5)
+    store = ParquetDataStore(str(tmp_path))
+    items = [_news(str(i), None, 1 + i, ["AAPL"] if i == 17 else ["MSFT"]) for i in range(25)]
+    store.save_news(items)
+
+    read_groups: list[list[int]] = []
+    original = pq.ParquetFile.read_row_groups
+
+    def spy(self, row_groups, *args, **kwargs):
+        read_groups.append(list(row_groups))
+        return original(self, row_groups, *args, **kwargs)
+
+    monkeypatch.setattr(pq.ParquetFile, "read_row_groups", spy)
+
+    loaded = store.load_news("AAPL")
+
+    assert [item.id for item in loaded] == ["17"]
+    assert read_groups == [[3]]
+
+
+def test_news_index_survives_incremental_saves_and_rebuild(tmp_path) -> None:
+    store = ParquetDataStore(str(tmp_path))
+    store.save_news([_news("2", "AAPL", 5, None)])
+    store.save_news([_news("1", "AAPL", 1, None), _news("3", "MSFT", 3, ["AAPL"])])
+
+    assert [item.id for item in store.load_news("AAPL")] == ["1", "3", "2"]
+    store.rebuild_news_index()
+    assert [item.id for item in store.load_news("AAPL")] == ["1", "3", "2"]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Iterable, Sequence
 
 import pytest
@@ -8,6 +8,7 @@ import pytest
 from trading_app.data.pipeline import DataPipeline
 from trading_app.data.schemas import NewsItem, PriceBar, Quote
 from trading_app.data.storage.base import DataStore
+from trading_app.data.storage.parquet_store import ParquetDataStore
 
 pytestmark = pytest.mark.unit
 
@@ -69,9 +70,7 @@ class FakeStore(DataStore):
     def save_news(self, items: Iterable[NewsItem]) -> None:
         self.news.extend(list(items))
 
-    def load_news(
-        self, symbol: str | None = None, limit: int | None = None
-    ) -> Sequence[NewsItem]:
+    def load_news(self, symbol: str | None = None, limit: int | None = None) -> Sequence[NewsItem]:
         return []
 
 
@@ -100,7 +99,8 @@ def test_ingest_history_collects_from_all_sources() -> None:
 
     pipeline.ingest_history(["AAPL"])
 
-    assert store.prices == bars_a + bars_b
+    # Sources run concurrently, so batches may arrive in either order.
+    assert sorted(store.prices, key=lambda bar: bar.timestamp) == bars_a + bars_b
     assert source_a.requested_symbols == ["AAPL"]
     assert source_b.requested_symbols == ["AAPL"]
 
@@ -140,7 +140,7 @@ def test_ingest_news_collects_from_sources() -> None:
     assert news_source.requested_symbols == ["MSFT"]
 
 
-def test_stream_live_yields_from_all_sources_in_order() -> None:
+def test_stream_live_yields_from_all_sources() -> None:
     store = FakeStore()
     ts = datetime(2024, 3, 1, tzinfo=timezone.utc)
     bars_a = [_price_bar("AAPL", ts)]
@@ -152,4 +152,187 @@ def test_stream_live_yields_from_all_sources_in_order() -> None:
 
     streamed = list(pipeline.stream_live(["AAPL"]))
 
-    assert streamed == bars_a + bars_b
+    # Sources are read concurrently and merged by arrival, so their order may vary.
+    assert sorted(streamed, key=lambda bar: bar.timestamp) == bars_a + bars_b
+
+
+class RecordingMarketSource:
+    """Serves bars from an in-memory history and records each request."""
+
+    def __init__(self, name: str, history: Sequence[PriceBar]) -> None:
+        self.name = name
+        self._history = list(history)
+        self.requests: list[tuple[list[str], datetime | None, datetime | None]] = []
+
+    def fetch_history(
+        self, symbols: Sequence[str], start: datetime | None = None, end: datetime | None = None
+    ) -> Iterable[PriceBar]:
+        self.requests.append((list(symbols), start, end))
+        return [
+            bar
+            for bar in self._history
+            if bar.symbol in symbols
+            and (start is None or bar.timestamp >= start)
+            and (end is None or bar.timestamp < end)
+        ]
+
+    def stream_live(self, symbols: Sequence[str]) -> Iterable[PriceBar]:
+        return []
+
+    def fetch_quotes(self, symbols: Sequence[str]) -> Iterable[Quote]:
+        return []
+
+
+def test_incremental_ingest_fetches_only_missing_windows(tmp_path) -> None:
+    store = ParquetDataStore(str(tmp_path))
+    day = [datetime(2024, 1, d, tzinfo=timezone.utc) for d in range(1, 11)]
+    history = [_price_bar(symbol, ts) for symbol in ("AAPL", "MSFT", "NVDA") for ts in day]
+    store.save_prices([bar for bar in history if bar.symbol != "NVDA" and bar.timestamp <= day[4]])
+    source = RecordingMarketSource("s1", history)
+    pipeline = DataPipeline(store=store, market_sources=[source])
+
+    fetched = pipeline.ingest_history(
+        ["AAPL", "MSFT", "NVDA"], start=day[0], end=day[9], incremental=True
+    )
+
+    assert sorted(source.requests) == [
+        (["AAPL", "MSFT"], day[4], day[9]),
+        (["NVDA"], day[0], day[9]),
+    ]
+    # AAPL/MSFT refetch only their last stored bar plus four new ones.
+    assert fetched == 2 * 5 + 9
+    assert len(store.load_prices("AAPL")) == 9
+
+    source.requests.clear()
+    pipeline.ingest_history(["AAPL"], start=day[0], end=day[9], incremental=True)
+    assert source.requests == [(["AAPL"], day[8], day[9])]
+
+
+def test_full_ingest_passes_requested_range_to_sources() -> None:
+    store = FakeStore()
+    source = RecordingMarketSource("s1", [])
+    pipeline = DataPipeline(store=store, market_sources=[source])
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    pipeline.ingest_history(["AAPL"], start=start, incremental=True)
+
+    # Stores without coverage metadata report the whole request as missing.
+    assert source.requests == [(["AAPL"], start, None)]
+
+
+class GeneratorMarketSource:
+    """Lazily yields ``count`` hourly bars, tracking how many have been produced."""
+
+    def __init__(self, name: str, count: int, close: float = 1.5) -> None:
+        self.name = name
+        self.count = count
+        self.close = close
+        self.produced = 0
+
+    def fetch_history(
+        self, symbols: Sequence[str], start: datetime | None = None, end: datetime | None = None
+    ) -> Iterable[PriceBar]:
+        base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        for index in range(self.count):
+            self.produced += 1
+            yield PriceBar(
+                symbol=symbols[0],
+                timestamp=base + timedelta(hours=index),
+                open=1.0,
+                high=2.0,
+                low=0.5,
+                close=self.close,
+                volume=10.0,
+                provider=self.name,
+            )
+
+    def stream_live(self, symbols: Sequence[str]) -> Iterable[PriceBar]:
+        return []
+
+    def fetch_quotes(self, symbols: Sequence[str]) -> Iterable[Quote]:
+        return []
+
+
+class BatchRecordingStore(FakeStore):
+    def __init__(self, source: GeneratorMarketSource) -> None:
+        super().__init__()
+        self.source = source
+        self.batch_sizes: list[int] = []
+        self.max_in_flight = 0
+
+    def save_prices(self, bars: Iterable[PriceBar]) -> None:
+        bars = list(bars)
+        self.batch_sizes.append(len(bars))
+        self.prices.extend(bars)
+        in_flight = self.source.produced - len(self.prices)
+        self.max_in_flight = max(self.max_in_flight, in_flight)
+
+
+def test_streaming_ingest_writes_fixed_batches_with_bounded_buffering() -> None:
+    source = GeneratorMarketSource("s1", 5_000)
+    store = BatchRecordingStore(source)
+    pipeline = DataPipeline(store=store, market_sources=[source], batch_size=100, queue_size=2)
+
+    assert pipeline.ingest_history(["AAPL"]) == 5_000
+
+    assert set(store.batch_sizes) == {100}
+    assert len(store.prices) == 5_000
+    # At most the queued batches plus one being built and one being handed over.
+    assert store.max_in_flight <= 100 * (2 + 2)
+
+
+def test_provider_priority_resolves_overlapping_sources(tmp_path) -> None:
+    preferred = GeneratorMarketSource("primary", 48, close=2.0)
+    fallback = GeneratorMarketSource("backup", 72, close=1.0)
+    store = ParquetDataStore(str(tmp_path))
+    pipeline = DataPipeline(
+        store=store,
+        market_sources=[fallback, preferred],
+        batch_size=10,
+        provider_priority=["primary", "backup"],
+    )
+
+    pipeline.ingest_history(["AAPL"])
+    pipeline.ingest_history(["AAPL"])  # re-ingesting must not flip the winners
+
+    bars = store.load_prices("AAPL")
+    assert len(bars) == 72
+    assert {bar.provider for bar in bars[:48]} == {"primary"}
+    assert {bar.provider for bar in bars[48:]} == {"backup"}
+
+
+def test_source_order_is_the_default_provider_priority(tmp_path) -> None:
+    store = ParquetDataStore(str(tmp_path))
+    pipeline = DataPipeline(
+        store=store,
+        market_sources=[
+            GeneratorMarketSource("primary", 48, close=2.0),
+            GeneratorMarketSource("backup", 72, close=1.0),
+        ],
+        batch_size=10,
+    )
+
+    pipeline.ingest_history(["AAPL"])
+
+    assert pipeline.provider_priority == ["primary", "backup"]
+    bars = store.load_prices("AAPL")
+    assert {bar.provider for bar in bars[:48]} == {"primary"}
+    assert {bar.provider for bar in bars[48:]} == {"backup"}
+
+
+class FailingMarketSource(GeneratorMarketSource):
+    def fetch_history(
+        self, symbols: Sequence[str], start: datetime | None = None, end: datetime | None = None
+    ) -> Iterable[PriceBar]:
+        yield from super().fetch_history(symbols, start, end)
+        raise ConnectionError("feed dropped")
+
+
+def test_source_failure_is_raised_after_streaming_stops() -> None:
+    store = FakeStore()
+    pipeline = DataPipeline(
+        store=store, market_sources=[FailingMarketSource("s1", 5)], batch_size=2
+    )
+
+    with pytest.raises(ConnectionError):
+        pipeline.ingest_history(["AAPL"])
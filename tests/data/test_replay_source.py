@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from trading_app.data.pipeline import DataPipeline
+from trading_app.data.schemas import CompactPriceBar, PriceBar
+from trading_app.data.sources.replay import ReplayMarketDataSource
+from trading_app.data.storage.parquet_store import ParquetDataStore
+
+pytestmark = pytest.mark.unit
+
+_START = datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc)
+
+
+def _bar(symbol: str, minute: int) -> PriceBar:
+    return PriceBar(
+        symbol=symbol,
+        timestamp=_START + timedelta(minutes=minute),
+        open=1.0,
+        high=2.0,
+        low=0.5,
+        close=float(minute),
+        volume=10.0,
+        provider="test",
+    )
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def store(tmp_path) -> ParquetDataStore:
+    store = ParquetDataStore(str(tmp_path))
+    store.save_prices([_bar("AAPL", minute) for minute in (0, 2, 4)])
+    store.save_prices([_bar("MSFT", minute) for minute in (1, 2, 3)])
+    return store
+
+
+def test_stream_live_merges_symbols_in_timestamp_order(store) -> None:
+    replay = ReplayMarketDataSource(store)
+
+    streamed = [(bar.symbol, bar.close) for bar in replay.stream_live(["AAPL", "MSFT"])]
+
+    assert streamed == [
+        ("AAPL", 0.0),
+        ("MSFT", 1.0),
+        ("AAPL", 2.0),
+        ("MSFT", 2.0),
+        ("MSFT", 3.0),
+        ("AAPL", 4.0),
+    ]
+    assert replay.stats.bars == 6
+
+
+def test_symbols_are_read_lazily_in_batches(store, monkeypatch) -> None:
+    def load_whole(*args, **kwargs):
+        raise AssertionError("replay must not load a symbol's whole history")
+
+    monkeypatch.setattr(store, "load_prices", load_whole)
+    monkeypatch.setattr(store, "load_compact_bars", load_whole)
+
+    for ns in (False, True):
+        replay = ReplayMarketDataSource(store, ns=ns, batch_size=1)
+        assert [bar.close for bar in replay.stream_live(["AAPL", "MSFT"])] == [
+            0.0,
+            1.0,
+            2.0,
+            2.0,
+            3.0,
+            4.0,
+        ]
+
+
+def test_speed_multiplier_compresses_bar_spacing(store) -> None:
+    clock = FakeClock()
+    replay = ReplayMarketDataSource(store, speed=60.0, clock=clock, sleep=clock.sleep)
+
+    list(replay.stream_live(["AAPL", "MSFT"]))
+
+    # One minute of market time per wall-clock second at 60x.
+    assert clock.sleeps == pytest.approx([1.0, 1.0, 1.0, 1.0])
+    assert replay.stats.elapsed_seconds == pytest.approx(4.0)
+    assert replay.stats.throughput == pytest.approx(1.5)
+    assert replay.stats.max_lag_seconds == 0.0
+
+
+def test_ns_mode_streams_compact_bars_with_the_same_order_and_pacing(store) -> None:
+    clock = FakeClock()
+    replay = ReplayMarketDataSource(store, speed=60.0, clock=clock, sleep=clock.sleep, ns=True)
+
+    streamed = list(replay.stream_live(["AAPL", "MSFT"]))
+
+    assert all(isinstance(bar, CompactPriceBar) for bar in streamed)
+    assert [bar.to_bar() for bar in streamed] == list(
+        ReplayMarketDataSource(store).stream_live(["AAPL", "MSFT"])
+    )
+    assert clock.sleeps == pytest.approx([1.0, 1.0, 1.0, 1.0])
+
+
+def test_slow_consumer_accumulates_lag(store) -> None:
+    clock = FakeClock()
+    replay = ReplayMarketDataSource(store, speed=60.0, clock=clock, sleep=clock.sleep)
+
+    for _bar_out in replay.stream_live(["AAPL"]):
+        clock.now += 3.0  # consumer needs 3s per bar; bars are due every 2s
+
+    assert replay.stats.max_lag_seconds == pytest.approx(2.0)
+    assert replay.stats.mean_lag_seconds == pytest.approx(1.0)
+
+
+def test_pipeline_stream_live_runs_against_replay(store) -> None:
+    replay = ReplayMarketDataSource(store)
+    pipeline = DataPipeline(store=store, market_sources=[replay])
+
+    streamed = list(pipeline.stream_live(["MSFT"]))
+
+    assert [bar.close for bar in streamed] == [1.0, 2.0, 3.0]
+    assert [quote.bid for quote in replay.fetch_quotes(["MSFT", "AAPL"])] == [3.0]
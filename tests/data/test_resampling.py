@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_app.data.pipeline import DataPipeline
+from trading_app.data.resampling import BarResampler, bin_labels, resample_frame
+from trading_app.data.sources.synthetic import SyntheticMarketDataSource
+from trading_app.data.storage.parquet_store import ParquetDataStore
+from trading_app.data.storage.sqlite_store import SQLiteDataStore
+
+pytestmark = pytest.mark.unit
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)  # a Monday
+OHLCV = ["open", "high", "low", "close", "volume"]
+
+
+def _pandas_resample(df: pd.DataFrame, frequency: str) -> pd.DataFrame:
+    reference = (
+        df.set_index("timestamp")
+        .groupby("symbol")
+        .resample(frequency, closed="right", label="right")
+        .agg({"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"})
+        .dropna()
+    )
+    return reference.reset_index()
+
+
+@pytest.mark.parametrize("frequency", ["W-FRI", "ME", "QE"])
+def test_resample_frame_matches_pandas_across_symbols(frequency: str) -> None:
+    source = SyntheticMarketDataSource(bars=200, start=START)
+    df = source.fetch_history_frame(["AAA", "BBB", "CCC"])
+
+    ours = resample_frame(df.sample(frac=1.0, random_state=0), frequency)
+    ours = ours.sort_values(["symbol", "timestamp"]).reset_index(drop=True)
+    reference = _pandas_resample(df, frequency)
+
+    assert ours["timestamp"].tolist() == reference["timestamp"].tolist()
+    np.testing.assert_allclose(ours[OHLCV].to_numpy(), reference[OHLCV].to_numpy())
+    assert ours["bar_count"].sum() == len(df)
+
+
+def test_bins_are_right_closed_and_right_labelled() -> None:
+    stamps = pd.DatetimeIndex(
+        ["2024-01-05", "2024-01-05 20:00", "2024-01-06", "2024-01-31", "2024-02-01"], tz="UTC"
+    )
+
+    weekly = pd.DatetimeIndex(bin_labels(stamps, "W"), tz="UTC")
+    monthly = pd.DatetimeIndex(bin_labels(stamps, "M"), tz="UTC")
+    fixed = pd.DatetimeIndex(bin_labels(stamps[:2], "12h"), tz="UTC")
+
+    assert [str(day.date()) for day in weekly] == [
+        "2024-01-05",
+        "2024-01-05",
+        "2024-01-12",
+        "2024-02-02",
+        "2024-02-02",
+    ]
+    assert [str(day.date()) for day in monthly] == [
+        "2024-01-31",
+        "2024-01-31",
+        "2024-01-31",
+        "2024-01-31",
+        "2024-02-29",
+    ]
+    assert fixed.tolist() == [stamps[0], pd.Timestamp("2024-01-06", tz="UTC")]
+
+
+def test_multi_period_calendar_frequencies_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        bin_labels(pd.DatetimeIndex([START]), "2ME")
+
+
+@pytest.fixture(params=["parquet", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "parquet":
+        yield ParquetDataStore(str(tmp_path / "store"))
+        return
+    with SQLiteDataStore(str(tmp_path / "store.db")) as sqlite_store:
+        yield sqlite_store
+
+
+def test_incremental_update_equals_full_rebuild(store, tmp_path) -> None:
+    source = SyntheticMarketDataSource(bars=120, start=START)
+    symbols = ["AAA", "BBB"]
+    cut = START + timedelta(days=80)
+    store.save_price_frame(source.fetch_history_frame(symbols, end=cut))
+    resampler = BarResampler(store, tmp_path / "aggregates", frequencies=["W", "M", "5D"])
+    resampler.build(symbols)
+
+    store.save_price_frame(source.fetch_history_frame(symbols, start=cut))
+    rewritten = resampler.update(symbols)
+
+    full = BarResampler(store, tmp_path / "full", frequencies=["W", "M", "5D"])
+    full.build(symbols)
+    for frequency in ("W", "M", "5D"):
+        for symbol in symbols:
+            pd.testing.assert_frame_equal(
+                resampler.load(symbol, frequency), full.load(symbol, frequency)
+            )
+    # Only the open bins and the bins after the cut were recomputed.
+    assert rewritten < sum(len(full.load(symbol, "5D")) for symbol in symbols)
+
+
+def test_backfill_since_rewrites_affected_bins(tmp_path) -> None:
+    store = ParquetDataStore(str(tmp_path / "store"))
+    source = SyntheticMarketDataSource(bars=60, start=START)
+    frame = source.fetch_history_frame(["AAA"])
+    hole = frame["timestamp"].between(START + timedelta(days=10), START + timedelta(days=20))
+    store.save_price_frame(frame[~hole])
+    resampler = BarResampler(store, tmp_path / "aggregates", frequencies=["W"])
+    resampler.build(["AAA"])
+
+    store.save_price_frame(frame[hole])
+    resampler.update(["AAA"], since=START + timedelta(days=10))
+
+    assert resampler.load("AAA", "W")["bar_count"].sum() == 60
+
+
+def test_pipeline_updates_aggregates_after_ingest(tmp_path) -> None:
+    store = ParquetDataStore(str(tmp_path / "store"))
+    source = SyntheticMarketDataSource(bars=30, start=START)
+    resampler = BarResampler(store, tmp_path / "aggregates", frequencies=["W"])
+    pipeline = DataPipeline(store=store, market_sources=[source], resampler=resampler)
+
+    pipeline.ingest_history(["AAA"], end=START + timedelta(days=14))
+    pipeline.ingest_history(["AAA"], start=START + timedelta(days=14))
+
+    weekly = resampler.load("AAA", "W")
+    assert weekly["bar_count"].tolist() == [5, 7, 7, 7, 4]
+    assert weekly["close"].iloc[-1] == store.load_prices("AAA")[-1].close
+
+
+def test_update_keeps_one_bin_for_bars_stamped_after_midnight(tmp_path) -> None:
+    store = ParquetDataStore(str(tmp_path / "store"))
+    frame = SyntheticMarketDataSource(
+        bars=10, start=datetime(2024, 3, 4, 14, 30, tzinfo=timezone.utc)
+    ).fetch_history_frame(["AAPL"])
+    first = frame["timestamp"] < datetime(2024, 3, 13, tzinfo=timezone.utc)
+    store.save_price_frame(frame[first])
+    resampler = BarResampler(store, tmp_path / "aggregates", frequencies=["W"])
+    resampler.build(["AAPL"])
+
+    store.save_price_frame(frame[~first])
+    resampler.update(["AAPL"])
+
+    weekly = resampler.load("AAPL", "W")
+    full = BarResampler(store, tmp_path / "full", frequencies=["W"])
+    full.build(["AAPL"])
+    assert weekly["timestamp"].is_unique
+    pd.testing.assert_frame_equal(weekly, full.load("AAPL", "W"))
+    assert weekly["bar_count"].sum() == len(frame)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import pickle
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from trading_app.backtesting.engine import BacktestEngine
+from trading_app.data.frames import frame_to_bars, frame_to_compact_bars
+from trading_app.data.schemas import (
+    CompactNewsItem,
+    CompactPriceBar,
+    CompactQuote,
+    NewsItem,
+    PriceBar,
+    Quote,
+)
+from trading_app.data.sources.synthetic import SyntheticMarketDataSource
+from trading_app.strategies.sma_crossover import SmaCrossoverStrategy
+
+pytestmark = pytest.mark.unit
+
+WHEN = datetime(2024, 1, 2, 14, 30, 0, 123456, tzinfo=timezone.utc)
+
+
+def test_compact_bar_round_trips_and_has_no_instance_dict() -> None:
+    bar = PriceBar("AAPL", WHEN, 1.0, 2.0, 0.5, 1.5, volume=10.0, provider="test")
+
+    compact = CompactPriceBar.from_bar(bar)
+
+    assert compact.ts_ns == 1_704_205_800_123_456_000
+    assert compact.timestamp == WHEN
+    assert compact.to_bar() == bar
+    assert not hasattr(compact, "__dict__")
+    assert pickle.loads(pickle.dumps(compact)) == compact
+
+
+def test_compact_quote_round_trips() -> None:
+    quote = Quote("AAPL", WHEN, bid=99.5, ask=100.5, bid_size=3.0, provider="test")
+
+    assert CompactQuote.from_quote(quote).to_quote() == quote
+
+
+def test_compact_news_item_round_trips_with_interned_tickers() -> None:
+    item = NewsItem(
+        id="n1",
+        symbol="AAPL",
+        published_at=WHEN,
+        title="Headline",
+        summary="Summary",
+        source="wire",
+        sentiment="positive",
+        tickers=["AAPL", "MSFT"],
+    )
+
+    compact = CompactNewsItem.from_news_item(item)
+
+    assert compact.published_at == WHEN
+    assert compact.tickers == ("AAPL", "MSFT")
+    assert compact.tickers[1] is CompactNewsItem.from_news_item(item).tickers[1]
+    assert not hasattr(compact, "__dict__")
+    assert compact.to_news_item() == item
+    assert (
+        CompactNewsItem.from_news_item(NewsItem("n2", None, WHEN, "t", "s", "wire"))
+        .to_news_item()
+        .tickers
+        is None
+    )
+
+
+def test_frame_to_compact_bars_shares_interned_names() -> None:
+    frame = SyntheticMarketDataSource(bars=3).fetch_history_frame(["AAA", "BBB"])
+    frame.loc[1, "volume"] = np.nan
+    frame.loc[2, "provider"] = None
+
+    compact = frame_to_compact_bars(frame)
+
+    assert [bar.to_bar() for bar in compact] == frame_to_bars(frame)
+    assert compact[0].symbol is compact[1].symbol
+    assert compact[0].symbol == "AAA"
+    assert compact[0].provider is compact[3].provider
+    assert compact[1].volume is None and compact[2].provider is None
+
+
+def test_engine_accepts_compact_bars() -> None:
+    frame = SyntheticMarketDataSource(bars=60).fetch_history_frame(["AAA"])
+
+    def run(bars):
+        strategy = SmaCrossoverStrategy(symbol="AAA", quantity=10, short_window=3, long_window=8)
+        return BacktestEngine(strategy).run(bars)
+
+    compact = run(frame_to_compact_bars(frame))
+    regular = run(frame_to_bars(frame))
+
+    assert compact.trade_log == regular.trade_log
+    assert compact.equity_curve == regular.equity_curve
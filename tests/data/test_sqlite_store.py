@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import datetime, timezone
+
+import pytest
+
+from trading_app.data.frames import bars_to_frame
+from trading_app.data.schemas import NewsItem, PriceBar, Quote
+from trading_app.data.storage.sqlite_store import SQLiteDataStore
+
+pytestmark = pytest.mark.unit
+
+
+def _bar(symbol: str, day: int, close: float) -> PriceBar:
+    return PriceBar(
+        symbol=symbol,
+        timestamp=datetime(2024, 1, day, tzinfo=timezone.utc),
+        open=close - 0.5,
+        high=close + 0.5,
+        low=close - 1.0,
+        close=close,
+        volume=100.0,
+        provider="test",
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    with SQLiteDataStore(str(tmp_path / "store.db"), batch_size=2) as sqlite_store:
+        yield sqlite_store
+
+
+def test_prices_round_trip_deduplicated_and_ordered(store) -> None:
+    store.save_prices([_bar("AAPL", 2, 151.0), _bar("AAPL", 1, 150.0), _bar("MSFT", 1, 300.0)])
+    store.save_prices([_bar("AAPL", 1, 999.0)])  # duplicate key keeps the stored row
+
+    assert store.load_prices("AAPL") == [_bar("AAPL", 1, 150.0), _bar("AAPL", 2, 151.0)]
+    assert store.list_symbols() == ["AAPL", "MSFT"]
+
+
+def test_save_price_frame_inserts_columnar_batches(store) -> None:
+    store.save_price_frame(bars_to_frame([_bar("AAPL", 2, 151.0), _bar("AAPL", 1, 150.0)]))
+    store.save_price_frame(bars_to_frame([_bar("AAPL", 1, 999.0)]))
+
+    assert store.load_prices("AAPL") == [_bar("AAPL", 1, 150.0), _bar("AAPL", 2, 151.0)]
+
+
+def test_provider_priority_replaces_lower_priority_bars(store) -> None:
+    backup = replace(_bar("AAPL", 1, 100.0), provider="backup")
+    primary = replace(_bar("AAPL", 1, 101.0), provider="primary")
+    priority = ["primary", "backup"]
+
+    store.save_price_frame(bars_to_frame([backup]), provider_priority=priority)
+    store.save_price_frame(bars_to_frame([primary]), provider_priority=priority)
+    store.save_price_frame(bars_to_frame([backup]), provider_priority=priority)
+
+    assert store.load_prices("AAPL") == [primary]
+
+
+def test_range_scan_limit_and_latest_bar(store) -> None:
+    store.save_prices([_bar("AAPL", day, 100.0 + day) for day in range(1, 11)])
+
+    window = store.load_prices(
+        "AAPL",
+        start=datetime(2024, 1, 3, tzinfo=timezone.utc),
+        end=datetime(2024, 1, 6, tzinfo=timezone.utc),
+    )
+
+    assert [bar.close for bar in window] == [103.0, 104.0, 105.0]
+    assert [bar.close for bar in store.load_prices("AAPL", limit=2)] == [109.0, 110.0]
+    assert store.latest_bar("AAPL") == _bar("AAPL", 10, 110.0)
+    assert store.latest_bar("MSFT") is None
+
+
+def test_quotes_round_trip(store) -> None:
+    ts = datetime(2024, 1, 1, 15, tzinfo=timezone.utc)
+    quote = Quote(symbol="AAPL", timestamp=ts, bid=100.0, ask=101.0, provider="q")
+
+    store.save_quotes([quote, quote])
+
+    assert store.load_quotes("AAPL") == [quote]
+
+
+def test_news_is_indexed_by_ticker(store) -> None:
+    def news(item_id: str, symbol: str | None, day: int, tickers: list[str] | None) -> NewsItem:
+        return NewsItem(
+            id=item_id,
+            symbol=symbol,
+            published_at=datetime(2024, 1, day, tzinfo=timezone.utc),
+            title="t",
+            summary="s",
+            source="wire",
+            tickers=tickers,
+        )
+
+    store.save_news(
+        [
+            news("1", "AAPL", 1, ["AAPL"]),
+            news("2", "MSFT", 2, ["MSFT", "AAPL"]),
+            news("3", None, 3, None),
+        ]
+    )
+
+    assert [item.id for item in store.load_news("AAPL")] == ["1", "2"]
+    assert [item.id for item in store.load_news("AAPL", limit=1)] == ["2"]
+    assert [item.id for item in store.load_news(None)] == ["3"]
+    assert store.load_news("AAPL")[1].tickers == ["MSFT", "AAPL"]
+
+
+def test_missing_ranges_uses_key_bounds_and_gaps(store) -> None:
+    store.save_prices([_bar("AAPL", 5, 1.0), _bar("AAPL", 20, 2.0)])
+
+    def day(d: int) -> datetime:
+        return datetime(2024, 1, d, tzinfo=timezone.utc)
+
+    assert store.missing_ranges("AAPL", start=day(1), end=day(25)) == [
+        (day(1), day(5)),
+        (day(5), day(20)),
+        (day(20), day(25)),
+    ]
+    assert store.missing_ranges("MSFT") == [(None, None)]
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Iterator, Sequence
+
+import pytest
+
+from trading_app.data.pipeline import DataPipeline
+from trading_app.data.schemas import PriceBar, Quote
+from trading_app.data.storage.parquet_store import ParquetDataStore
+from trading_app.data.streaming import LiveFanIn
+
+pytestmark = pytest.mark.unit
+
+BASE = datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc)
+
+
+def _bar(symbol: str, minute: int, provider: str = "test") -> PriceBar:
+    return PriceBar(
+        symbol=symbol,
+        timestamp=BASE + timedelta(minutes=minute),
+        open=1.0,
+        high=2.0,
+        low=0.5,
+        close=float(minute),
+        volume=10.0,
+        provider=provider,
+    )
+
+
+class LiveSource:
+    """Streams a fixed list of bars.
+
+    With ``gated=True`` it first yields a ``WARM`` bar and holds the rest until
+    ``proceed`` is set, then sets ``done`` once everything has been yielded, so a
+    test can make the consumer fall behind deterministically.
+    """
+
+    def __init__(self, name: str, bars: Sequence[PriceBar], gated: bool = False) -> None:
+        self.name = name
+        self.bars = list(bars)
+        self.gated = gated
+        self.proceed = threading.Event()
+        self.done = threading.Event()
+
+    def fetch_history(
+        self, symbols: Sequence[str], start: datetime | None = None, end: datetime | None = None
+    ) -> Iterable[PriceBar]:
+        return []
+
+    def stream_live(self, symbols: Sequence[str]) -> Iterator[PriceBar]:
+        if self.gated:
+            yield _bar("WARM", 0, self.name)
+            self.proceed.wait(5)
+        yield from self.bars
+        self.done.set()
+
+    def fetch_quotes(self, symbols: Sequence[str]) -> Iterable[Quote]:
+        return []
+
+
+class EndlessSource(LiveSource):
+    def stream_live(self, symbols: Sequence[str]) -> Iterator[PriceBar]:
+        for minute in itertools.count():
+            if self.proceed.wait(0.001):
+                return
+            yield _bar("SPY", minute, self.name)
+
+
+class BrokenSource(LiveSource):
+    def stream_live(self, symbols: Sequence[str]) -> Iterator[PriceBar]:
+        yield from self.bars
+        raise ConnectionError("socket closed")
+
+
+def _fall_behind(fan_in: LiveFanIn, source: LiveSource) -> list[PriceBar]:
+    """Take the warm-up bar, let the source run to completion, then drain the rest."""
+    stream = fan_in.stream(["AAPL"])
+    assert next(stream).symbol == "WARM"
+    source.proceed.set()
+    assert source.done.wait(5)
+    return list(stream)
+
+
+def test_endless_source_does_not_starve_others() -> None:
+    endless = EndlessSource("endless", [])
+    finite = LiveSource("finite", [_bar("AAPL", minute, "finite") for minute in range(3)])
+    fan_in = LiveFanIn([endless, finite], buffer_size=8)
+
+    seen: list[PriceBar] = []
+    for bar in fan_in.stream(["AAPL", "SPY"]):
+        if bar.provider == "finite":
+            seen.append(bar)
+        if len(seen) == 3:
+            break
+    endless.proceed.set()
+
+    assert [bar.close for bar in seen] == [0.0, 1.0, 2.0]
+
+
+def test_block_policy_delivers_everything_in_order() -> None:
+    bars = [_bar("AAPL", minute) for minute in range(50)]
+    fan_in = LiveFanIn([LiveSource("s1", bars)], buffer_size=1, policy="block")
+
+    assert list(fan_in.stream(["AAPL"])) == bars
+    stats = fan_in.stats["s1"]
+    assert (stats.received, stats.emitted, stats.dropped) == (50, 50, 0)
+    assert stats.high_water == 1
+    assert stats.finished
+
+
+def test_drop_oldest_keeps_newest_bars_when_consumer_lags() -> None:
+    source = LiveSource("s1", [_bar("AAPL", minute) for minute in range(1, 11)], gated=True)
+    fan_in = LiveFanIn([source], buffer_size=2, policy="drop_oldest")
+
+    rest = _fall_behind(fan_in, source)
+
+    assert [bar.close for bar in rest] == [9.0, 10.0]
+    stats = fan_in.stats["s1"]
+    assert (stats.received, stats.emitted, stats.dropped) == (11, 3, 8)
+    assert stats.max_lag_seconds >= stats.mean_lag_seconds > 0
+
+
+def test_coalesce_keeps_latest_bar_per_symbol() -> None:
+    bars = [_bar("AAPL", 1), _bar("MSFT", 1), _bar("AAPL", 2), _bar("AAPL", 3), _bar("MSFT", 2)]
+    source = LiveSource("s1", bars, gated=True)
+    fan_in = LiveFanIn([source], buffer_size=16, policy="coalesce")
+
+    rest = _fall_behind(fan_in, source)
+
+    assert [(bar.symbol, bar.close) for bar in rest] == [("AAPL", 3.0), ("MSFT", 2.0)]
+    assert fan_in.stats["s1"].coalesced == 3
+
+
+def test_failing_source_is_recorded_while_others_continue() -> None:
+    good = LiveSource("good", [_bar("AAPL", minute, "good") for minute in range(3)])
+    broken = BrokenSource("broken", [_bar("AAPL", 0, "broken")])
+    fan_in = LiveFanIn([broken, good])
+
+    streamed = list(fan_in.stream(["AAPL"]))
+
+    assert sorted(bar.provider for bar in streamed) == ["broken", "good", "good", "good"]
+    assert isinstance(fan_in.stats["broken"].error, ConnectionError)
+    assert fan_in.stats["good"].error is None
+
+
+def test_error_is_raised_when_every_source_fails() -> None:
+    fan_in = LiveFanIn([BrokenSource("a", []), BrokenSource("b", [])])
+
+    with pytest.raises(ConnectionError):
+        list(fan_in.stream(["AAPL"]))
+
+
+def test_astream_merges_sources() -> None:
+    sources = [
+        LiveSource(name, [_bar("AAPL", minute, name) for minute in range(5)])
+        for name in ("s1", "s2", "s3")
+    ]
+    fan_in = LiveFanIn(sources, buffer_size=2)
+
+    async def collect() -> list[PriceBar]:
+        return [bar async for bar in fan_in.astream(["AAPL"])]
+
+    streamed = asyncio.run(collect())
+
+    assert len(streamed) == 15
+    for name in ("s1", "s2", "s3"):
+        assert [bar.close for bar in streamed if bar.provider == name] == [0, 1, 2, 3, 4]
+
+
+def test_invalid_policy_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        LiveFanIn([], policy="latest")  # type: ignore[arg-type]
+
+
+def test_pipeline_stream_live_exposes_stats(tmp_path) -> None:
+    source = LiveSource("s1", [_bar("AAPL", 0)])
+    pipeline = DataPipeline(store=ParquetDataStore(str(tmp_path)), market_sources=[source])
+
+    assert list(pipeline.stream_live(["AAPL"])) == source.bars
+    assert pipeline.live_stats["s1"].emitted == 1
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+import numpy as np
+import pytest
+
+from trading_app.data.frames import PRICE_COLUMNS
+from trading_app.data.pipeline import DataPipeline
+from trading_app.data.sources.synthetic import DEFAULT_START, SyntheticMarketDataSource
+from trading_app.data.storage.parquet_store import ParquetDataStore
+
+pytestmark = pytest.mark.unit
+
+
+def test_paths_depend_only_on_seed_and_symbol() -> None:
+    source = SyntheticMarketDataSource(seed=7, bars=300)
+    window_start = DEFAULT_START + timedelta(days=100)
+    window_end = DEFAULT_START + timedelta(days=150)
+
+    together = source.fetch_history_frame(["AAA", "BBB"])
+    alone = source.fetch_history_frame(["BBB"])
+    window = source.fetch_history_frame(["BBB"], start=window_start, end=window_end)
+
+    bbb = together[together["symbol"] == "BBB"].reset_index(drop=True)
+    assert bbb.equals(alone)
+    assert window.reset_index(drop=True).equals(alone.iloc[100:150].reset_index(drop=True))
+    assert SyntheticMarketDataSource(seed=7, bars=300).fetch_history_frame(["BBB"]).equals(alone)
+    assert (
+        not SyntheticMarketDataSource(seed=8, bars=300).fetch_history_frame(["BBB"]).equals(alone)
+    )
+
+
+def test_generated_bars_are_valid_ohlcv() -> None:
+    source = SyntheticMarketDataSource(bars=500, jump_intensity=20.0)
+    frame = source.fetch_history_frame(SyntheticMarketDataSource.universe(20))
+
+    assert list(frame.columns) == PRICE_COLUMNS
+    assert len(frame) == 20 * 500
+    assert (frame["low"] > 0).all()
+    assert (frame["low"] <= frame[["open", "close"]].min(axis=1)).all()
+    assert (frame["high"] >= frame[["open", "close"]].max(axis=1)).all()
+    assert (frame["volume"] > 0).all()
+    assert frame.groupby("symbol")["timestamp"].is_monotonic_increasing.all()
+
+
+def test_market_factor_correlates_returns() -> None:
+    symbols = SyntheticMarketDataSource.universe(6)
+    correlated = SyntheticMarketDataSource(bars=4000, correlation=0.6, jump_intensity=0.0)
+    independent = SyntheticMarketDataSource(bars=4000, correlation=0.0, jump_intensity=0.0)
+
+    def mean_pairwise_correlation(source: SyntheticMarketDataSource) -> float:
+        closes = source.generate(symbols)[3]
+        matrix = np.corrcoef(np.diff(np.log(closes), axis=1))
+        return matrix[np.triu_indices(len(symbols), k=1)].mean()
+
+    assert mean_pairwise_correlation(correlated) == pytest.approx(0.6, abs=0.1)
+    assert abs(mean_pairwise_correlation(independent)) < 0.1
+
+
+def test_write_to_store_and_pipeline_ingest(tmp_path) -> None:
+    source = SyntheticMarketDataSource(bars=50)
+    symbols = SyntheticMarketDataSource.universe(5)
+    store = ParquetDataStore(str(tmp_path / "direct"))
+
+    assert source.write_to_store(store, symbols, block_size=2) == 250
+    assert store.list_symbols() == symbols
+    assert store.latest_bar("SYN00003") == list(source.fetch_history(["SYN00003"]))[-1]
+
+    piped = ParquetDataStore(str(tmp_path / "piped"))
+    assert DataPipeline(piped, [source]).ingest_history(symbols) == 250
+    assert piped.load_prices("SYN00001") == store.load_prices("SYN00001")
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Sequence
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_app.data.frames import bars_to_frame
+from trading_app.data.pipeline import DataPipeline
+from trading_app.data.schemas import PriceBar, Quote
+from trading_app.data.sources.synthetic import SyntheticMarketDataSource
+from trading_app.data.storage.parquet_store import ParquetDataStore
+from trading_app.data.validation import PriceValidator, ValidationRules, load_quarantine
+
+pytestmark = pytest.mark.unit
+
+BASE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _bar(symbol: str, day: int, close: float = 100.0, **overrides: float) -> PriceBar:
+    values = {"open": close, "high": close + 1.0, "low": close - 1.0, "volume": 1_000.0}
+    values.update(overrides)
+    return PriceBar(
+        symbol=symbol,
+        timestamp=BASE + timedelta(days=day),
+        close=close,
+        provider="test",
+        **values,
+    )
+
+
+def _history(symbols: int = 3, bars: int = 300) -> pd.DataFrame:
+    source = SyntheticMarketDataSource(seed=7, bars=bars)
+    return source.fetch_history_frame(source.universe(symbols))
+
+
+def test_each_builtin_rule_flags_its_rows() -> None:
+    frame = bars_to_frame(
+        [
+            _bar("AAPL", 0),
+            _bar("AAPL", 1, high=98.0),  # high below close
+            _bar("AAPL", 2, close=-1.0, low=-2.0, open=1.0, high=1.5),
+            _bar("AAPL", 3, volume=-5.0),
+            _bar("AAPL", 4, open=float("nan")),
+            _bar("AAPL", 5),
+        ]
+    )
+
+    result = PriceValidator().validate(frame)
+
+    assert result.summary.failures == {
+        "non_finite": 1,
+        "non_positive_price": 1,
+        "negative_volume": 1,
+        "ohlc_inconsistent": 1,
+        "conflicting_duplicate": 0,
+        "spike": 0,
+    }
+    assert result.clean["timestamp"].dt.day.tolist() == [1, 6]
+    assert result.summary.quarantined == 4
+
+
+def test_only_conflicting_duplicates_are_quarantined() -> None:
+    frame = bars_to_frame(
+        [
+            _bar("AAPL", 0),
+            _bar("AAPL", 0),  # exact repeat: harmless, dropped later by the store
+            _bar("MSFT", 0, close=50.0),
+            _bar("MSFT", 0, close=51.0),
+            _bar("MSFT", 1, close=52.0),
+        ]
+    )
+
+    result = PriceValidator().validate(frame)
+
+    assert result.clean["symbol"].tolist() == ["AAPL", "AAPL", "MSFT"]
+    assert result.summary.failures["conflicting_duplicate"] == 2
+
+
+def test_spike_flags_the_bad_bar_but_not_the_move_back() -> None:
+    frame = _history()
+    spiked = frame.index[(frame["symbol"] == "SYN00001")][150]
+    frame.loc[spiked, ["close", "high"]] = frame.loc[spiked, "close"] * 20
+
+    result = PriceValidator(rules=ValidationRules(ohlc_inconsistent=False)).validate(frame)
+
+    assert result.summary.failures["spike"] == 1
+    assert result.quarantined.index.tolist() == [spiked]
+
+
+def test_unsorted_batches_give_the_same_verdict() -> None:
+    frame = _history()
+    frame.loc[10, "close"] = frame.loc[10, "close"] * 50
+    frame.loc[400, "high"] = frame.loc[400, "low"] / 2
+    shuffled = frame.sample(frac=1.0, random_state=3)
+    validator = PriceValidator()
+
+    ordered = validator.check(frame)
+    reordered = validator.check(shuffled)
+
+    for rule, mask in ordered.items():
+        assert sorted(frame.index[mask]) == sorted(shuffled.index[reordered[rule]]), rule
+
+
+def test_rules_can_be_disabled_and_extended() -> None:
+    frame = bars_to_frame([_bar("AAPL", 0, volume=-1.0), _bar("AAPL", 1, volume=5e9)])
+    validator = PriceValidator(
+        rules=ValidationRules(negative_volume=False),
+        custom_rules={"volume_cap": lambda df: df["volume"].to_numpy() > 1e9},
+    )
+
+    result = validator.validate(frame)
+
+    assert "negative_volume" not in result.summary.failures
+    assert result.summary.failures["volume_cap"] == 1
+    assert result.clean["volume"].tolist() == [-1.0]
+
+
+def test_quarantine_files_record_reasons_and_summary_accumulates(tmp_path) -> None:
+    validator = PriceValidator(quarantine_dir=tmp_path / "quarantine")
+    validator.validate(bars_to_frame([_bar("AAPL", 0, close=-1.0, volume=-1.0)]))
+    validator.validate(bars_to_frame([_bar("MSFT", 0), _bar("MSFT", 1, high=1.0)]))
+
+    quarantined = load_quarantine(tmp_path / "quarantine")
+
+    assert dict(zip(quarantined["symbol"], quarantined["reasons"])) == {
+        "AAPL": "non_positive_price,negative_volume",
+        "MSFT": "ohlc_inconsistent",
+    }
+    summary = validator.reset()
+    assert (summary.rows, summary.quarantined) == (3, 2)
+    assert validator.summary.rows == 0
+
+
+class BadBarSource:
+    name = "bad"
+
+    def fetch_history(
+        self, symbols: Sequence[str], start: datetime | None = None, end: datetime | None = None
+    ) -> Iterable[PriceBar]:
+        return [_bar("AAPL", 0), _bar("AAPL", 1, high=50.0), _bar("AAPL", 2)]
+
+    def stream_live(self, symbols: Sequence[str]) -> Iterable[PriceBar]:
+        return []
+
+    def fetch_quotes(self, symbols: Sequence[str]) -> Iterable[Quote]:
+        return []
+
+
+def test_pipeline_keeps_failing_rows_out_of_the_store(tmp_path) -> None:
+    store = ParquetDataStore(str(tmp_path / "store"))
+    validator = PriceValidator(quarantine_dir=tmp_path / "quarantine")
+    pipeline = DataPipeline(store=store, market_sources=[BadBarSource()], validator=validator)
+
+    assert pipeline.ingest_history(["AAPL"]) == 2
+
+    assert [bar.timestamp.day for bar in store.load_prices("AAPL")] == [1, 3]
+    assert load_quarantine(tmp_path / "quarantine")["timestamp"].dt.day.tolist() == [2]
+    assert pipeline.context.summary().loc["validate", "rows"] == 2
+
+
+def test_validation_keeps_clean_batches_untouched() -> None:
+    frame = _history()
+
+    result = PriceValidator().validate(frame)
+
+    assert result.clean is frame
+    assert result.summary.quarantined == 0
+    assert np.isfinite(result.summary.rows_per_second)
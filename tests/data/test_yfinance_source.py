@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from datetime import timezone
+from datetime import datetime, timezone
 
+import numpy as np
+import pandas as pd
 import pytest
 
+from trading_app.data.frames import PRICE_COLUMNS
 from trading_app.data.sources.yfinance_source import YFinanceSource
 
 pytestmark = pytest.mark.unit
@@ -40,3 +43,76 @@ def test_fetch_quotes_falls_back_and_returns_utc_timestamp(monkeypatch) -> None:
     assert quote.bid == 101.0
     assert quote.ask == 101.5
     assert quote.timestamp.tzinfo == timezone.utc
+
+
+def _download_frame() -> pd.DataFrame:
+    index = pd.DatetimeIndex(["2024-01-02", "2024-01-03", "2024-01-04"], name="Date")
+    fields = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
+    blocks = {
+        "MSFT": [[10.0, 11.0, 9.0, 10.5, 10.5, 100.0]] * 3,
+        "AAPL": [
+            [1.0, 2.0, 0.5, 1.5, 1.5, 10.0],
+            [float("nan")] * 6,
+            [1.5, 2.5, 1.0, 2.0, 2.0, 20.0],
+        ],
+    }
+    columns = pd.MultiIndex.from_product([list(blocks), fields], names=["Ticker", "Price"])
+    values = np.hstack([np.array(rows) for rows in blocks.values()])
+    return pd.DataFrame(values, index=index, columns=columns)
+
+
+def test_fetch_history_frame_stacks_tickers_without_row_loops(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "trading_app.data.sources.yfinance_source.yf.download",
+        lambda **_kwargs: _download_frame(),
+    )
+
+    frame = YFinanceSource().fetch_history_frame(["AAPL", "MSFT"])
+
+    assert list(frame.columns) == PRICE_COLUMNS
+    assert frame["symbol"].tolist() == ["AAPL", "AAPL", "MSFT", "MSFT", "MSFT"]
+    assert frame["close"].tolist() == [1.5, 2.0, 10.5, 10.5, 10.5]
+    assert str(frame["timestamp"].dt.tz) == "UTC"
+    assert set(frame["provider"]) == {"yfinance"}
+
+
+def test_fetch_history_iterator_matches_frame(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "trading_app.data.sources.yfinance_source.yf.download",
+        lambda **_kwargs: _download_frame(),
+    )
+
+    bars = list(YFinanceSource().fetch_history(["AAPL"]))
+
+    assert [bar.symbol for bar in bars] == ["AAPL", "AAPL"]
+    assert bars[0].timestamp == datetime(2024, 1, 2, tzinfo=timezone.utc)
+    assert bars[1].close == 2.0
+    assert bars[1].volume == 20.0
+
+
+class _FakeActionsTicker:
+    def __init__(self, actions: pd.DataFrame) -> None:
+        self.actions = actions
+
+
+def test_fetch_actions_normalizes_ex_dates_and_skips_zero_values(monkeypatch) -> None:
+    index = pd.DatetimeIndex(["2020-08-07", "2020-08-31", "2021-02-05"], name="Date").tz_localize(
+        "America/New_York"
+    )
+    actions = pd.DataFrame(
+        {"Dividends": [0.205, 0.0, 0.205], "Stock Splits": [0.0, 4.0, 0.0]}, index=index
+    )
+    monkeypatch.setattr(
+        "trading_app.data.sources.yfinance_source.yf.Ticker",
+        lambda _symbol: _FakeActionsTicker(actions),
+    )
+
+    fetched = YFinanceSource().fetch_actions(
+        ["AAPL"], start=datetime(2020, 1, 1, tzinfo=timezone.utc), end=datetime(2021, 1, 1)
+    )
+
+    assert [(action.ex_date, action.kind, action.value) for action in fetched] == [
+        (datetime(2020, 8, 7, tzinfo=timezone.utc), "dividend", 0.205),
+        (datetime(2020, 8, 31, tzinfo=timezone.utc), "split", 4.0),
+    ]
+    assert {action.provider for action in fetched} == {"yfinance"}
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import pytest
+
+from trading_app.execution.orders import (
+    CompactFill,
+    CompactOrder,
+    Fill,
+    Order,
+    OrderSide,
+    OrderType,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def test_compact_order_and_fill_round_trip() -> None:
+    order = Order("AAPL", 10.0, OrderSide.BUY, type=OrderType.LIMIT, limit_price=99.0)
+    fill = Fill(order=order, fill_price=98.5, fill_qty=4.0, commission=0.4)
+
+    compact = CompactFill.from_fill(fill, ts_ns=1_704_205_800_000_000_000)
+    stamped = CompactFill.from_fill(fill, ts_ns=2, order_ts_ns=1)
+
+    assert compact.to_fill() == fill
+    assert compact.ts_ns == 1_704_205_800_000_000_000 and compact.order.ts_ns is None
+    assert (stamped.ts_ns, stamped.order.ts_ns) == (2, 1)
+    assert not hasattr(compact, "__dict__") and not hasattr(compact.order, "__dict__")
+
+
+def test_compact_orders_share_symbol_strings() -> None:
+    first = CompactOrder.from_order(Order("".join(["MS", "FT"]), 1.0, OrderSide.SELL))
+    second = CompactOrder.from_order(Order("".join(["MS", "FT"]), 2.0, OrderSide.SELL))
+
+    assert first.symbol is second.symbol
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from trading_app.backtesting.engine import BacktestEngine
+from trading_app.data.schemas import PriceBar
+from trading_app.execution.costs import FixedBpsSlippage, PercentCommission, PerShareCommission
+from trading_app.execution.orders import Order, OrderSide, OrderType
+from trading_app.execution.paper import PaperTrader
+from trading_app.execution.simulated_broker import SimulatedBroker
+from trading_app.portfolio.models import PortfolioState, Position
+from trading_app.strategies.sma_crossover import SmaCrossoverStrategy
+
+pytestmark = pytest.mark.unit
+
+BASE = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+
+def _bar(symbol: str, close: float, day: int = 0, volume: float | None = 1_000.0) -> PriceBar:
+    return PriceBar(
+        symbol=symbol,
+        timestamp=BASE + timedelta(days=day),
+        open=close,
+        high=close,
+        low=close,
+        close=close,
+        volume=volume,
+        provider="test",
+    )
+
+
+def _buy(symbol: str, quantity: float, **kwargs) -> Order:
+    return Order(symbol, quantity, OrderSide.BUY, **kwargs)
+
+
+def _sell(symbol: str, quantity: float, **kwargs) -> Order:
+    return Order(symbol, quantity, OrderSide.SELL, **kwargs)
+
+
+def test_orders_rest_until_their_symbol_trades() -> None:
+    broker = SimulatedBroker()
+    state = PortfolioState(cash=10_000.0)
+
+    assert broker.submit_orders([_buy("AAPL", 10), _buy("MSFT", 5)], state) == []
+    assert broker.process_bar(_bar("MSFT", 100.0), state)[0].order.symbol == "MSFT"
+    assert [order.symbol for order in broker.open_orders()] == ["AAPL"]
+
+    fills = broker.submit_orders([_buy("MSFT", 1), _buy("AAPL", 1)], state)
+
+    assert [(fill.order.symbol, fill.fill_qty) for fill in fills] == [("MSFT", 1.0)]
+    assert state.positions["MSFT"].quantity == 6.0
+    assert len(broker.open_orders("AAPL")) == 2
+
+
+def test_limits_fill_best_price_first_and_never_worse_than_the_limit() -> None:
+    broker = SimulatedBroker(slippage_model=FixedBpsSlippage(bps=100))
+    state = PortfolioState(cash=10_000.0)
+    limits = [_buy("AAPL", 1, type=OrderType.LIMIT, limit_price=price) for price in (99, 101, 100)]
+    broker.submit_orders(limits, state)
+
+    fills = broker.process_bar(_bar("AAPL", 100.0), state)
+
+    assert [fill.order.limit_price for fill in fills] == [101, 100]
+    assert [fill.fill_price for fill in fills] == [pytest.approx(101.0), 100.0]
+    assert [order.limit_price for order in broker.open_orders("AAPL")] == [99]
+
+
+def test_stops_trigger_when_the_price_crosses_them() -> None:
+    broker = SimulatedBroker()
+    state = PortfolioState(cash=0.0, positions={"AAPL": Position("AAPL", 10.0, 100.0)})
+    broker.submit_orders([_sell("AAPL", 10, type=OrderType.STOP, stop_price=95.0)], state)
+
+    assert broker.process_bar(_bar("AAPL", 97.0), state) == []
+    fills = broker.process_bar(_bar("AAPL", 94.0, day=1), state)
+
+    assert [(fill.fill_qty, fill.fill_price) for fill in fills] == [(10.0, 94.0)]
+    assert "AAPL" not in state.positions
+    assert state.cash == pytest.approx(940.0)
+
+
+def test_participation_cap_fills_partially_across_bars() -> None:
+    broker = SimulatedBroker(max_participation=0.1)
+    state = PortfolioState(cash=100_000.0)
+    broker.submit_orders([_buy("AAPL", 250)], state)
+
+    filled = [
+        sum(fill.fill_qty for fill in broker.process_bar(_bar("AAPL", 10.0, day), state))
+        for day in range(4)
+    ]
+
+    assert filled == [100.0, 100.0, 50.0, 0.0]
+    assert state.positions["AAPL"].quantity == 250.0
+    assert broker.stats.fills == 3
+
+
+def test_costs_are_charged_on_every_fill() -> None:
+    broker = SimulatedBroker(
+        commission_model=PerShareCommission(per_share=0.01, minimum=1.0),
+        slippage_model=FixedBpsSlippage(bps=10),
+    )
+    state = PortfolioState(cash=10_000.0)
+    broker.process_bar(_bar("AAPL", 100.0), state)
+
+    buy = broker.submit_orders([_buy("AAPL", 50)], state)[0]
+    sell = broker.submit_orders([_sell("AAPL", 500)], state)[0]
+
+    assert (buy.fill_price, buy.commission) == (pytest.approx(100.1), 1.0)
+    assert (sell.fill_qty, sell.fill_price) == (50.0, pytest.approx(99.9))
+    assert state.cash == pytest.approx(10_000.0 - 50 * 0.2 - 2.0)
+    assert PercentCommission(rate=0.001).commission(buy.order, 100.0, 10.0) == pytest.approx(1.0)
+
+
+def test_rejections_and_cancels_are_counted() -> None:
+    broker = SimulatedBroker()
+    state = PortfolioState(cash=100.0)
+    broker.submit_orders(
+        [_buy("AAPL", 0), _buy("AAPL", 1, type=OrderType.LIMIT), _buy("AAPL", 5), _sell("AAPL", 1)],
+        state,
+    )
+    broker.submit_orders([_buy("MSFT", 1), _buy("MSFT", 2), _buy("SPY", 1)], state)
+
+    assert broker.process_bar(_bar("AAPL", 50.0), state) == []
+    broker.cancel_all(["MSFT", "QQQ"])
+
+    assert (broker.stats.submitted, broker.stats.rejected, broker.stats.cancelled) == (7, 4, 2)
+    assert [order.symbol for order in broker.open_orders()] == ["SPY"]
+
+
+def test_engine_trade_log_includes_costs() -> None:
+    bars = [_bar("AAPL", close, day) for day, close in enumerate([10.0, 9.0, 8.0, 12.0, 7.0, 6.0])]
+    broker = SimulatedBroker(commission_model=PerShareCommission(per_share=1.0))
+    strategy = SmaCrossoverStrategy(symbol="AAPL", short_window=2, long_window=3, quantity=5.0)
+
+    result = BacktestEngine(strategy, broker=broker).run(bars, starting_cash=1_000.0)
+
+    assert [fill.commission for fill in result.fills] == [5.0, 5.0]
+    assert [trade.cash_after for trade in result.trade_log] == [935.0, 960.0]
+    assert result.final_state.cash == pytest.approx(960.0)
+
+
+def test_paper_trader_matches_backtest() -> None:
+    bars = [_bar("AAPL", close, day) for day, close in enumerate([10.0, 9.0, 8.0, 12.0, 7.0, 6.0])]
+
+    def strategy() -> SmaCrossoverStrategy:
+        return SmaCrossoverStrategy(symbol="AAPL", short_window=2, long_window=3, quantity=5.0)
+
+    backtest = BacktestEngine(strategy()).run(bars, starting_cash=1_000.0)
+    trader = PaperTrader(strategy(), starting_cash=1_000.0)
+    state = trader.run(iter(bars))
+
+    assert trader.fills == backtest.fills
+    assert state.cash == backtest.final_state.cash
+    assert state.equity == backtest.final_state.equity
+
+    partial = PaperTrader(strategy(), starting_cash=1_000.0)
+    partial.run(iter(bars), max_bars=4)
+    assert len(partial.fills) == 1
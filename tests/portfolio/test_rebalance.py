@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from trading_app.execution.orders import OrderSide
+from trading_app.portfolio.models import PortfolioState, Position
+from trading_app.portfolio.rebalance import TargetWeightRebalancer
+
+pytestmark = pytest.mark.unit
+
+PRICES = {"AAA": 10.0, "BBB": 20.0, "CCC": 50.0}
+
+
+def _state(cash: float = 0.0, **held: float) -> PortfolioState:
+    return PortfolioState(
+        cash=cash,
+        positions={
+            symbol: Position(symbol, quantity, PRICES[symbol]) for symbol, quantity in held.items()
+        },
+    )
+
+
+def test_orders_reach_target_weights_with_sells_first() -> None:
+    state = _state(cash=1_000.0, AAA=100, CCC=20)  # equity 3,000
+
+    orders = TargetWeightRebalancer().rebalance({"AAA": 0.1, "BBB": 0.5, "CCC": 0.4}, state, PRICES)
+
+    assert [(order.symbol, order.side, order.quantity) for order in orders] == [
+        ("AAA", OrderSide.SELL, 70.0),
+        ("BBB", OrderSide.BUY, 75.0),
+        ("CCC", OrderSide.BUY, 4.0),
+    ]
+
+
+def test_untargeted_positions_are_closed_in_full() -> None:
+    state = _state(cash=500.0, AAA=3, BBB=7)
+
+    trades = TargetWeightRebalancer(lot_size=5, min_trade_notional=1_000.0).trades(
+        pd.Series({"CCC": 0.0}), state, PRICES
+    )
+
+    assert trades[["symbol", "side", "quantity"]].values.tolist() == [
+        ["BBB", "SELL", 7.0],
+        ["AAA", "SELL", 3.0],
+    ]
+
+
+def test_lots_round_towards_zero_per_symbol() -> None:
+    state = _state(cash=10_000.0)
+
+    trades = TargetWeightRebalancer(lot_size={"AAA": 100}).trades(
+        {"AAA": 0.37, "BBB": 0.255}, state, PRICES
+    )
+
+    assert trades.set_index("symbol")["quantity"].to_dict() == {"BBB": 127.0, "AAA": 300.0}
+
+
+def test_band_and_minimum_trade_skip_small_adjustments() -> None:
+    state = _state(cash=400.0, AAA=30, BBB=15)  # equity 1,000: weights 0.3 / 0.3
+
+    banded = TargetWeightRebalancer(no_trade_band=0.05)
+    minimum = TargetWeightRebalancer(min_trade_notional=50.0)
+    targets = {"AAA": 0.33, "BBB": 0.4}
+
+    assert [order.symbol for order in banded.rebalance(targets, state, PRICES)] == ["BBB"]
+    assert [order.symbol for order in minimum.rebalance(targets, state, PRICES)] == ["BBB"]
+    assert len(TargetWeightRebalancer().rebalance(targets, state, PRICES)) == 2
+
+
+def test_held_symbols_without_price_use_cost_basis() -> None:
+    state = PortfolioState(cash=100.0, positions={"OLD": Position("OLD", 10.0, 10.0)})
+
+    orders = TargetWeightRebalancer().rebalance({"OLD": 0.5, "AAA": 0.5}, state, PRICES)
+
+    assert [(order.symbol, order.quantity) for order in orders] == [("AAA", 10.0)]
+
+
+def test_invalid_inputs_raise() -> None:
+    rebalancer = TargetWeightRebalancer()
+
+    with pytest.raises(ValueError, match="non-negative"):
+        rebalancer.rebalance({"AAA": -0.1}, _state(cash=100.0), PRICES)
+    with pytest.raises(ValueError, match="NEW"):
+        rebalancer.rebalance({"NEW": 0.5}, _state(cash=100.0), PRICES)
+    with pytest.raises(ValueError, match="equity"):
+        rebalancer.rebalance({"AAA": 0.5}, _state(), PRICES)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from trading_app.execution.orders import Order, OrderSide, OrderType
+from trading_app.portfolio.models import PortfolioState, Position
+from trading_app.portfolio.risk import PreTradeRiskModel, RiskLimits
+
+pytestmark = pytest.mark.unit
+
+PRICES = {"AAA": 10.0, "BBB": 20.0, "CCC": 50.0}
+SECTORS = {"AAA": "tech", "BBB": "tech", "CCC": "energy"}
+
+
+def _buy(symbol: str, quantity: float, **kwargs) -> Order:
+    return Order(symbol, quantity, OrderSide.BUY, **kwargs)
+
+
+def _sell(symbol: str, quantity: float) -> Order:
+    return Order(symbol, quantity, OrderSide.SELL)
+
+
+def _model(**limits) -> PreTradeRiskModel:
+    return PreTradeRiskModel(RiskLimits(**limits), sectors=SECTORS, prices=PRICES)
+
+
+def test_orders_within_limits_pass_unchanged() -> None:
+    orders = [_buy("AAA", 10), _sell("BBB", 5)]
+    state = PortfolioState(cash=1_000.0, positions={"BBB": Position("BBB", 5.0, 20.0)})
+
+    check = _model(max_position_weight=0.5, max_gross_exposure=1.0).check(orders, state)
+
+    assert check.orders[0] is orders[0] and check.orders[1] is orders[1]
+    assert check.binding == {}
+
+
+def test_order_notional_caps_both_sides() -> None:
+    state = PortfolioState(cash=10_000.0, positions={"CCC": Position("CCC", 100.0, 50.0)})
+
+    check = _model(max_order_notional=500.0).check([_buy("AAA", 100), _sell("CCC", 40)], state)
+
+    assert [order.quantity for order in check.orders] == [50.0, 10.0]
+    assert check.binding == {"max_order_notional": 2}
+
+
+def test_position_weight_scales_buys_of_a_symbol_proportionally() -> None:
+    state = PortfolioState(cash=1_000.0, positions={"AAA": Position("AAA", 10.0, 10.0)})
+
+    check = _model(max_position_weight=0.3).check([_buy("AAA", 30), _buy("AAA", 10)], state)
+
+    # Equity 1,100 allows 330 in AAA; 100 is held, so the 400 requested becomes 230.
+    assert [order.quantity for order in check.orders] == pytest.approx([17.25, 5.75])
+
+
+def test_sector_cap_counts_held_positions_and_sells() -> None:
+    state = PortfolioState(
+        cash=500.0,
+        positions={"AAA": Position("AAA", 20.0, 10.0), "BBB": Position("BBB", 10.0, 20.0)},
+    )
+    orders = [_sell("AAA", 10), _buy("BBB", 20), _buy("CCC", 4)]
+
+    check = _model(max_sector_weight=0.5, require_cash=False).check(orders, state)
+
+    # Equity 900: tech may hold 450, holds 400 and sells 100, so 150 of 400 bought fits.
+    assert [order.quantity for order in check.orders] == pytest.approx([10.0, 7.5, 4.0])
+    assert check.binding == {"max_sector_weight": 1}
+
+
+def test_gross_exposure_and_cash_scale_the_whole_batch() -> None:
+    state = PortfolioState(cash=300.0)
+    orders = [_buy("AAA", 20), _buy("BBB", 20)]
+
+    gross = _model(max_gross_exposure=0.5).check(orders, state)
+    cash = _model().check(orders, state)
+
+    assert [order.quantity for order in gross.orders] == pytest.approx([5.0, 5.0])
+    assert [order.quantity for order in cash.orders] == pytest.approx([10.0, 10.0])
+    assert cash.binding == {"cash": 2}
+
+
+def test_sell_proceeds_fund_buys_and_lots_round_down() -> None:
+    state = PortfolioState(cash=30.0, positions={"CCC": Position("CCC", 10.0, 50.0)})
+    orders = [_sell("CCC", 4), _buy("AAA", 30)]
+
+    check = _model(lot_size=5).check(orders, state)
+
+    assert [order.quantity for order in check.orders] == [4.0, 20.0]
+    assert check.scale.tolist() == pytest.approx([1.0, 2 / 3])
+    assert check.binding == {"cash": 1, "lot_size": 1}
+
+
+def test_orders_that_cannot_be_valued_are_rejected() -> None:
+    model = PreTradeRiskModel(RiskLimits())
+    state = PortfolioState(cash=1_000.0)
+    orders = [_buy("NEW", 5), _buy("LMT", 5, type=OrderType.LIMIT, limit_price=10.0), _buy("X", 0)]
+
+    check = model.check(orders, state)
+
+    assert [order.symbol for order in check.orders] == ["LMT"]
+    assert np.array_equal(check.scale, [0.0, 1.0, 0.0])
+    assert model.validate([], state) == []
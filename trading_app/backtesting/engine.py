@@ -2,67 +2,81 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
-from datetime import datetime
+from operator import attrgetter
 from typing import Sequence
 
-from trading_app.data.schemas import PriceBar
-from trading_app.execution.orders import Fill, Order, OrderSide, OrderType
-from trading_app.portfolio.models import Position
+from trading_app.data.schemas import CompactPriceBar, PriceBar
+from trading_app.execution.orders import Fill, Order
+from trading_app.execution.simulated_broker import SimulatedBroker
 from trading_app.portfolio.models import PortfolioState
 from trading_app.backtesting.results import BacktestResult, EquityPoint, TradeRecord
 from trading_app.strategies.base import Strategy
 
 
 class BacktestEngine:
-    """Runs strategies against historical data and tracks portfolio state."""
+    """Runs strategies against historical data and tracks portfolio state.
 
-    def __init__(self, strategy: Strategy) -> None:
+    Orders are executed by ``broker`` (a fresh ``SimulatedBroker`` by default,
+    reset at the start of every run), so fill rules, commissions and slippage
+    are the same as in paper trading; the trade log is built from the broker's
+    ``executions``.
+
+    With ``ns=True`` bars must carry ``ts_ns`` (e.g. ``CompactPriceBar``) and
+    the equity curve and trade log keep those int64 UTC-nanosecond timestamps;
+    convert with ``trading_app.utils.time.to_datetime`` only for display.
+    """
+
+    def __init__(
+        self, strategy: Strategy, ns: bool = False, broker: SimulatedBroker | None = None
+    ) -> None:
         self.strategy = strategy
+        self.ns = ns
+        self.broker = broker if broker is not None else SimulatedBroker()
 
     def run(
         self,
-        bars: Sequence[PriceBar],
+        bars: Sequence[PriceBar | CompactPriceBar],
         starting_cash: float = 100_000.0,
     ) -> BacktestResult:
-        """Execute a deterministic bar-by-bar market-order backtest."""
+        """Execute a deterministic bar-by-bar backtest."""
+        broker = self.broker
+        broker.reset()
         state = PortfolioState(cash=starting_cash, equity=starting_cash)
-        pending_orders = list(self.strategy.on_start(state))
-        submitted_orders: list[Order] = list(pending_orders)
+        submitted_orders: list[Order] = list(self.strategy.on_start(state))
+        broker.submit_orders(submitted_orders, state)  # rest until their symbol's first bar
         fills: list[Fill] = []
         trade_log: list[TradeRecord] = []
         equity_curve: list[EquityPoint] = []
-        last_close_by_symbol: dict[str, float] = {}
+        stamp = attrgetter("ts_ns" if self.ns else "timestamp")
 
-        for bar in bars:
-            last_close_by_symbol[bar.symbol] = bar.close
-            pending_orders, executed_fills, executed_trades = self._execute_orders_for_symbol(
-                pending_orders,
-                state,
-                symbol=bar.symbol,
-                fill_price=bar.close,
-                fill_timestamp=bar.timestamp,
-            )
-            fills.extend(executed_fills)
-            trade_log.extend(executed_trades)
+        executions = broker.executions
+        logged = 0
 
+        for bar in bars:
+            timestamp = stamp(bar)
+            fills.extend(broker.process_bar(bar, state))
             new_orders = self.strategy.on_bar(bar, state)
             submitted_orders.extend(new_orders)
-            pending_orders.extend(new_orders)
-            pending_orders, executed_fills, executed_trades = self._execute_orders_for_symbol(
-                pending_orders,
-                state,
-                symbol=bar.symbol,
-                fill_price=bar.close,
-                fill_timestamp=bar.timestamp,
-            )
-            fills.extend(executed_fills)
-            trade_log.extend(executed_trades)
-            state.equity = self._compute_equity(state, last_close_by_symbol)
-            equity_curve.append(EquityPoint(timestamp=bar.timestamp, equity=state.equity))
+            fills.extend(broker.submit_orders(new_orders, state))
+            for execution in executions[logged:]:
+                fill = execution.fill
+                trade_log.append(
+                    TradeRecord(
+                        timestamp=timestamp,
+                        symbol=fill.order.symbol,
+                        side=fill.order.side,
+                        quantity=fill.fill_qty,
+                        price=fill.fill_price,
+                        cash_after=execution.cash_after,
+                        position_after=execution.position_after,
+                    )
+                )
+            logged = len(executions)
+            state.equity = broker.mark_to_market(state)
+            equity_curve.append(EquityPoint(timestamp=timestamp, equity=state.equity))
 
         self.strategy.on_finish(state)
-        state.equity = self._compute_equity(state, last_close_by_symbol)
+        state.equity = broker.mark_to_market(state)
         return BacktestResult(
             final_state=state,
             equity_curve=equity_curve,
@@ -71,123 +85,3 @@ class BacktestEngine:
             trade_log=trade_log,
             bars_processed=len(bars),
         )
-
-    def _execute_orders_for_symbol(
-        self,
-        orders: Iterable[Order],
-        state: PortfolioState,
-        symbol: str,
-        fill_price: float,
-        fill_timestamp: datetime,
-    ) -> tuple[list[Order], list[Fill], list[TradeRecord]]:
-        remaining: list[Order] = []
-        fills: list[Fill] = []
-        trades: list[TradeRecord] = []
-        for order in orders:
-            if order.symbol != symbol:
-                remaining.append(order)
-                continue
-            if order.type is not OrderType.MARKET or order.quantity <= 0:
-                continue
-            fill, trade = self._apply_fill(
-                state,
-                order,
-                fill_price=fill_price,
-                fill_timestamp=fill_timestamp,
-            )
-            if fill is not None:
-                fills.append(fill)
-            if trade is not None:
-                trades.append(trade)
-        return remaining, fills, trades
-
-    def _apply_fill(
-        self,
-        state: PortfolioState,
-        order: Order,
-        fill_price: float,
-        fill_timestamp: datetime,
-    ) -> tuple[Fill | None, TradeRecord | None]:
-        if order.side is OrderSide.BUY:
-            filled_qty = self._apply_buy_fill(state, order.symbol, order.quantity, fill_price)
-        else:
-            filled_qty = self._apply_sell_fill(state, order.symbol, order.quantity, fill_price)
-        if filled_qty <= 0:
-            return None, None
-
-        position = state.positions.get(order.symbol)
-        position_after = position.quantity if position is not None else 0.0
-        return (
-            Fill(order=order, fill_price=fill_price, fill_qty=filled_qty),
-            TradeRecord(
-                timestamp=fill_timestamp,
-                symbol=order.symbol,
-                side=order.side,
-                quantity=filled_qty,
-                price=fill_price,
-                cash_after=state.cash,
-                position_after=position_after,
-            ),
-        )
-
-    def _apply_buy_fill(
-        self, state: PortfolioState, symbol: str, quantity: float, fill_price: float
-    ) -> float:
-        notional = quantity * fill_price
-        if notional > state.cash:
-            return 0.0
-
-        existing = state.positions.get(symbol)
-        if existing is None:
-            state.positions[symbol] = Position(
-                symbol=symbol,
-                quantity=quantity,
-                cost_basis=fill_price,
-            )
-            state.cash -= notional
-            return quantity
-
-        new_quantity = existing.quantity + quantity
-        new_cost_basis = (
-            existing.quantity * existing.cost_basis + quantity * fill_price
-        ) / new_quantity
-        state.positions[symbol] = Position(
-            symbol=symbol,
-            quantity=new_quantity,
-            cost_basis=new_cost_basis,
-        )
-        state.cash -= notional
-        return quantity
-
-    def _apply_sell_fill(
-        self, state: PortfolioState, symbol: str, quantity: float, fill_price: float
-    ) -> float:
-        existing = state.positions.get(symbol)
-        if existing is None or existing.quantity <= 0:
-            return 0.0
-
-        sell_quantity = min(quantity, existing.quantity)
-        if sell_quantity <= 0:
-            return 0.0
-
-        state.cash += sell_quantity * fill_price
-        remaining_quantity = existing.quantity - sell_quantity
-        if remaining_quantity <= 0:
-            del state.positions[symbol]
-            return sell_quantity
-
-        state.positions[symbol] = Position(
-            symbol=symbol,
-            quantity=remaining_quantity,
-            cost_basis=existing.cost_basis,
-        )
-        return sell_quantity
-
-    def _compute_equity(
-        self, state: PortfolioState, last_close_by_symbol: dict[str, float]
-    ) -> float:
-        equity = state.cash
-        for position in state.positions.values():
-            mark = last_close_by_symbol.get(position.symbol, position.cost_basis)
-            equity += position.quantity * mark
-        return equity
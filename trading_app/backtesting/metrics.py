@@ -7,6 +7,7 @@ import statistics
 from typing import Mapping
 
 from trading_app.backtesting.results import BacktestResult
+from trading_app.utils.time import elapsed_seconds
 
 
 def summarize(
@@ -94,8 +95,8 @@ def _cagr(result: BacktestResult, initial_equity: float, final_equity: float) ->
         return 0.0
     start = result.equity_curve[0].timestamp
     end = result.equity_curve[-1].timestamp
-    elapsed_seconds = (end - start).total_seconds()
-    if elapsed_seconds <= 0:
+    elapsed = elapsed_seconds(start, end)
+    if elapsed <= 0:
         return 0.0
-    years = elapsed_seconds / (365.25 * 24 * 60 * 60)
+    years = elapsed / (365.25 * 24 * 60 * 60)
     return (final_equity / initial_equity) ** (1.0 / years) - 1.0
@@ -11,9 +11,12 @@ from trading_app.portfolio.models import PortfolioState
 
 @dataclass(frozen=True)
 class EquityPoint:
-    """One timestamped equity observation in the backtest timeline."""
+    """One timestamped equity observation in the backtest timeline.
 
-    timestamp: datetime
+    ``timestamp`` is an int of UTC nanoseconds when the engine runs with ``ns=True``.
+    """
+
+    timestamp: datetime | int
     equity: float
 
 
@@ -21,7 +24,7 @@ class EquityPoint:
 class TradeRecord:
     """Executed trade details captured during the backtest run."""
 
-    timestamp: datetime
+    timestamp: datetime | int
     symbol: str
     side: OrderSide
     quantity: float
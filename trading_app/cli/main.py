@@ -7,8 +7,21 @@ from datetime import datetime
 from pathlib import Path
 from typing import Sequence
 
+from trading_app.data.ingestion import IngestionScheduler, RetryPolicy
+from trading_app.data.pipeline import DataPipeline
+from trading_app.data.resampling import BarResampler
+from trading_app.data.sources.base import MarketDataSource
+from trading_app.data.sources.caching import CachingMarketDataSource
+from trading_app.data.sources.synthetic import SyntheticMarketDataSource
 from trading_app.data.sources.yfinance_source import YFinanceSource
+from trading_app.data.storage.maintenance import DEFAULT_ROW_GROUP_SIZE, compact_store
 from trading_app.data.storage.parquet_store import ParquetDataStore
+from trading_app.data.validation import PriceValidator
+
+
+INGESTION_STATUS_FILE = "ingestion_status.json"
+QUARANTINE_DIR = "quarantine"
+AGGREGATES_DIR = "aggregates"
 
 
 def _parse_datetime(raw: str | None) -> datetime | None:
@@ -27,11 +40,60 @@ def _build_parser() -> argparse.ArgumentParser:
     ingest.add_argument("--store-path", default="data", help="Root path for parquet files")
     ingest.add_argument("--start", help="ISO datetime/date (inclusive)")
     ingest.add_argument("--end", help="ISO datetime/date (exclusive)")
+    ingest.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only fetch windows missing from the store (after the last stored bar, gaps)",
+    )
+    ingest.add_argument("--chunk-size", type=int, default=100, help="Symbols per request")
+    ingest.add_argument("--workers", type=int, default=4, help="Chunks fetched in parallel")
+    ingest.add_argument(
+        "--rate", type=float, default=2.0, help="Maximum requests per second (0 disables)"
+    )
+    ingest.add_argument(
+        "--max-retries", type=int, default=3, help="Retries per chunk after the first attempt"
+    )
+    ingest.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip chunks recorded as done by a previous run",
+    )
+    ingest.add_argument(
+        "--cache-dir", help="Cache upstream responses on disk and reuse covered ranges"
+    )
+    ingest.add_argument(
+        "--offline",
+        action="store_true",
+        help="Serve only from --cache-dir; never call the upstream source",
+    )
+    ingest.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Store bars without data-quality checks (by default failures are quarantined)",
+    )
+    ingest.add_argument(
+        "--with-actions",
+        action="store_true",
+        help="Also store split/dividend events used by adjusted reads",
+    )
+    ingest.add_argument(
+        "--resample",
+        nargs="+",
+        metavar="FREQ",
+        help="Update stored aggregates of these frequencies (e.g. W M) for new bars",
+    )
+    ingest.add_argument(
+        "--report",
+        help="Write per-stage timings of the run to this path (.parquet, otherwise JSON)",
+    )
 
     latest = subparsers.add_parser("show-latest-prices", help="Show latest stored bars")
     latest.add_argument("symbols", nargs="+", help="Ticker symbols")
     latest.add_argument("--store-path", default="data", help="Root path for parquet files")
     latest.add_argument("--limit", type=int, default=1, help="Bars to load per symbol")
+    latest.add_argument(
+        "--adjusted", action="store_true", help="Apply stored split/dividend adjustments"
+    )
 
     dry_run = subparsers.add_parser(
         "backtest-dry-run",
@@ -42,23 +104,117 @@ def _build_parser() -> argparse.ArgumentParser:
     dry_run.add_argument("--starting-cash", type=float, default=100_000.0, help="Starting cash")
     dry_run.add_argument("--bars-limit", type=int, default=252, help="How many bars to inspect")
 
+    compact = subparsers.add_parser(
+        "compact-store",
+        help="Rewrite stored parquet files sorted, re-chunked and recompressed",
+    )
+    compact.add_argument("symbols", nargs="*", help="Limit compaction to these symbols")
+    compact.add_argument("--store-path", default="data", help="Root path for parquet files")
+    compact.add_argument(
+        "--row-group-size",
+        type=int,
+        default=DEFAULT_ROW_GROUP_SIZE,
+        help="Rows per parquet row group",
+    )
+    compact.add_argument("--compression", default="zstd", help="Parquet compression codec")
+    compact.add_argument("--workers", type=int, default=4, help="Files compacted in parallel")
+
+    synthetic = subparsers.add_parser(
+        "generate-synthetic",
+        help="Write a deterministic synthetic price universe into the store",
+    )
+    synthetic.add_argument("--store-path", default="data", help="Root path for parquet files")
+    synthetic.add_argument("--symbols", type=int, default=100, help="Number of symbols")
+    synthetic.add_argument("--bars", type=int, default=2520, help="Bars per symbol")
+    synthetic.add_argument("--seed", type=int, default=0, help="Random seed")
+    synthetic.add_argument(
+        "--block-size", type=int, default=256, help="Symbols generated per store write"
+    )
+
+    resample = subparsers.add_parser(
+        "resample", help="Build or update weekly/monthly/custom aggregates of stored bars"
+    )
+    resample.add_argument("symbols", nargs="*", help="Symbols to resample (default: all stored)")
+    resample.add_argument("--store-path", default="data", help="Root path for parquet files")
+    resample.add_argument(
+        "--frequency",
+        nargs="+",
+        default=["W", "M"],
+        help="Bin frequencies: W, M, Q, Y or a pandas alias such as 5D or W-MON",
+    )
+    resample.add_argument(
+        "--full", action="store_true", help="Recompute all history instead of updating"
+    )
+
     return parser
 
 
 def _handle_ingest_history(args: argparse.Namespace) -> int:
+    if args.offline and not args.cache_dir:
+        print("--offline requires --cache-dir.")
+        return 2
     store = ParquetDataStore(args.store_path)
-    source = YFinanceSource()
+    source: MarketDataSource = YFinanceSource()
+    if args.cache_dir:
+        source = CachingMarketDataSource(source, args.cache_dir, offline=args.offline)
+
+    validator = (
+        None
+        if args.no_validate
+        else PriceValidator(quarantine_dir=Path(args.store_path) / QUARANTINE_DIR)
+    )
+    resampler = (
+        BarResampler(store, Path(args.store_path) / AGGREGATES_DIR, frequencies=args.resample)
+        if args.resample
+        else None
+    )
+    pipeline = DataPipeline(
+        store=store, market_sources=[source], validator=validator, resampler=resampler
+    )
+    scheduler = IngestionScheduler(
+        pipeline,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        rate=None if args.offline else args.rate or None,
+        # Cache misses in offline mode cannot succeed on retry.
+        retry=RetryPolicy(max_attempts=1 if args.offline else args.max_retries + 1),
+        status_path=Path(args.store_path) / INGESTION_STATUS_FILE,
+    )
 
     start = _parse_datetime(args.start)
     end = _parse_datetime(args.end)
 
-    bars = list(source.fetch_history(args.symbols, start=start, end=end))
-    if bars:
-        store.save_prices(bars)
+    report = scheduler.run(
+        args.symbols, start=start, end=end, incremental=args.incremental, resume=args.resume
+    )
+    store.flush()
     print(
-        f"Ingested {len(bars)} bars for {len(args.symbols)} symbol(s) into "
+        f"Ingested {report.rows} bars for {len(args.symbols)} symbol(s) into "
         f"{Path(args.store_path).resolve()}."
     )
+    if validator is not None and validator.summary.quarantined:
+        failures = ", ".join(
+            f"{rule}={count}" for rule, count in validator.summary.failures.items() if count
+        )
+        print(
+            f"Quarantined {validator.summary.quarantined} bar(s) failing checks ({failures}) "
+            f"to {validator.quarantine_dir}."
+        )
+    if args.with_actions and args.offline:
+        print("Skipped corporate actions: they are not cached (offline mode).")
+    elif args.with_actions:
+        actions = pipeline.ingest_actions(args.symbols, start=start, end=end)
+        print(f"Stored {actions} corporate action(s).")
+    if report.skipped:
+        print(f"Skipped {report.skipped} chunk(s) already completed by a previous run.")
+    for chunk in report.failed:
+        print(f"Failed chunk after {chunk.attempts} attempt(s): {chunk.key} ({chunk.error})")
+    if args.report:
+        report_path = pipeline.context.write_report(args.report)
+        print(f"Wrote run report {pipeline.context.run_id} to {report_path}.")
+    if report.failed:
+        print("Re-run with --resume to retry only the failed chunks.")
+        return 1
     return 0
 
 
@@ -67,7 +223,13 @@ def _handle_show_latest_prices(args: argparse.Namespace) -> int:
     any_found = False
 
     for symbol in args.symbols:
-        bars = store.load_prices(symbol, limit=args.limit)
+        if args.adjusted:
+            bars = store.load_prices(symbol, limit=args.limit, adjusted=True)
+        elif args.limit == 1:
+            latest_bar = store.latest_bar(symbol)
+            bars = [latest_bar] if latest_bar is not None else []
+        else:
+            bars = store.load_prices(symbol, limit=args.limit)
         if not bars:
             print(f"{symbol}: no stored prices found")
             continue
@@ -93,6 +255,61 @@ def _handle_backtest_dry_run(args: argparse.Namespace) -> int:
     return 0
 
 
+def _handle_compact_store(args: argparse.Namespace) -> int:
+    store = ParquetDataStore(args.store_path)
+    report = compact_store(
+        store,
+        symbols=args.symbols or None,
+        row_group_size=args.row_group_size,
+        compression=args.compression,
+        workers=args.workers,
+    )
+    if not report.files:
+        print("No parquet files to compact.")
+        return 0
+
+    saved_pct = 100.0 * report.bytes_saved / report.bytes_before if report.bytes_before else 0.0
+    print(f"Compacted {len(report.files)} file(s) in {Path(args.store_path).resolve()}.")
+    print(f"bytes_before={report.bytes_before}")
+    print(f"bytes_after={report.bytes_after}")
+    print(f"bytes_saved={report.bytes_saved} ({saved_pct:.1f}%)")
+    print(f"read_speedup={report.read_speedup:.2f}x")
+    return 0
+
+
+def _handle_generate_synthetic(args: argparse.Namespace) -> int:
+    store = ParquetDataStore(args.store_path)
+    source = SyntheticMarketDataSource(seed=args.seed, bars=args.bars)
+    symbols = SyntheticMarketDataSource.universe(args.symbols)
+    rows = source.write_to_store(store, symbols, block_size=args.block_size)
+    store.flush()
+    print(
+        f"Wrote {rows} synthetic bars for {len(symbols)} symbol(s) "
+        f"({symbols[0]}..{symbols[-1]}) into {Path(args.store_path).resolve()}."
+    )
+    return 0
+
+
+def _handle_resample(args: argparse.Namespace) -> int:
+    store = ParquetDataStore(args.store_path)
+    symbols = args.symbols or store.list_symbols()
+    if not symbols:
+        print("No stored symbols to resample.")
+        return 1
+    resampler = BarResampler(
+        store, Path(args.store_path) / AGGREGATES_DIR, frequencies=args.frequency
+    )
+    if args.full:
+        bins = resampler.build(symbols)
+    else:
+        bins = resampler.update(symbols)
+    print(
+        f"Wrote {bins} {'/'.join(resampler.frequencies)} bin(s) for {len(symbols)} symbol(s) "
+        f"into {resampler.root_path.resolve()}."
+    )
+    return 0
+
+
 def main(argv: Sequence[str] | None = None) -> int:
     """Parse command line arguments and execute the requested action."""
     parser = _build_parser()
@@ -104,6 +321,12 @@ def main(argv: Sequence[str] | None = None) -> int:
         return _handle_show_latest_prices(args)
     if args.command == "backtest-dry-run":
         return _handle_backtest_dry_run(args)
+    if args.command == "compact-store":
+        return _handle_compact_store(args)
+    if args.command == "generate-synthetic":
+        return _handle_generate_synthetic(args)
+    if args.command == "resample":
+        return _handle_resample(args)
     parser.error(f"Unknown command: {args.command}")
     return 2
 
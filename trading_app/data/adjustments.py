@@ -0,0 +1,180 @@
+"""Split/dividend adjustment factors applied to stored prices at read time."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Callable, Hashable, Iterable
+
+import numpy as np
+import pandas as pd
+
+from trading_app.data.schemas import CorporateAction
+
+ACTION_COLUMNS = ["symbol", "ex_date", "kind", "value", "provider"]
+ACTION_KINDS = ("split", "dividend")
+
+
+def actions_to_frame(actions: Iterable[CorporateAction]) -> pd.DataFrame:
+    """Build an ``ACTION_COLUMNS`` frame, validating kinds and values."""
+    actions = list(actions)
+    for action in actions:
+        if action.kind not in ACTION_KINDS:
+            raise ValueError(f"Unknown corporate action kind: {action.kind!r}")
+        if not action.value > 0:
+            raise ValueError(f"Corporate action value must be positive: {action}")
+    return pd.DataFrame(
+        {
+            "symbol": [action.symbol for action in actions],
+            "ex_date": pd.to_datetime([action.ex_date for action in actions], utc=True),
+            "kind": [action.kind for action in actions],
+            "value": np.asarray([action.value for action in actions], dtype="float64"),
+            "provider": [action.provider for action in actions],
+        },
+        columns=ACTION_COLUMNS,
+    )
+
+
+def frame_to_actions(df: pd.DataFrame) -> list[CorporateAction]:
+    return [
+        CorporateAction(
+            symbol=symbol,
+            ex_date=ex_date,
+            kind=kind,
+            value=value,
+            provider=None if provider is None or provider != provider else provider,
+        )
+        for symbol, ex_date, kind, value, provider in zip(
+            df["symbol"].tolist(),
+            pd.DatetimeIndex(df["ex_date"]).to_pydatetime(),
+            df["kind"].tolist(),
+            df["value"].astype("float64").tolist(),
+            df["provider"].tolist(),
+        )
+    ]
+
+
+def _ns(values: pd.Series | pd.DatetimeIndex) -> np.ndarray:
+    return pd.DatetimeIndex(values).as_unit("ns").asi8
+
+
+@dataclass(frozen=True)
+class AdjustmentFactors:
+    """Cumulative backward-adjustment factors for one symbol.
+
+    ``ex_dates`` holds the sorted event dates (UTC nanoseconds). ``price[k]`` and
+    ``volume[k]`` apply to bars preceded by exactly ``k`` events, so the last
+    entry is always 1 and the latest prices are left unchanged. A split of
+    ratio ``r`` scales earlier prices by ``1 / r`` and volumes by ``r``; a
+    dividend ``d`` scales earlier prices by ``1 - d / close`` using the last
+    close before its ex-date (the usual total-return convention).
+    """
+
+    ex_dates: np.ndarray
+    price: np.ndarray
+    volume: np.ndarray
+
+    @classmethod
+    def identity(cls) -> AdjustmentFactors:
+        return cls(np.empty(0, dtype="int64"), np.ones(1), np.ones(1))
+
+    @classmethod
+    def from_actions(cls, actions: pd.DataFrame, previous_close: np.ndarray) -> AdjustmentFactors:
+        """Build factors from an ``ACTION_COLUMNS`` frame sorted by ``ex_date``.
+
+        ``previous_close`` holds, per action, the last raw close before its
+        ex-date (NaN when unknown; such dividends are ignored).
+        """
+        if actions.empty:
+            return cls.identity()
+        values = actions["value"].to_numpy(dtype="float64")
+        splits = (actions["kind"] == "split").to_numpy()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dividend = 1.0 - values / previous_close
+        dividend = np.where(np.isfinite(dividend) & (dividend > 0), dividend, 1.0)
+        price_step = np.where(splits, 1.0 / values, dividend)
+        volume_step = np.where(splits, values, 1.0)
+        return cls(
+            ex_dates=_ns(actions["ex_date"]),
+            price=_suffix_products(price_step),
+            volume=_suffix_products(volume_step),
+        )
+
+    @property
+    def empty(self) -> bool:
+        return len(self.ex_dates) == 0
+
+    def factors_at(self, timestamps: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+        """(price, volume) factors for each timestamp, via one ``searchsorted``."""
+        events_before = np.searchsorted(self.ex_dates, _ns(timestamps), side="right")
+        return self.price[events_before], self.volume[events_before]
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Return a copy of price frame ``df`` with adjusted OHLC and volume."""
+        if self.empty or df.empty:
+            return df
+        price, volume = self.factors_at(df["timestamp"])
+        out = df.copy()
+        for column in ("open", "high", "low", "close"):
+            out[column] = out[column].to_numpy(dtype="float64") * price
+        out["volume"] = out["volume"].to_numpy(dtype="float64") * volume
+        return out
+
+
+def _suffix_products(steps: np.ndarray) -> np.ndarray:
+    """``out[k] = prod(steps[k:])`` with a trailing 1."""
+    return np.append(np.cumprod(steps[::-1])[::-1], 1.0)
+
+
+def previous_closes(ex_dates: pd.Series, timestamps: pd.Series, closes: np.ndarray) -> np.ndarray:
+    """Last close strictly before each ex-date (NaN when there is none)."""
+    stamps = _ns(timestamps)
+    position = np.searchsorted(stamps, _ns(ex_dates), side="left") - 1
+    out = np.full(len(position), np.nan)
+    known = position >= 0
+    out[known] = np.asarray(closes, dtype="float64")[position[known]]
+    return out
+
+
+class FactorCache:
+    """Thread-safe per-symbol cache of ``AdjustmentFactors``.
+
+    ``build(symbol)`` computes factors on a miss. ``signature(symbol)`` (optional)
+    returns a value describing the inputs, e.g. file stats; a changed signature
+    rebuilds the entry, so events written by another process are picked up.
+    ``invalidate`` drops an entry explicitly, e.g. after new events or prices.
+    """
+
+    def __init__(
+        self,
+        build: Callable[[str], AdjustmentFactors],
+        signature: Callable[[str], Hashable] | None = None,
+    ) -> None:
+        self._build = build
+        self._signature = signature
+        self._entries: dict[str, tuple[Hashable, AdjustmentFactors]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, symbol: str) -> AdjustmentFactors:
+        signature = self._signature(symbol) if self._signature is not None else None
+        with self._lock:
+            entry = self._entries.get(symbol)
+            generation = self._generation
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+        factors = self._build(symbol)
+        with self._lock:
+            # Skip caching when an invalidation raced with the build.
+            if generation == self._generation:
+                self._entries[symbol] = (signature, factors)
+        return factors
+
+    def invalidate(self, symbol: str) -> None:
+        with self._lock:
+            self._entries.pop(symbol, None)
+            self._generation += 1
+
+    def __contains__(self, symbol: str) -> bool:
+        with self._lock:
+            return symbol in self._entries
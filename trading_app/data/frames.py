@@ -0,0 +1,138 @@
+"""Columnar (DataFrame) representations of the shared data models."""
+
+from __future__ import annotations
+
+import sys
+from typing import Iterable, Sequence
+
+import numpy as np
+import pandas as pd
+
+from trading_app.data.schemas import CompactPriceBar, PriceBar
+
+PRICE_COLUMNS = ["symbol", "timestamp", "open", "high", "low", "close", "volume", "provider"]
+_UTC_NS = pd.DatetimeTZDtype(unit="ns", tz="UTC")
+
+
+def bars_to_frame(bars: Iterable[PriceBar | CompactPriceBar]) -> pd.DataFrame:
+    """Build a price frame with ``PRICE_COLUMNS`` from ``PriceBar`` or ``CompactPriceBar`` objects."""
+    bars = list(bars)
+    if bars and all(isinstance(bar, CompactPriceBar) for bar in bars):
+        # Already integer nanoseconds: no datetime objects are built or parsed.
+        timestamps = pd.DatetimeIndex(
+            np.fromiter((bar.ts_ns for bar in bars), dtype="int64", count=len(bars)), tz="UTC"
+        )
+    else:
+        timestamps = pd.to_datetime([bar.timestamp for bar in bars], utc=True)
+    return pd.DataFrame(
+        {
+            "symbol": [bar.symbol for bar in bars],
+            "timestamp": timestamps,
+            "open": [bar.open for bar in bars],
+            "high": [bar.high for bar in bars],
+            "low": [bar.low for bar in bars],
+            "close": [bar.close for bar in bars],
+            "volume": [bar.volume for bar in bars],
+            "provider": [bar.provider for bar in bars],
+        },
+        columns=PRICE_COLUMNS,
+    )
+
+
+def normalize_price_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Coerce a price frame to ``PRICE_COLUMNS`` with UTC timestamps and float prices."""
+    out = df.reindex(columns=PRICE_COLUMNS)
+    out["timestamp"] = utc_timestamps(out["timestamp"])
+    for column in ("open", "high", "low", "close", "volume"):
+        out[column] = out[column].astype("float64")
+    out["provider"] = out["provider"].astype(object).where(out["provider"].notna(), None)
+    return out
+
+
+def utc_timestamps(values: pd.Series) -> pd.Series:
+    """``values`` as ``datetime64[ns, UTC]``; integers are read as UTC nanoseconds.
+
+    Columns that already have that dtype are returned as they are.
+    """
+    if values.dtype == _UTC_NS:
+        return values
+    if pd.api.types.is_integer_dtype(values.dtype):
+        return pd.Series(pd.DatetimeIndex(values.to_numpy(), tz="UTC"), index=values.index)
+    return pd.to_datetime(values, utc=True).dt.as_unit("ns")
+
+
+def frame_to_bars(df: pd.DataFrame) -> list[PriceBar]:
+    """Materialize ``PriceBar`` objects from a price frame, column by column."""
+    if df.empty:
+        return []
+    timestamps = pd.DatetimeIndex(df["timestamp"]).to_pydatetime()
+    volumes = df["volume"].astype("float64").to_numpy()
+    providers = df["provider"].to_numpy(dtype=object)
+    return [
+        PriceBar(
+            symbol=symbol,
+            timestamp=timestamp,
+            open=open_,
+            high=high,
+            low=low,
+            close=close,
+            volume=None if volume != volume else volume,
+            provider=None if provider is None or provider != provider else provider,
+        )
+        for symbol, timestamp, open_, high, low, close, volume, provider in zip(
+            df["symbol"].to_numpy(dtype=object),
+            timestamps,
+            df["open"].astype("float64").tolist(),
+            df["high"].astype("float64").tolist(),
+            df["low"].astype("float64").tolist(),
+            df["close"].astype("float64").tolist(),
+            volumes.tolist(),
+            providers,
+        )
+    ]
+
+
+def frame_to_compact_bars(df: pd.DataFrame) -> list[CompactPriceBar]:
+    """Materialize ``CompactPriceBar`` objects from a price frame.
+
+    Each distinct symbol/provider is interned once and shared by every bar.
+    """
+    if df.empty:
+        return []
+    volumes = df["volume"].astype("float64").to_numpy()
+    return [
+        CompactPriceBar(
+            symbol,
+            ts_ns,
+            open_,
+            high,
+            low,
+            close,
+            None if volume != volume else volume,
+            provider,
+        )
+        for symbol, ts_ns, open_, high, low, close, volume, provider in zip(
+            interned_names(df["symbol"]),
+            pd.DatetimeIndex(df["timestamp"]).as_unit("ns").asi8.tolist(),
+            df["open"].astype("float64").tolist(),
+            df["high"].astype("float64").tolist(),
+            df["low"].astype("float64").tolist(),
+            df["close"].astype("float64").tolist(),
+            volumes.tolist(),
+            interned_names(df["provider"]),
+        )
+    ]
+
+
+def interned_names(values: pd.Series) -> list[str | None]:
+    """Column of names as a list sharing one interned string per distinct value."""
+    codes, uniques = pd.factorize(values)
+    # Missing values get code -1, which picks the trailing ``None``.
+    table = np.array([sys.intern(str(name)) for name in uniques] + [None], dtype=object)
+    return table[codes].tolist()
+
+
+def provider_rank(providers: pd.Series, priority: Sequence[str]) -> np.ndarray:
+    """Rank each row's provider by ``priority`` (0 = most preferred, unlisted last)."""
+    ranks = {provider: position for position, provider in enumerate(priority)}
+    return providers.map(ranks).fillna(len(priority)).to_numpy(dtype="int64")
@@ -0,0 +1,226 @@
+"""Chunked, rate-limited and resumable ingestion of large symbol universes."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Sequence
+
+from trading_app.data.pipeline import DataPipeline
+from trading_app.data.storage.catalog import DateRange
+from trading_app.data.storage.locking import atomic_write, file_lock
+
+STATUS_FORMAT_VERSION = 1
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing ``rate`` acquisitions per second.
+
+    Up to ``capacity`` tokens accumulate while idle, so short bursts pass
+    immediately and sustained load is smoothed to ``rate``.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            self._sleep(wait)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff: ``base_delay * multiplier**n`` capped at ``max_delay``."""
+
+    max_attempts: int = 4
+    base_delay: float = 1.0
+    multiplier: float = 2.0
+    max_delay: float = 30.0
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait after failed attempt number ``attempt`` (1-based)."""
+        return min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+
+
+@dataclass
+class ChunkStatus:
+    """Outcome of one chunk of symbols for one time window."""
+
+    key: str
+    symbols: list[str]
+    start: str | None
+    end: str | None
+    state: str = "pending"  # pending | done | failed
+    attempts: int = 0
+    rows: int = 0
+    error: str | None = None
+
+
+@dataclass
+class IngestionReport:
+    """Per-chunk statuses of one scheduler run."""
+
+    chunks: list[ChunkStatus] = field(default_factory=list)
+    skipped: int = 0
+
+    @property
+    def rows(self) -> int:
+        return sum(chunk.rows for chunk in self.chunks)
+
+    @property
+    def failed(self) -> list[ChunkStatus]:
+        return [chunk for chunk in self.chunks if chunk.state == "failed"]
+
+
+class IngestionScheduler:
+    """Runs history ingestion in symbol chunks on a bounded worker pool.
+
+    Every chunk is fetched behind a token-bucket rate limit, retried with
+    exponential backoff, and written to the store as soon as it completes, so
+    memory is bounded by ``workers * chunk_size`` symbols. Chunk outcomes are
+    recorded in ``status_path`` after each chunk; ``run(..., resume=True)`` skips
+    chunks already marked done there.
+    """
+
+    def __init__(
+        self,
+        pipeline: DataPipeline,
+        chunk_size: int = 100,
+        workers: int = 4,
+        rate: float | None = None,
+        retry: RetryPolicy = RetryPolicy(),
+        status_path: str | Path | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive.")
+        self.pipeline = pipeline
+        self.chunk_size = chunk_size
+        self.workers = max(1, workers)
+        self.retry = retry
+        self.status_path = Path(status_path) if status_path is not None else None
+        self._sleep = sleep
+        self._bucket = TokenBucket(rate, capacity=self.workers, sleep=sleep) if rate else None
+        self._status_lock = threading.Lock()
+        self._statuses: dict[str, ChunkStatus] = {}
+
+    def run(
+        self,
+        symbols: Sequence[str],
+        start: datetime | None = None,
+        end: datetime | None = None,
+        incremental: bool = False,
+        resume: bool = False,
+    ) -> IngestionReport:
+        """Ingest ``symbols`` chunk by chunk and return the per-chunk outcome."""
+        if incremental:
+            plan = self.pipeline.plan_incremental(symbols, start=start, end=end)
+        else:
+            plan = {(start, end): list(symbols)} if symbols else {}
+
+        previous = self._load_statuses() if resume else {}
+        self._statuses = dict(previous)
+        report = IngestionReport()
+        pending: list[tuple[ChunkStatus, DateRange]] = []
+        for window, chunk in self._chunks(plan):
+            key = self._chunk_key(chunk, window)
+            done = previous.get(key)
+            if done is not None and done.state == "done":
+                report.skipped += 1
+                continue
+            status = ChunkStatus(
+                key=key,
+                symbols=chunk,
+                start=window[0].isoformat() if window[0] is not None else None,
+                end=window[1].isoformat() if window[1] is not None else None,
+            )
+            self._statuses[key] = status
+            pending.append((status, window))
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            report.chunks = list(executor.map(lambda job: self._run_chunk(*job), pending))
+        return report
+
+    # ---------- Internal helpers ----------
+    def _chunks(self, plan: dict[DateRange, list[str]]) -> list[tuple[DateRange, list[str]]]:
+        return [
+            (window, window_symbols[offset : offset + self.chunk_size])
+            for window, window_symbols in plan.items()
+            for offset in range(0, len(window_symbols), self.chunk_size)
+        ]
+
+    @staticmethod
+    def _chunk_key(symbols: Sequence[str], window: DateRange) -> str:
+        bounds = [bound.isoformat() if bound is not None else "" for bound in window]
+        return f"{bounds[0]}|{bounds[1]}|{','.join(symbols)}"
+
+    def _run_chunk(self, status: ChunkStatus, window: DateRange) -> ChunkStatus:
+        while True:
+            status.attempts += 1
+            if self._bucket is not None:
+                self._bucket.acquire()
+            try:
+                status.rows = self.pipeline.ingest_window(
+                    status.symbols, start=window[0], end=window[1]
+                )
+            except Exception as exc:  # noqa: BLE001 - any upstream failure is retryable
+                status.error = f"{type(exc).__name__}: {exc}"
+                if status.attempts >= self.retry.max_attempts:
+                    status.state = "failed"
+                    break
+                for symbol in status.symbols:
+                    self.pipeline.context.record("fetch", symbol=symbol, retries=1)
+                self._sleep(self.retry.delay(status.attempts))
+                continue
+            status.state = "done"
+            status.error = None
+            break
+        self._persist_statuses()
+        return status
+
+    def _load_statuses(self) -> dict[str, ChunkStatus]:
+        if self.status_path is None or not self.status_path.exists():
+            return {}
+        payload = json.loads(self.status_path.read_text())
+        return {chunk["key"]: ChunkStatus(**chunk) for chunk in payload.get("chunks", [])}
+
+    def _persist_statuses(self) -> None:
+        if self.status_path is None:
+            return
+        with self._status_lock:
+            payload = {
+                "format_version": STATUS_FORMAT_VERSION,
+                "chunks": [asdict(status) for status in self._statuses.values()],
+            }
+            text = json.dumps(payload, indent=2)
+            self.status_path.parent.mkdir(parents=True, exist_ok=True)
+            with file_lock(self.status_path):
+                atomic_write(self.status_path, lambda tmp_path: tmp_path.write_text(text))
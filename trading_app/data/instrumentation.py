@@ -0,0 +1,194 @@
+"""Per-stage timing and throughput records for pipeline runs."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import uuid
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, ContextManager, Iterator
+
+import pandas as pd
+
+from trading_app.data.storage.locking import atomic_write
+
+STAGES: tuple[str, ...] = ("fetch", "transform", "validate", "dedup", "write")
+REPORT_FORMAT_VERSION = 1
+
+
+@dataclass
+class StageStats:
+    """Accumulated measurements for one (stage, source, symbol) key."""
+
+    stage: str
+    source: str | None = None
+    symbol: str | None = None
+    calls: int = 0
+    wall_seconds: float = 0.0
+    rows: int = 0
+    bytes_written: int = 0
+    retries: int = 0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def merge(self, other: StageStats) -> None:
+        self.calls += other.calls
+        self.wall_seconds += other.wall_seconds
+        self.rows += other.rows
+        self.bytes_written += other.bytes_written
+        self.retries += other.retries
+
+
+class PipelineContext:
+    """Per-run instrumentation shared by a pipeline, its scheduler and its store.
+
+    Work is measured per stage — ``fetch`` (source calls), ``transform``
+    (building and normalizing frames), ``validate`` (data-quality checks),
+    ``dedup`` (merging with stored rows) and ``write`` (persisting files) — and
+    keyed by source and/or symbol. Measurements from concurrent threads are
+    merged under a lock, so one context can be shared by every worker of a
+    run. ``report()`` returns one row per key and ``write_report`` saves it as
+    JSON or Parquet.
+    """
+
+    def __init__(
+        self, run_id: str | None = None, clock: Callable[[], float] = time.perf_counter
+    ) -> None:
+        self.run_id = run_id or uuid.uuid4().hex
+        self.started_at = datetime.now(timezone.utc)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stats: dict[tuple[str, str | None, str | None], StageStats] = {}
+
+    @contextmanager
+    def stage(
+        self, stage: str, source: str | None = None, symbol: str | None = None
+    ) -> Iterator[StageStats]:
+        """Time the block as one call of ``stage``.
+
+        Set ``rows`` / ``bytes_written`` on the yielded record inside the block.
+        """
+        record = StageStats(stage=stage, source=source, symbol=symbol, calls=1)
+        started = self._clock()
+        try:
+            yield record
+        finally:
+            record.wall_seconds = self._clock() - started
+            self._merge(record)
+
+    def record(
+        self,
+        stage: str,
+        source: str | None = None,
+        symbol: str | None = None,
+        wall_seconds: float = 0.0,
+        rows: int = 0,
+        bytes_written: int = 0,
+        retries: int = 0,
+    ) -> None:
+        """Add measurements taken elsewhere (e.g. retry counts) without timing a block."""
+        self._merge(
+            StageStats(
+                stage=stage,
+                source=source,
+                symbol=symbol,
+                wall_seconds=wall_seconds,
+                rows=rows,
+                bytes_written=bytes_written,
+                retries=retries,
+            )
+        )
+
+    def _merge(self, record: StageStats) -> None:
+        key = (record.stage, record.source, record.symbol)
+        with self._lock:
+            existing = self._stats.get(key)
+            if existing is None:
+                self._stats[key] = record
+            else:
+                existing.merge(record)
+
+    # ---------- Reports ----------
+    def stats(self) -> list[StageStats]:
+        """Snapshot of every recorded key."""
+        with self._lock:
+            return [StageStats(**asdict(stats)) for stats in self._stats.values()]
+
+    def report(self) -> pd.DataFrame:
+        """One row per (stage, source, symbol) with totals and rows per second."""
+        columns = [
+            "run_id",
+            "stage",
+            "source",
+            "symbol",
+            "calls",
+            "wall_seconds",
+            "rows",
+            "rows_per_second",
+            "bytes_written",
+            "retries",
+        ]
+        records = [
+            {**asdict(stats), "run_id": self.run_id, "rows_per_second": stats.rows_per_second}
+            for stats in self.stats()
+        ]
+        return pd.DataFrame(records, columns=columns)
+
+    def summary(self) -> pd.DataFrame:
+        """Totals per stage, in pipeline order."""
+        report = self.report()
+        totals = report.groupby("stage")[
+            ["calls", "wall_seconds", "rows", "bytes_written", "retries"]
+        ].sum()
+        totals = totals.reindex([stage for stage in STAGES if stage in totals.index])
+        seconds = totals["wall_seconds"].where(totals["wall_seconds"] > 0)
+        totals["rows_per_second"] = (totals["rows"] / seconds).fillna(0.0)
+        return totals
+
+    def slowest_symbols(self, stage: str | None = None, limit: int = 10) -> pd.DataFrame:
+        """Symbols with the most wall time (optionally within one stage)."""
+        report = self.report()
+        report = report[report["symbol"].notna()]
+        if stage is not None:
+            report = report[report["stage"] == stage]
+        per_symbol = report.groupby("symbol")[["wall_seconds", "rows", "retries"]].sum()
+        return per_symbol.sort_values("wall_seconds", ascending=False).head(limit)
+
+    def write_report(self, path: str | Path) -> Path:
+        """Write the report as ``.parquet`` or JSON (any other suffix); returns the path."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        report = self.report()
+        if path.suffix == ".parquet":
+            atomic_write(
+                path, lambda tmp_path: report.to_parquet(tmp_path, engine="pyarrow", index=False)
+            )
+            return path
+        payload = {
+            "format_version": REPORT_FORMAT_VERSION,
+            "run_id": self.run_id,
+            "started_at": self.started_at.isoformat(),
+            "finished_at": datetime.now(timezone.utc).isoformat(),
+            "stages": json.loads(report.to_json(orient="records")),
+        }
+        text = json.dumps(payload, indent=2)
+        atomic_write(path, lambda tmp_path: tmp_path.write_text(text))
+        return path
+
+
+def measure(
+    context: PipelineContext | None,
+    stage: str,
+    source: str | None = None,
+    symbol: str | None = None,
+) -> ContextManager[StageStats]:
+    """``context.stage(...)``, or a throwaway record when instrumentation is off."""
+    if context is None:
+        return nullcontext(StageStats(stage=stage, source=source, symbol=symbol))
+    return context.stage(stage, source=source, symbol=symbol)
@@ -2,35 +2,281 @@
 
 from __future__ import annotations
 
-from typing import Iterable, Sequence
+import itertools
+import queue
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import AsyncIterator, Iterator, Sequence
 
+import pandas as pd
+
+from trading_app.data.frames import bars_to_frame
+from trading_app.data.instrumentation import PipelineContext, measure
+from trading_app.data.resampling import BarResampler
 from trading_app.data.schemas import NewsItem, PriceBar
 from trading_app.data.sources.base import MarketDataSource, NewsDataSource
 from trading_app.data.storage.base import DataStore
+from trading_app.data.storage.catalog import DateRange
+from trading_app.data.streaming import LiveFanIn, OverflowPolicy, SourceStreamStats
+from trading_app.data.validation import PriceValidator
+
+# How often blocked producers and the consumer re-check for shutdown.
+_POLL_SECONDS = 0.05
 
 
 class DataPipeline:
-    """Orchestrates ingestion and normalization of market/news data."""
+    """Orchestrates ingestion and normalization of market/news data.
+
+    History ingestion streams: every market source runs on its own thread and
+    hands bars to the store in frames of at most ``batch_size`` rows through a
+    queue holding at most ``queue_size`` batches, so a slow store throttles the
+    sources and at most that many batches wait for it. Bar-by-bar sources are
+    read one batch at a time, but a source with ``fetch_history_frame`` returns
+    the whole window at once and holds it until it is queued, so its memory
+    grows with the window. When sources overlap, ``provider_priority`` (most
+    preferred provider first) decides which bar is kept for a (symbol,
+    timestamp). It defaults to the names of ``market_sources`` in the order
+    given, so the result never depends on which source thread queued a bar
+    first; bars whose ``provider`` matches no listed name rank last.
+
+    ``context`` (a fresh ``PipelineContext`` by default) records ``fetch`` and
+    ``transform`` time per source. While history is being ingested it is also
+    attached to a store that has no context of its own, so the store's
+    ``dedup``/``write`` stages land in the same run report; it is detached
+    when the last concurrent ingestion finishes, so a store shared with later
+    pipelines reports into theirs.
+
+    With a ``validator`` every fetched frame is checked before it is queued and
+    failing rows never reach the store (see ``PriceValidator``); frames fetched
+    columnar are validated whole, bar-by-bar sources one batch at a time.
+
+    With a ``resampler`` the aggregated bars of every symbol that received new
+    bars are updated incrementally after each window is written.
+    """
 
     def __init__(
         self,
         store: DataStore,
         market_sources: Sequence[MarketDataSource],
         news_sources: Sequence[NewsDataSource] | None = None,
+        batch_size: int = 10_000,
+        queue_size: int = 4,
+        provider_priority: Sequence[str] | None = None,
+        context: PipelineContext | None = None,
+        validator: PriceValidator | None = None,
+        resampler: BarResampler | None = None,
     ) -> None:
+        if batch_size <= 0 or queue_size <= 0:
+            raise ValueError("batch_size and queue_size must be positive.")
         self.store = store
         self.market_sources = list(market_sources)
         self.news_sources = list(news_sources) if news_sources else []
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.provider_priority = (
+            list(provider_priority)
+            if provider_priority
+            else list(dict.fromkeys(source.name for source in self.market_sources))
+        )
+        self.live_stats: dict[str, SourceStreamStats] = {}
+        self.context = context if context is not None else PipelineContext()
+        self.validator = validator
+        self.resampler = resampler
+        self._attach_lock = threading.Lock()
+        self._attached_runs = 0
+
+    def ingest_history(
+        self,
+        symbols: Sequence[str],
+        start: datetime | None = None,
+        end: datetime | None = None,
+        incremental: bool = False,
+    ) -> int:
+        """Fetch historical bars and persist them; returns the number of bars fetched.
 
-    def ingest_history(self, symbols: Sequence[str]) -> None:
-        """Fetch historical bars and persist them."""
+        In incremental mode only the windows the store reports as missing are
+        requested, and symbols sharing the same missing window are fetched in
+        one batched call per source.
+        """
         if not symbols:
+            return 0
+
+        if incremental:
+            plan = self.plan_incremental(symbols, start=start, end=end)
+        else:
+            plan = {(start, end): list(symbols)}
+
+        fetched = 0
+        with self._store_reporting():
+            for (window_start, window_end), window_symbols in plan.items():
+                fetched += self.ingest_window(window_symbols, start=window_start, end=window_end)
+        return fetched
+
+    @contextmanager
+    def _store_reporting(self) -> Iterator[None]:
+        """Attach ``context`` to a context-less store for the duration of a run."""
+        store = self.store
+        with self._attach_lock:
+            if self._attached_runs == 0 and getattr(store, "context", None) is None:
+                store.context = self.context
+            self._attached_runs += 1
+        try:
+            yield
+        finally:
+            with self._attach_lock:
+                self._attached_runs -= 1
+                if self._attached_runs == 0 and getattr(store, "context", None) is self.context:
+                    store.context = None
+
+    def ingest_window(
+        self,
+        symbols: Sequence[str],
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> int:
+        """Stream one window from all market sources into the store; returns the bar count.
+
+        A failure in any source stops the others and is re-raised once batches
+        already queued have been written.
+        """
+        with self._store_reporting():
+            return self._ingest_window(symbols, start, end)
+
+    def _ingest_window(
+        self, symbols: Sequence[str], start: datetime | None, end: datetime | None
+    ) -> int:
+        batches: queue.Queue[pd.DataFrame] = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        errors: list[BaseException] = []
+
+        def produce(source: MarketDataSource) -> None:
+            try:
+                for batch in self._batches(source, symbols, start, end):
+                    while not stop.is_set():
+                        try:
+                            batches.put(batch, timeout=_POLL_SECONDS)
+                            break
+                        except queue.Full:
+                            continue
+                    if stop.is_set():
+                        return
+            except BaseException as exc:  # noqa: BLE001 - re-raised on the calling thread
+                errors.append(exc)
+                stop.set()
+
+        producers = [
+            threading.Thread(target=produce, args=(source,), daemon=True)
+            for source in self.market_sources
+        ]
+        for producer in producers:
+            producer.start()
+
+        written = 0
+        touched: set[str] = set()
+        earliest: pd.Timestamp | None = None
+        try:
+            while True:
+                try:
+                    batch = batches.get(timeout=_POLL_SECONDS)
+                except queue.Empty:
+                    if not any(producer.is_alive() for producer in producers) and batches.empty():
+                        break
+                    continue
+                self.store.save_price_frame(batch, provider_priority=self.provider_priority)
+                written += len(batch)
+                if self.resampler is not None:
+                    touched.update(batch["symbol"].unique())
+                    first = pd.Timestamp(batch["timestamp"].min())
+                    earliest = first if earliest is None else min(earliest, first)
+        finally:
+            stop.set()
+        if errors:
+            raise errors[0]
+        if self.resampler is not None and touched:
+            self.resampler.update(sorted(touched), since=earliest.to_pydatetime())
+        return written
+
+    def _batches(
+        self,
+        source: MarketDataSource,
+        symbols: Sequence[str],
+        start: datetime | None,
+        end: datetime | None,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield a source's bars as price frames of at most ``batch_size`` rows.
+
+        Sources exposing ``fetch_history_frame`` are fetched whole and then sliced
+        columnar; others are consumed lazily so only one batch of ``PriceBar``
+        objects exists at a time.
+        """
+        fetch_frame = getattr(source, "fetch_history_frame", None)
+        if fetch_frame is not None:
+            with measure(self.context, "fetch", source=source.name) as stage:
+                frame = fetch_frame(symbols, start=start, end=end)
+                stage.rows = len(frame)
+            frame = self._validate(frame, source)
+            for offset in range(0, len(frame), self.batch_size):
+                yield frame.iloc[offset : offset + self.batch_size]
             return
+        bars = iter(source.fetch_history(symbols, start=start, end=end))
+        while True:
+            with measure(self.context, "fetch", source=source.name) as stage:
+                batch: list[PriceBar] = list(itertools.islice(bars, self.batch_size))
+                stage.rows = len(batch)
+            if not batch:
+                return
+            with measure(self.context, "transform", source=source.name) as stage:
+                frame = bars_to_frame(batch)
+                stage.rows = len(frame)
+            frame = self._validate(frame, source)
+            if not frame.empty:
+                yield frame
+
+    def _validate(self, frame: pd.DataFrame, source: MarketDataSource) -> pd.DataFrame:
+        if self.validator is None or frame.empty:
+            return frame
+        with measure(self.context, "validate", source=source.name) as stage:
+            frame = self.validator.validate(frame).clean
+            stage.rows = len(frame)
+        return frame
+
+    def plan_incremental(
+        self,
+        symbols: Sequence[str],
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> dict[DateRange, list[str]]:
+        """Group symbols by the windows the store is missing for them."""
+        plan: dict[DateRange, list[str]] = {}
+        for symbol in symbols:
+            for window in self.store.missing_ranges(symbol, start=start, end=end):
+                plan.setdefault(window, []).append(symbol)
+        return plan
+
+    def ingest_actions(
+        self,
+        symbols: Sequence[str],
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> int:
+        """Fetch split/dividend events from sources that provide them; returns the count.
 
+        Sources without a ``fetch_actions`` method are skipped. Storing new
+        events invalidates the store's cached adjustment factors.
+        """
+        count = 0
         for source in self.market_sources:
-            bars = list(source.fetch_history(symbols))
-            if bars:
-                self.store.save_prices(bars)
+            fetch = getattr(source, "fetch_actions", None)
+            if fetch is None:
+                continue
+            with measure(self.context, "fetch", source=source.name) as record:
+                actions = list(fetch(symbols, start=start, end=end))
+                record.rows = len(actions)
+            if actions:
+                self.store.save_actions(actions)
+                count += len(actions)
+        return count
 
     def ingest_news(self, symbols: Sequence[str] | None = None) -> None:
         """Fetch historical news and persist it."""
@@ -42,21 +288,33 @@ class DataPipeline:
             if items:
                 self.store.save_news(items)
 
-    def stream_live(self, symbols: Sequence[str]) -> Iterable[PriceBar]:
-        """Pass-through live stream from the selected source(s)."""
-        if not symbols:
-            return []
+    def stream_live(
+        self,
+        symbols: Sequence[str],
+        buffer_size: int = 1024,
+        policy: OverflowPolicy = "block",
+    ) -> Iterator[PriceBar]:
+        """Merge the live streams of all market sources in arrival order.
 
-        for source in self.market_sources:
-            yield from source.stream_live(symbols)
+        Sources are read concurrently (see ``LiveFanIn``); per-source counters
+        and buffering lag of the latest stream are kept in ``live_stats``.
+        """
+        fan_in = LiveFanIn(self.market_sources, buffer_size=buffer_size, policy=policy)
+        self.live_stats = fan_in.stats
+        yield from fan_in.stream(symbols)
+
+    async def astream_live(
+        self,
+        symbols: Sequence[str],
+        buffer_size: int = 1024,
+        policy: OverflowPolicy = "block",
+    ) -> AsyncIterator[PriceBar]:
+        """Async variant of ``stream_live``."""
+        fan_in = LiveFanIn(self.market_sources, buffer_size=buffer_size, policy=policy)
+        self.live_stats = fan_in.stats
+        async for bar in fan_in.astream(symbols):
+            yield bar
 
     def list_sources(self) -> list[str]:
         """Return registered data source names."""
         return [source.name for source in [*self.market_sources, *self.news_sources]]
-
-
-class PipelineContext:
-    """Placeholder for per-run context (e.g., start/end times, run id)."""
-
-    def __init__(self, run_id: str | None = None) -> None:
-        self.run_id = run_id
@@ -0,0 +1,303 @@
+"""Weekly, monthly and custom-period OHLCV bars aggregated from stored bars."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pandas.tseries.frequencies import to_offset
+
+from trading_app.data.frames import PRICE_COLUMNS
+from trading_app.data.storage.base import DataStore
+from trading_app.data.storage.cache import FileSignature, file_signature
+from trading_app.data.storage.locking import atomic_write, file_lock
+from trading_app.utils.time import ensure_utc
+
+WEEKLY = "W-FRI"
+MONTHLY = "ME"
+QUARTERLY = "QE"
+YEARLY = "YE"
+_ALIASES = {"W": WEEKLY, "M": MONTHLY, "Q": QUARTERLY, "Y": YEARLY}
+AGGREGATE_COLUMNS = [*PRICE_COLUMNS, "bar_count", "last_timestamp"]
+
+_DAY_NS = 86_400_000_000_000
+
+
+def normalize_frequency(frequency: str) -> str:
+    """Canonical pandas alias; ``W``/``M``/``Q``/``Y`` mean Friday/month/quarter/year ends."""
+    offset = to_offset(_ALIASES.get(frequency, frequency))
+    if _fixed_nanos(offset) is None and offset.n != 1:
+        raise ValueError(f"Calendar frequency {frequency!r} must span a single period.")
+    return offset.freqstr
+
+
+def bin_labels(timestamps: pd.Series | pd.DatetimeIndex, frequency: str) -> np.ndarray:
+    """UTC nanosecond label of the bin each timestamp falls in.
+
+    Bins are closed and labelled on the right. With fixed frequencies (``5D``,
+    ``4h``, anchored at the Unix epoch) a bar belongs to the first boundary at
+    or after its timestamp. Calendar frequencies (``W-FRI``, ``ME``, ...) work
+    on whole UTC days: a bar belongs to the first closing day on or after its
+    own day, labelled at 00:00 UTC of that day. A Friday bar at 14:30 therefore
+    closes that week even though it is stamped after the label; compare bins,
+    not raw timestamps against labels.
+    """
+    offset = to_offset(normalize_frequency(frequency))
+    stamps = pd.DatetimeIndex(timestamps).as_unit("ns").asi8
+    step = _fixed_nanos(offset)
+    if step is not None:
+        return -(-stamps // step) * step
+    if len(stamps) == 0:
+        return stamps
+    days = stamps - stamps % _DAY_NS
+    # Bars of one symbol share days in long runs; roll each run's day only once.
+    change = np.empty(len(days), dtype=bool)
+    change[0] = True
+    np.not_equal(days[1:], days[:-1], out=change[1:])
+    starts = np.flatnonzero(change)
+    rolled = (pd.DatetimeIndex(days[starts], tz="UTC") + offset * 0).as_unit("ns").asi8
+    return np.repeat(rolled, np.diff(np.append(starts, len(days))))
+
+
+def _fixed_nanos(offset: pd.DateOffset) -> int | None:
+    if isinstance(offset, pd.offsets.Tick):
+        return int(offset.nanos)
+    if isinstance(offset, pd.offsets.Day):
+        return offset.n * _DAY_NS
+    return None
+
+
+def resample_frame(df: pd.DataFrame, frequency: str) -> pd.DataFrame:
+    """Aggregate a ``PRICE_COLUMNS`` frame of any number of symbols in one pass.
+
+    Each (symbol, bin) becomes one bar: first open, max high, min low, last
+    close, summed volume (missing volume counts as zero) and the last bar's
+    provider, stamped with the bin label. ``bar_count`` and ``last_timestamp``
+    show how much of the bin the source bars covered, so a bin still in
+    progress is recognisable.
+    """
+    if df.empty:
+        return pd.DataFrame(columns=AGGREGATE_COLUMNS)
+    codes, uniques = pd.factorize(df["symbol"])
+    stamps = pd.DatetimeIndex(df["timestamp"]).as_unit("ns").asi8
+    order = None
+    if len(codes) > 1:
+        code_steps = np.diff(codes)
+        if (code_steps < 0).any() or ((np.diff(stamps) < 0) & (code_steps == 0)).any():
+            order = np.lexsort((stamps, codes))
+            codes, stamps = codes[order], stamps[order]
+
+    def column(name: str) -> np.ndarray:
+        values = df[name].to_numpy(dtype="float64" if name != "provider" else object)
+        return values if order is None else values[order]
+
+    labels = bin_labels(stamps, frequency)
+    boundary = np.empty(len(codes), dtype=bool)
+    boundary[0] = True
+    boundary[1:] = (codes[1:] != codes[:-1]) | (labels[1:] != labels[:-1])
+    starts = np.flatnonzero(boundary)
+    ends = np.append(starts[1:], len(codes)) - 1
+    return pd.DataFrame(
+        {
+            "symbol": np.asarray(uniques, dtype=object)[codes[starts]],
+            "timestamp": pd.DatetimeIndex(labels[starts], tz="UTC"),
+            "open": column("open")[starts],
+            "high": np.maximum.reduceat(column("high"), starts),
+            "low": np.minimum.reduceat(column("low"), starts),
+            "close": column("close")[ends],
+            "volume": np.add.reduceat(np.nan_to_num(column("volume")), starts),
+            "provider": column("provider")[ends],
+            "bar_count": ends - starts + 1,
+            "last_timestamp": pd.DatetimeIndex(stamps[ends], tz="UTC"),
+        },
+        columns=AGGREGATE_COLUMNS,
+    )
+
+
+def _after(frame: pd.DataFrame, cutoff: int | None, frequency: str) -> pd.DataFrame:
+    """Rows falling in bins labelled after ``cutoff``.
+
+    Compares bin labels rather than timestamps: bars of a calendar bin can be
+    stamped later on its closing day than the bin's midnight label.
+    """
+    if cutoff is None or frame.empty:
+        return frame
+    return frame[bin_labels(frame["timestamp"], frequency) > cutoff]
+
+
+def _label_ns(table: pa.Table) -> np.ndarray:
+    return table.column("timestamp").cast(pa.timestamp("ns", tz="UTC")).to_numpy().view("int64")
+
+
+class BarResampler:
+    """Builds, persists and incrementally refreshes aggregated bars for a store.
+
+    Aggregates of each frequency live in ``<root_path>/<frequency>/<SYM>.parquet``
+    and are computed from the store's raw bars, ``block_size`` symbols per
+    vectorized pass. ``build`` recomputes full history; ``update`` only re-reads
+    the bars after the last stored bin that new data can touch and rewrites the
+    bins from there on, so appending a day costs one bin, not the whole history.
+    """
+
+    def __init__(
+        self,
+        store: DataStore,
+        root_path: str | Path,
+        frequencies: Sequence[str] = (WEEKLY, MONTHLY),
+        block_size: int = 256,
+    ) -> None:
+        if block_size <= 0:
+            raise ValueError("block_size must be positive.")
+        self.store = store
+        self.root_path = Path(root_path)
+        self.frequencies = [normalize_frequency(frequency) for frequency in frequencies]
+        self.block_size = block_size
+
+    def _path(self, symbol: str, frequency: str) -> Path:
+        return self.root_path / normalize_frequency(frequency) / f"{symbol}.parquet"
+
+    # ---------- Building ----------
+    def build(self, symbols: Sequence[str], frequencies: Sequence[str] | None = None) -> int:
+        """Recompute every bin of ``symbols`` from full history; returns bins written."""
+        return self._run(symbols, self._frequencies(frequencies), since=None, full=True)
+
+    def update(
+        self,
+        symbols: Sequence[str],
+        since: datetime | None = None,
+        frequencies: Sequence[str] | None = None,
+    ) -> int:
+        """Bring stored bins up to date with new raw bars; returns bins rewritten.
+
+        ``since`` is the earliest timestamp among the bars that arrived (use it
+        for backfills); by default only bars after the last complete stored bin
+        are re-read, which covers bars appended at the end. Symbols without
+        stored aggregates are built in full.
+        """
+        return self._run(symbols, self._frequencies(frequencies), since=since, full=False)
+
+    def _run(
+        self, symbols: Sequence[str], frequencies: list[str], since: datetime | None, full: bool
+    ) -> int:
+        since_labels = {
+            frequency: (
+                int(bin_labels(pd.DatetimeIndex([ensure_utc(since)]), frequency)[0])
+                if since is not None
+                else None
+            )
+            for frequency in frequencies
+        }
+        written = 0
+        for offset in range(0, len(symbols), self.block_size):
+            block = symbols[offset : offset + self.block_size]
+            stored = {
+                (symbol, frequency): self._read_stored(symbol, frequency)
+                for symbol in block
+                for frequency in frequencies
+                if not full
+            }
+            cutoffs = {
+                (symbol, frequency): (
+                    None
+                    if full
+                    else self._cutoff(stored[symbol, frequency][1], since_labels[frequency])
+                )
+                for symbol in block
+                for frequency in frequencies
+            }
+            # One raw read per symbol serves every frequency.
+            raw = {
+                symbol: self._load_raw(symbol, [cutoffs[symbol, freq] for freq in frequencies])
+                for symbol in block
+            }
+            for frequency in frequencies:
+                frames = [
+                    _after(raw[symbol], cutoffs[symbol, frequency], frequency)
+                    for symbol in block
+                    if not raw[symbol].empty
+                ]
+                if not frames:
+                    continue
+                aggregates = resample_frame(pd.concat(frames, ignore_index=True), frequency)
+                for symbol, fresh in aggregates.groupby("symbol", sort=False):
+                    key = (str(symbol), frequency)
+                    self._splice(key, fresh, cutoffs[key], stored.get(key, (None, None)))
+                written += len(aggregates)
+        return written
+
+    @staticmethod
+    def _cutoff(stored: pa.Table | None, since_label: int | None) -> int | None:
+        """Last stored label that new bars cannot change (None: rebuild everything)."""
+        if stored is None:
+            return None
+        labels = _label_ns(stored)
+        keep = labels[:-1] if since_label is None else labels[labels < since_label]
+        return int(keep[-1]) if len(keep) else None
+
+    def _load_raw(self, symbol: str, cutoffs: list[int | None]) -> pd.DataFrame:
+        if any(cutoff is None for cutoff in cutoffs):
+            return self.store.load_price_frame(symbol)
+        # Every bar of a bin after the cutoff is stamped after the cutoff label.
+        return self.store.load_price_frame(
+            symbol, start=pd.Timestamp(min(cutoffs), tz="UTC").to_pydatetime()
+        )
+
+    def _read_stored(
+        self, symbol: str, frequency: str
+    ) -> tuple[FileSignature | None, pa.Table | None]:
+        # Stored bins stay in Arrow: splicing only slices and appends them.
+        path = self._path(symbol, frequency)
+        signature = file_signature(path)
+        if signature is None:
+            return None, None
+        return signature, pq.read_table(path)
+
+    def _splice(
+        self,
+        key: tuple[str, str],
+        fresh: pd.DataFrame,
+        cutoff: int | None,
+        stored: tuple[FileSignature | None, pa.Table | None],
+    ) -> None:
+        """Replace the bins after ``cutoff`` with ``fresh`` under the file's lock."""
+        path = self._path(*key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pandas(fresh, preserve_index=False)
+        with file_lock(path):
+            if cutoff is not None:
+                signature, kept = stored
+                if file_signature(path) != signature:  # rewritten since it was read
+                    kept = self._read_stored(*key)[1]
+                if kept is not None:
+                    kept = kept.slice(0, int(np.searchsorted(_label_ns(kept), cutoff, "right")))
+                    table = pa.concat_tables([kept, table], promote_options="default")
+            atomic_write(path, lambda tmp_path: pq.write_table(table, tmp_path))
+
+    # ---------- Reading ----------
+    def load(
+        self,
+        symbol: str,
+        frequency: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> pd.DataFrame:
+        """Stored bins of ``symbol`` labelled in [start, end), oldest first."""
+        path = self._path(symbol, frequency)
+        if not path.exists():
+            return pd.DataFrame(columns=AGGREGATE_COLUMNS)
+        filters = []
+        if start is not None:
+            filters.append(("timestamp", ">=", pd.Timestamp(ensure_utc(start))))
+        if end is not None:
+            filters.append(("timestamp", "<", pd.Timestamp(ensure_utc(end))))
+        return pd.read_parquet(path, engine="pyarrow", filters=filters or None)
+
+    def _frequencies(self, frequencies: Sequence[str] | None) -> list[str]:
+        if frequencies is None:
+            return self.frequencies
+        return [normalize_frequency(frequency) for frequency in frequencies]
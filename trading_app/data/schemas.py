@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Literal, Sequence
 
+from trading_app.utils.time import datetime_to_ns, ns_to_datetime
+
 
 @dataclass
 class PriceBar:
@@ -34,6 +37,115 @@ class Quote:
     provider: str | None = None
 
 
+def intern_name(value: str | None) -> str | None:
+    """Return the shared copy of a symbol/provider string (``None`` passes through)."""
+    return None if value is None else sys.intern(value)
+
+
+# ---------- Compact variants ----------
+# Slotted, no per-instance ``__dict__``, timestamps as integer UTC nanoseconds and
+# symbol/provider strings interned, so millions of records share one copy of
+# each name. ``timestamp`` is still available as a datetime, built on access.
+
+
+@dataclass(slots=True)
+class CompactPriceBar:
+    """Memory-compact ``PriceBar``; build with ``from_bar`` or ``frame_to_compact_bars``."""
+
+    symbol: str
+    ts_ns: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float | None = None
+    provider: str | None = None
+
+    @property
+    def timestamp(self) -> datetime:
+        return ns_to_datetime(self.ts_ns)
+
+    @classmethod
+    def from_bar(cls, bar: PriceBar) -> CompactPriceBar:
+        return cls(
+            symbol=sys.intern(bar.symbol),
+            ts_ns=datetime_to_ns(bar.timestamp),
+            open=bar.open,
+            high=bar.high,
+            low=bar.low,
+            close=bar.close,
+            volume=bar.volume,
+            provider=intern_name(bar.provider),
+        )
+
+    def to_bar(self) -> PriceBar:
+        return PriceBar(
+            symbol=self.symbol,
+            timestamp=self.timestamp,
+            open=self.open,
+            high=self.high,
+            low=self.low,
+            close=self.close,
+            volume=self.volume,
+            provider=self.provider,
+        )
+
+
+@dataclass(slots=True)
+class CompactQuote:
+    """Memory-compact ``Quote``."""
+
+    symbol: str
+    ts_ns: int
+    bid: float
+    ask: float
+    bid_size: float | None = None
+    ask_size: float | None = None
+    provider: str | None = None
+
+    @property
+    def timestamp(self) -> datetime:
+        return ns_to_datetime(self.ts_ns)
+
+    @classmethod
+    def from_quote(cls, quote: Quote) -> CompactQuote:
+        return cls(
+            symbol=sys.intern(quote.symbol),
+            ts_ns=datetime_to_ns(quote.timestamp),
+            bid=quote.bid,
+            ask=quote.ask,
+            bid_size=quote.bid_size,
+            ask_size=quote.ask_size,
+            provider=intern_name(quote.provider),
+        )
+
+    def to_quote(self) -> Quote:
+        return Quote(
+            symbol=self.symbol,
+            timestamp=self.timestamp,
+            bid=self.bid,
+            ask=self.ask,
+            bid_size=self.bid_size,
+            ask_size=self.ask_size,
+            provider=self.provider,
+        )
+
+
+@dataclass
+class CorporateAction:
+    """Split or cash dividend taking effect at the open of ``ex_date``.
+
+    ``value`` is the split ratio (new shares per old share, e.g. ``4.0`` for a
+    4-for-1 split) or the cash dividend per share.
+    """
+
+    symbol: str
+    ex_date: datetime
+    kind: Literal["split", "dividend"]
+    value: float
+    provider: str | None = None
+
+
 @dataclass
 class NewsItem:
     """Structured representation of a news headline or article summary."""
@@ -46,3 +158,50 @@ class NewsItem:
     source: str
     sentiment: Literal["positive", "neutral", "negative"] | None = None
     tickers: Sequence[str] | None = None
+
+
+@dataclass(slots=True)
+class CompactNewsItem:
+    """Memory-compact ``NewsItem``; ``tickers`` is a tuple and comes back as a list."""
+
+    id: str
+    symbol: str | None
+    published_ns: int
+    title: str
+    summary: str
+    source: str
+    sentiment: Literal["positive", "neutral", "negative"] | None = None
+    tickers: tuple[str, ...] | None = None
+
+    @property
+    def published_at(self) -> datetime:
+        return ns_to_datetime(self.published_ns)
+
+    @classmethod
+    def from_news_item(cls, item: NewsItem) -> CompactNewsItem:
+        return cls(
+            id=item.id,
+            symbol=intern_name(item.symbol),
+            published_ns=datetime_to_ns(item.published_at),
+            title=item.title,
+            summary=item.summary,
+            source=sys.intern(item.source),
+            sentiment=intern_name(item.sentiment),
+            tickers=(
+                tuple(sys.intern(ticker) for ticker in item.tickers)
+                if item.tickers is not None
+                else None
+            ),
+        )
+
+    def to_news_item(self) -> NewsItem:
+        return NewsItem(
+            id=self.id,
+            symbol=self.symbol,
+            published_at=self.published_at,
+            title=self.title,
+            summary=self.summary,
+            source=self.source,
+            sentiment=self.sentiment,
+            tickers=list(self.tickers) if self.tickers is not None else None,
+        )
@@ -1,8 +1,16 @@
 from trading_app.data.sources.base import MarketDataSource, NewsDataSource
+from trading_app.data.sources.caching import CacheMissError, CachingMarketDataSource
+from trading_app.data.sources.replay import ReplayMarketDataSource, ReplayStats
+from trading_app.data.sources.synthetic import SyntheticMarketDataSource
 from trading_app.data.sources.yfinance_source import YFinanceSource
 
 __all__ = [
+    "CacheMissError",
+    "CachingMarketDataSource",
     "MarketDataSource",
     "NewsDataSource",
+    "ReplayMarketDataSource",
+    "ReplayStats",
+    "SyntheticMarketDataSource",
     "YFinanceSource",
 ]
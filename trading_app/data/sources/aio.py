@@ -0,0 +1,71 @@
+"""Helpers for driving blocking source calls from asyncio."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_CONCURRENCY = 16
+DEFAULT_TIMEOUT = 10.0
+
+
+async def as_completed_in_threads(
+    fetch_one: Callable[[T], R | None],
+    items: Iterable[T],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    timeout: float | None = DEFAULT_TIMEOUT,
+    executor: Executor | None = None,
+) -> AsyncIterator[R]:
+    """Run ``fetch_one`` for every item in a thread pool and yield results as they finish.
+
+    At most ``concurrency`` calls are in flight. Items whose call raises, returns
+    ``None`` or runs longer than ``timeout`` seconds are skipped; the timeout
+    starts when a worker thread picks the call up, so time spent waiting for a
+    free worker does not count. A timed-out call cannot be interrupted, so its
+    worker thread finishes in the background.
+    """
+    if concurrency <= 0:
+        raise ValueError("concurrency must be positive.")
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    owned = executor is None
+    pool = executor or ThreadPoolExecutor(max_workers=concurrency)
+
+    async def run(item: T) -> R | None:
+        async with semaphore:
+            started = loop.create_future()
+
+            def call() -> R | None:
+                loop.call_soon_threadsafe(_resolve, started)
+                return fetch_one(item)
+
+            try:
+                future = loop.run_in_executor(pool, call)
+                # Workers still busy with timed-out calls may hold this one in the queue.
+                await asyncio.wait([started, future], return_when=asyncio.FIRST_COMPLETED)
+                return await asyncio.wait_for(future, timeout)
+            except Exception:  # noqa: BLE001 - one failing item must not stop the rest
+                return None
+            finally:
+                started.cancel()
+
+    tasks = [asyncio.ensure_future(run(item)) for item in items]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            if result is not None:
+                yield result
+    finally:
+        for task in tasks:
+            task.cancel()
+        if owned:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _resolve(started: asyncio.Future[None]) -> None:
+    if not started.done():
+        started.set_result(None)
@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Iterable, Protocol, Sequence
+from typing import AsyncIterator, Iterable, Protocol, Sequence
 
 from trading_app.data.schemas import NewsItem, PriceBar, Quote
+from trading_app.data.sources.aio import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_TIMEOUT,
+    as_completed_in_threads,
+)
 
 
 class MarketDataSource(Protocol):
@@ -27,6 +32,22 @@ class MarketDataSource(Protocol):
         """Get latest top-of-book quotes."""
         ...
 
+    def afetch_quotes(
+        self,
+        symbols: Sequence[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: float | None = DEFAULT_TIMEOUT,
+    ) -> AsyncIterator[Quote]:
+        """Asynchronously yield quotes in completion order, skipping symbols that time out.
+
+        The default quotes one symbol per ``fetch_quotes`` call on a bounded thread pool.
+        """
+
+        def quote_for(symbol: str) -> Quote | None:
+            return next(iter(self.fetch_quotes([symbol])), None)
+
+        return as_completed_in_threads(quote_for, symbols, concurrency=concurrency, timeout=timeout)
+
 
 class NewsDataSource(Protocol):
     """Contract for any textual news or article provider."""
@@ -0,0 +1,306 @@
+"""Disk-backed response cache wrapping any MarketDataSource."""
+
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import AsyncIterator, Callable, Iterable, Sequence
+
+from trading_app.data.frames import bars_to_frame
+from trading_app.data.schemas import CorporateAction, PriceBar, Quote
+from trading_app.data.sources.aio import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_TIMEOUT,
+    as_completed_in_threads,
+)
+from trading_app.data.sources.base import MarketDataSource
+from trading_app.data.storage.catalog import DateRange
+from trading_app.data.storage.locking import atomic_write, file_lock
+from trading_app.data.storage.parquet_store import ParquetDataStore
+from trading_app.utils.time import ensure_utc
+
+_MIN_DATETIME = datetime.min.replace(tzinfo=timezone.utc)
+
+
+class CacheMissError(LookupError):
+    """Raised in offline mode when a request is not covered by the cache."""
+
+
+def _utc_clock() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def uncovered_ranges(
+    covered: Iterable[DateRange], start: datetime | None, end: datetime
+) -> list[DateRange]:
+    """Return the parts of [start, end) not inside any ``covered`` interval.
+
+    Covered intervals may overlap or touch; a ``None`` start means "from the
+    beginning of history".
+    """
+    windows: list[DateRange] = []
+    cursor = start
+    ordered = sorted(covered, key=lambda window: window[0] or _MIN_DATETIME)
+    for window_start, window_end in ordered:
+        if cursor is not None and cursor >= end:
+            break
+        if cursor is not None and window_end <= cursor:
+            continue
+        if window_start is not None and (cursor is None or window_start > cursor):
+            windows.append((cursor, min(window_start, end)))
+        cursor = window_end if cursor is None else max(cursor, window_end)
+    if cursor is None or cursor < end:
+        windows.append((cursor, end))
+    return windows
+
+
+class CachingMarketDataSource:
+    """Serves ``fetch_history``/``fetch_quotes`` from disk, calling upstream only for gaps.
+
+    History is cached per (source, symbol) in a ``ParquetDataStore`` under
+    ``cache_dir/<source>/history`` together with the time ranges already fetched.
+    A request is split into the sub-ranges no cached fetch covers, so overlapping
+    and adjacent requests merge and a fully covered request needs no upstream
+    call. Coverage never extends past the moment a range was fetched, so
+    open-ended requests (``end=None``) pick up newer bars on the next call, and
+    a window upstream returned no bars for is not recorded, so it is asked for
+    again. Coverage older than ``history_ttl`` and quotes older than
+    ``quote_ttl`` are refetched; refetched bars replace the cached ones, so
+    revisions reach the cache. With ``offline=True`` the upstream source is
+    never called: uncovered history raises ``CacheMissError`` and quotes are
+    served from the last snapshot regardless of age.
+    """
+
+    def __init__(
+        self,
+        source: MarketDataSource,
+        cache_dir: str,
+        history_ttl: timedelta | None = None,
+        quote_ttl: timedelta = timedelta(minutes=1),
+        offline: bool = False,
+        clock: Callable[[], datetime] = _utc_clock,
+    ) -> None:
+        self.source = source
+        self.name = source.name
+        self.history_ttl = history_ttl
+        self.quote_ttl = quote_ttl
+        self.offline = offline
+        self._clock = clock
+        self.cache_path = Path(cache_dir) / source.name
+        self.store = ParquetDataStore(str(self.cache_path / "history"))
+        self._coverage_path = self.cache_path / "coverage.json"
+        self._quotes_path = self.cache_path / "quotes.json"
+        self._lock = threading.Lock()
+
+    # ---------- History ----------
+    def fetch_history(
+        self, symbols: Sequence[str], start: datetime | None = None, end: datetime | None = None
+    ) -> Iterable[PriceBar]:
+        if not symbols:
+            return []
+        start = ensure_utc(start) if start is not None else None
+        end = ensure_utc(end) if end is not None else None
+
+        plan = self.plan_fetches(symbols, start=start, end=end)
+        if plan and self.offline:
+            missing = sorted(
+                {symbol for window_symbols in plan.values() for symbol in window_symbols}
+            )
+            raise CacheMissError(f"History for {missing} is not cached (offline mode).")
+        for (window_start, window_end), window_symbols in plan.items():
+            self._fill(window_symbols, window_start, window_end)
+
+        return [
+            bar
+            for symbol in symbols
+            for bar in self.store.load_prices(symbol, start=start, end=end)
+        ]
+
+    def plan_fetches(
+        self, symbols: Sequence[str], start: datetime | None, end: datetime | None
+    ) -> dict[DateRange, list[str]]:
+        """Group symbols by the upstream windows needed to cover [start, end).
+
+        An open ``end`` means "up to now", or offline, up to the newest cached
+        coverage of each symbol, since nothing later can be served anyway.
+        """
+        coverage = self._read_json(self._coverage_path)
+        now = self._clock()
+        plan: dict[DateRange, list[str]] = {}
+        for symbol in symbols:
+            covered = [
+                (window_start, window_end)
+                for window_start, window_end, fetched_at in self._decode_coverage(
+                    coverage.get(symbol, [])
+                )
+                if self.history_ttl is None or now - fetched_at <= self.history_ttl
+            ]
+            symbol_end = end
+            if symbol_end is None:
+                symbol_end = now
+                if self.offline and covered:
+                    symbol_end = max(window_end for _start, window_end in covered)
+            for window in uncovered_ranges(covered, start, symbol_end):
+                plan.setdefault(window, []).append(symbol)
+        return plan
+
+    def _fill(self, symbols: list[str], start: datetime | None, end: datetime) -> None:
+        """Fetch one window upstream, store it and record it as covered."""
+        fetched_at = self._clock()
+        fetch_frame = getattr(self.source, "fetch_history_frame", None)
+        if fetch_frame is not None:
+            frame = fetch_frame(symbols, start=start, end=end)
+        else:
+            frame = bars_to_frame(self.source.fetch_history(symbols, start=start, end=end))
+        # A refetch (e.g. after ``history_ttl``) must replace bars the provider revised.
+        self.store.save_price_frame(frame, overwrite=True)
+        # Empty answers are not cached: the data may simply not be published yet.
+        returned = set(frame["symbol"].unique()) if not frame.empty else set()
+        symbols = [symbol for symbol in symbols if symbol in returned]
+        if not symbols:
+            return
+
+        # Bars after the fetch time cannot exist yet, so coverage stops there.
+        end = min(end, fetched_at)
+        entry = [
+            start.isoformat() if start is not None else None,
+            end.isoformat(),
+            fetched_at.isoformat(),
+        ]
+        with self._lock, file_lock(self._coverage_path):
+            coverage = self._read_json(self._coverage_path)
+            for symbol in symbols:
+                # Drop older fetches the new one fully contains to keep the manifest small.
+                kept = [
+                    raw
+                    for raw, (old_start, old_end, _fetched) in zip(
+                        coverage.get(symbol, []), self._decode_coverage(coverage.get(symbol, []))
+                    )
+                    if not (
+                        (start is None or (old_start is not None and old_start >= start))
+                        and old_end <= end
+                    )
+                ]
+                coverage[symbol] = [*kept, entry]
+            self._write_json(self._coverage_path, coverage)
+
+    @staticmethod
+    def _decode_coverage(
+        raw: list[list[str | None]],
+    ) -> list[tuple[datetime | None, datetime, datetime]]:
+        return [
+            (
+                datetime.fromisoformat(start) if start is not None else None,
+                datetime.fromisoformat(end),
+                datetime.fromisoformat(fetched_at),
+            )
+            for start, end, fetched_at in raw
+        ]
+
+    # ---------- Quotes ----------
+    def fetch_quotes(self, symbols: Sequence[str]) -> Iterable[Quote]:
+        """Return cached quotes younger than ``quote_ttl``, fetching the rest in one call."""
+        served, missing = self._cached_quotes(symbols)
+        if missing and not self.offline:
+            fresh = list(self.source.fetch_quotes(missing))
+            served.update((quote.symbol, quote) for quote in fresh)
+            self._store_quotes(fresh)
+        return [served[symbol] for symbol in symbols if symbol in served]
+
+    async def afetch_quotes(
+        self,
+        symbols: Sequence[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: float | None = DEFAULT_TIMEOUT,
+    ) -> AsyncIterator[Quote]:
+        """Yield fresh cached quotes first, then upstream quotes as they complete."""
+        served, missing = self._cached_quotes(symbols)
+        for quote in served.values():
+            yield quote
+        if not missing or self.offline:
+            return
+        upstream = getattr(self.source, "afetch_quotes", None)
+        if upstream is not None:
+            stream = upstream(missing, concurrency=concurrency, timeout=timeout)
+        else:
+            stream = as_completed_in_threads(
+                lambda symbol: next(iter(self.source.fetch_quotes([symbol])), None),
+                missing,
+                concurrency=concurrency,
+                timeout=timeout,
+            )
+        fresh: list[Quote] = []
+        try:
+            async for quote in stream:
+                fresh.append(quote)
+                yield quote
+        finally:
+            self._store_quotes(fresh)
+
+    def _cached_quotes(self, symbols: Sequence[str]) -> tuple[dict[str, Quote], list[str]]:
+        """Split ``symbols`` into servable cached quotes and symbols that need fetching."""
+        now = self._clock()
+        snapshot = self._read_json(self._quotes_path)
+        served: dict[str, Quote] = {}
+        for symbol in symbols:
+            cached = snapshot.get(symbol)
+            if cached is None:
+                continue
+            fetched_at = datetime.fromisoformat(cached["fetched_at"])
+            if self.offline or now - fetched_at <= self.quote_ttl:
+                served[symbol] = self._decode_quote(cached["quote"])
+        return served, [symbol for symbol in symbols if symbol not in served]
+
+    def _store_quotes(self, quotes: Sequence[Quote]) -> None:
+        if not quotes:
+            return
+        fetched_at = self._clock().isoformat()
+        with self._lock, file_lock(self._quotes_path):
+            snapshot = self._read_json(self._quotes_path)
+            for quote in quotes:
+                snapshot[quote.symbol] = {
+                    "fetched_at": fetched_at,
+                    "quote": {
+                        **asdict(quote),
+                        "timestamp": ensure_utc(quote.timestamp).isoformat(),
+                    },
+                }
+            self._write_json(self._quotes_path, snapshot)
+
+    @staticmethod
+    def _decode_quote(raw: dict[str, object]) -> Quote:
+        return Quote(**{**raw, "timestamp": datetime.fromisoformat(str(raw["timestamp"]))})
+
+    # ---------- Corporate actions ----------
+    def fetch_actions(
+        self, symbols: Sequence[str], start: datetime | None = None, end: datetime | None = None
+    ) -> list[CorporateAction]:
+        """Pass through to the upstream source; events are stored by the data store instead."""
+        fetch = getattr(self.source, "fetch_actions", None)
+        if fetch is None:
+            return []
+        if self.offline:
+            raise CacheMissError("Corporate actions are unavailable in offline mode.")
+        return list(fetch(symbols, start=start, end=end))
+
+    # ---------- Live ----------
+    def stream_live(self, symbols: Sequence[str]) -> Iterable[PriceBar]:
+        """Pass through to the upstream source; live data is never cached."""
+        if self.offline:
+            raise CacheMissError("Live streaming is unavailable in offline mode.")
+        return self.source.stream_live(symbols)
+
+    # ---------- Internal helpers ----------
+    @staticmethod
+    def _read_json(path: Path) -> dict:
+        if not path.exists():
+            return {}
+        return json.loads(path.read_text())
+
+    @staticmethod
+    def _write_json(path: Path, payload: dict) -> None:
+        text = json.dumps(payload, indent=2, sort_keys=True)
+        atomic_write(path, lambda tmp_path: tmp_path.write_text(text))
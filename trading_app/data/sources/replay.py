@@ -0,0 +1,156 @@
+"""Market data source that replays stored bars as a live stream."""
+
+from __future__ import annotations
+
+import heapq
+import operator
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterator, Callable, Iterable, Iterator, Sequence
+
+from trading_app.data.frames import frame_to_bars, frame_to_compact_bars
+from trading_app.data.schemas import CompactPriceBar, PriceBar, Quote
+from trading_app.data.sources.aio import DEFAULT_CONCURRENCY, DEFAULT_TIMEOUT
+from trading_app.data.storage.base import DataStore
+from trading_app.utils.time import elapsed_seconds
+
+
+@dataclass
+class ReplayStats:
+    """Throughput and pacing lag of the most recent replay."""
+
+    bars: int = 0
+    elapsed_seconds: float = 0.0
+    total_lag_seconds: float = 0.0
+    max_lag_seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Bars emitted per wall-clock second."""
+        if self.elapsed_seconds <= 0:
+            return float("inf") if self.bars else 0.0
+        return self.bars / self.elapsed_seconds
+
+    @property
+    def mean_lag_seconds(self) -> float:
+        return self.total_lag_seconds / self.bars if self.bars else 0.0
+
+
+class ReplayMarketDataSource:
+    """Streams bars from a ``DataStore`` in timestamp order across symbols.
+
+    ``speed=None`` replays as fast as the consumer pulls; ``speed=1.0`` keeps the
+    original spacing between bars and ``speed=N`` compresses it N times. Lag is
+    how far behind its scheduled wall-clock time each bar was handed out, which
+    includes time the consumer spent before asking for the next bar; it stays
+    zero when replaying as fast as possible. ``stats`` is updated as bars are
+    emitted, so it can be read during or after a replay.
+
+    Symbols are read lazily and merged as they are consumed: stores with
+    ``iter_price_frames`` (``ParquetDataStore``) hand out ``batch_size`` rows
+    per symbol at a time, so memory stays flat however long the replay is;
+    other stores load each symbol's window whole.
+
+    With ``ns=True`` bars are ``CompactPriceBar``s, and merging and pacing use
+    their integer ``ts_ns``, so no ``datetime`` is created on the way to the
+    consumer.
+    """
+
+    name = "replay"
+
+    def __init__(
+        self,
+        store: DataStore,
+        speed: float | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+        ns: bool = False,
+        batch_size: int = 10_000,
+    ) -> None:
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive (or None for as fast as possible).")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive.")
+        self.store = store
+        self.speed = speed
+        self.start = start
+        self.end = end
+        self.stats = ReplayStats()
+        self._clock = clock
+        self._sleep = sleep
+        self.ns = ns
+        self.batch_size = batch_size
+        self._last_bars: dict[str, PriceBar | CompactPriceBar] = {}
+
+    def fetch_history(
+        self, symbols: Sequence[str], start: datetime | None = None, end: datetime | None = None
+    ) -> Iterable[PriceBar]:
+        return [
+            bar
+            for symbol in symbols
+            for bar in self.store.load_prices(symbol, start=start, end=end)
+        ]
+
+    def stream_live(self, symbols: Sequence[str]) -> Iterator[PriceBar | CompactPriceBar]:
+        """Yield stored bars for ``symbols`` merged by timestamp, paced by ``speed``."""
+        self.stats = ReplayStats()
+        key = operator.attrgetter("ts_ns" if self.ns else "timestamp")
+        merged = heapq.merge(*(self._symbol_bars(symbol) for symbol in symbols), key=key)
+
+        started = self._clock()
+        first_timestamp: datetime | int | None = None
+        for bar in merged:
+            if first_timestamp is None:
+                first_timestamp = key(bar)
+            if self.speed is not None:
+                offset = elapsed_seconds(first_timestamp, key(bar)) / self.speed
+                delay = started + offset - self._clock()
+                if delay > 0:
+                    self._sleep(delay)
+                else:
+                    self.stats.total_lag_seconds -= delay
+                    self.stats.max_lag_seconds = max(self.stats.max_lag_seconds, -delay)
+            self._last_bars[bar.symbol] = bar
+            self.stats.bars += 1
+            self.stats.elapsed_seconds = self._clock() - started
+            yield bar
+
+    def _symbol_bars(self, symbol: str) -> Iterator[PriceBar | CompactPriceBar]:
+        """One symbol's bars in the replay window, read a batch at a time when possible."""
+        iter_frames = getattr(self.store, "iter_price_frames", None)
+        if iter_frames is None:
+            load = self.store.load_compact_bars if self.ns else self.store.load_prices
+            yield from load(symbol, start=self.start, end=self.end)
+            return
+        convert = frame_to_compact_bars if self.ns else frame_to_bars
+        for frame in iter_frames(
+            symbol, start=self.start, end=self.end, batch_size=self.batch_size
+        ):
+            yield from convert(frame)
+
+    def fetch_quotes(self, symbols: Sequence[str]) -> Iterable[Quote]:
+        """Quote the close of the last replayed bar per symbol (zero spread)."""
+        return [
+            Quote(
+                symbol=symbol,
+                timestamp=bar.timestamp,
+                bid=bar.close,
+                ask=bar.close,
+                provider=self.name,
+            )
+            for symbol in symbols
+            if (bar := self._last_bars.get(symbol)) is not None
+        ]
+
+    async def afetch_quotes(
+        self,
+        symbols: Sequence[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: float | None = DEFAULT_TIMEOUT,
+    ) -> AsyncIterator[Quote]:
+        """Yield ``fetch_quotes``; they come from bars already in memory, so no thread is needed."""
+        for quote in self.fetch_quotes(symbols):
+            yield quote
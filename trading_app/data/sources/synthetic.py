@@ -0,0 +1,217 @@
+"""Deterministic synthetic market data for tests and benchmarks."""
+
+from __future__ import annotations
+
+import zlib
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Iterable, Iterator, Sequence
+
+import numpy as np
+import pandas as pd
+
+from trading_app.data.frames import PRICE_COLUMNS, frame_to_bars
+from trading_app.data.schemas import PriceBar, Quote
+from trading_app.data.sources.aio import DEFAULT_CONCURRENCY, DEFAULT_TIMEOUT
+from trading_app.data.storage.base import DataStore
+from trading_app.utils.time import ensure_utc
+
+DEFAULT_START = datetime(2000, 1, 3, tzinfo=timezone.utc)
+
+
+class SyntheticMarketDataSource:
+    """Generates correlated GBM-with-jumps OHLCV paths for any symbol names.
+
+    Every symbol's path covers ``bars`` bars spaced ``interval`` apart from
+    ``start`` and depends only on ``seed`` and the symbol name, so a symbol looks
+    the same whatever else is requested alongside it or whichever window is
+    asked for. Log returns combine a shared market factor (pairwise correlation
+    ``correlation``), an idiosyncratic term with a per-symbol volatility drawn
+    from ``volatility_range``, and normally distributed jumps arriving
+    ``jump_intensity`` times per year. Each bar opens at the previous
+    close, and high/low extend beyond the open/close range, so bars are always
+    valid (``low <= open, close <= high``).
+    """
+
+    name = "synthetic"
+
+    def __init__(
+        self,
+        seed: int = 0,
+        bars: int = 2520,
+        start: datetime = DEFAULT_START,
+        interval: timedelta = timedelta(days=1),
+        bars_per_year: float = 252.0,
+        drift: float = 0.06,
+        volatility_range: tuple[float, float] = (0.15, 0.45),
+        correlation: float = 0.4,
+        jump_intensity: float = 2.0,
+        jump_mean: float = -0.02,
+        jump_std: float = 0.05,
+        price_range: tuple[float, float] = (10.0, 500.0),
+        base_volume: float = 1_000_000.0,
+    ) -> None:
+        if bars <= 0:
+            raise ValueError("bars must be positive.")
+        if not 0.0 <= correlation <= 1.0:
+            raise ValueError("correlation must be between 0 and 1.")
+        self.seed = seed
+        self.bars = bars
+        self.start = ensure_utc(start)
+        self.interval = interval
+        self.dt = 1.0 / bars_per_year
+        self.drift = drift
+        self.volatility_range = volatility_range
+        self.correlation = correlation
+        self.jump_intensity = jump_intensity
+        self.jump_mean = jump_mean
+        self.jump_std = jump_std
+        self.price_range = price_range
+        self.base_volume = base_volume
+        market = np.random.default_rng(np.random.SeedSequence([seed, 0]))
+        self._market_shocks = market.standard_normal(bars)
+        start_ns = pd.Timestamp(self.start).as_unit("ns").value
+        step_ns = int(interval.total_seconds() * 1_000_000_000)
+        self._timestamps = pd.DatetimeIndex(
+            start_ns + step_ns * np.arange(bars, dtype=np.int64), tz="UTC"
+        )
+
+    @staticmethod
+    def universe(count: int, prefix: str = "SYN") -> list[str]:
+        """Return ``count`` stable symbol names (``SYN00000``, ``SYN00001``, ...)."""
+        return [f"{prefix}{index:05d}" for index in range(count)]
+
+    # ---------- History ----------
+    def fetch_history(
+        self, symbols: Sequence[str], start: datetime | None = None, end: datetime | None = None
+    ) -> Iterable[PriceBar]:
+        return frame_to_bars(self.fetch_history_frame(symbols, start=start, end=end))
+
+    def fetch_history_frame(
+        self, symbols: Sequence[str], start: datetime | None = None, end: datetime | None = None
+    ) -> pd.DataFrame:
+        """Return bars in [start, end) for ``symbols`` as one ``PRICE_COLUMNS`` frame."""
+        if not symbols:
+            return pd.DataFrame(columns=PRICE_COLUMNS)
+        first, last = self._window(start, end)
+        opens, highs, lows, closes, volumes = (
+            block[:, first:last] for block in self.generate(symbols)
+        )
+        count = last - first
+        return pd.DataFrame(
+            {
+                "symbol": np.repeat(np.asarray(symbols, dtype=object), count),
+                "timestamp": pd.DatetimeIndex(
+                    np.tile(self._timestamps.asi8[first:last], len(symbols)), tz="UTC"
+                ),
+                "open": opens.ravel(),
+                "high": highs.ravel(),
+                "low": lows.ravel(),
+                "close": closes.ravel(),
+                "volume": volumes.ravel(),
+                "provider": self.name,
+            },
+            columns=PRICE_COLUMNS,
+        )
+
+    def generate(self, symbols: Sequence[str]) -> tuple[np.ndarray, ...]:
+        """Return (open, high, low, close, volume) arrays shaped ``(len(symbols), bars)``."""
+        count = len(symbols)
+        shocks = np.empty((count, self.bars), dtype=np.float32)
+        uniforms = np.empty((count, 4, self.bars), dtype=np.float32)
+        jump_sizes = np.zeros((count, self.bars), dtype=np.float32)
+        sigma = np.empty((count, 1))
+        initial = np.empty((count, 1))
+        jump_rate = self.jump_intensity * self.dt
+        low_vol, high_vol = self.volatility_range
+        low_price, high_price = self.price_range
+        for row, symbol in enumerate(symbols):
+            rng = np.random.default_rng(
+                np.random.SeedSequence([self.seed, 1, zlib.crc32(symbol.encode())])
+            )
+            sigma[row, 0] = rng.uniform(low_vol, high_vol)
+            initial[row, 0] = np.exp(rng.uniform(np.log(low_price), np.log(high_price)))
+            rng.standard_normal(dtype=np.float32, out=shocks[row])
+            rng.random(dtype=np.float32, out=uniforms[row])
+            # At most one jump per bar: a Bernoulli approximation of Poisson arrivals.
+            jumped = uniforms[row, 0] < jump_rate
+            jump_sizes[row, jumped] = rng.normal(self.jump_mean, self.jump_std, int(jumped.sum()))
+
+        high_noise, low_noise, volume_noise = uniforms[:, 1], uniforms[:, 2], uniforms[:, 3]
+        scale = sigma * np.sqrt(self.dt)
+        log_returns = (
+            (self.drift - 0.5 * sigma**2) * self.dt
+            + scale
+            * (
+                np.sqrt(self.correlation) * self._market_shocks
+                + np.sqrt(1.0 - self.correlation) * shocks
+            )
+            + jump_sizes
+        )
+        closes = initial * np.exp(np.cumsum(log_returns, axis=1))
+        opens = np.empty_like(closes)
+        opens[:, 0] = initial[:, 0]
+        opens[:, 1:] = closes[:, :-1]
+
+        highs = np.maximum(opens, closes) * np.exp(scale * high_noise)
+        lows = np.minimum(opens, closes) * np.exp(-scale * low_noise)
+        activity = 1.0 + np.abs(log_returns) / scale
+        volumes = np.round(self.base_volume * activity * (0.5 + volume_noise))
+        return opens, highs, lows, closes, volumes
+
+    def write_to_store(
+        self,
+        store: DataStore,
+        symbols: Sequence[str],
+        start: datetime | None = None,
+        end: datetime | None = None,
+        block_size: int = 256,
+    ) -> int:
+        """Generate ``symbols`` in blocks and write each block to ``store``; returns rows."""
+        rows = 0
+        for offset in range(0, len(symbols), block_size):
+            frame = self.fetch_history_frame(
+                symbols[offset : offset + block_size], start=start, end=end
+            )
+            store.save_price_frame(frame)
+            rows += len(frame)
+        return rows
+
+    # ---------- Live / quotes ----------
+    def stream_live(self, symbols: Sequence[str]) -> Iterator[PriceBar]:
+        """Yield the generated history across symbols in timestamp order."""
+        frame = self.fetch_history_frame(symbols)
+        yield from frame_to_bars(frame.sort_values("timestamp", kind="stable"))
+
+    def fetch_quotes(self, symbols: Sequence[str]) -> Iterable[Quote]:
+        """Quote around the last generated close with a one basis point spread."""
+        if not symbols:
+            return []
+        closes = self.generate(symbols)[3][:, -1]
+        timestamp = self._timestamps[-1].to_pydatetime()
+        return [
+            Quote(
+                symbol=symbol,
+                timestamp=timestamp,
+                bid=float(close) * (1 - 0.00005),
+                ask=float(close) * (1 + 0.00005),
+                provider=self.name,
+            )
+            for symbol, close in zip(symbols, closes)
+        ]
+
+    async def afetch_quotes(
+        self,
+        symbols: Sequence[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: float | None = DEFAULT_TIMEOUT,
+    ) -> AsyncIterator[Quote]:
+        """Yield ``fetch_quotes`` for all symbols, generated in one batch rather than per thread."""
+        for quote in self.fetch_quotes(symbols):
+            yield quote
+
+    # ---------- Internal helpers ----------
+    def _window(self, start: datetime | None, end: datetime | None) -> tuple[int, int]:
+        """Map [start, end) onto bar indices of the generated horizon."""
+        first = 0 if start is None else int(self._timestamps.searchsorted(ensure_utc(start)))
+        last = self.bars if end is None else int(self._timestamps.searchsorted(ensure_utc(end)))
+        return first, max(first, last)
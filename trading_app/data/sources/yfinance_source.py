@@ -3,13 +3,21 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Iterable, Sequence
+from typing import AsyncIterator, Iterable, Sequence
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
-from trading_app.data.schemas import PriceBar, Quote
+from trading_app.data.frames import PRICE_COLUMNS, frame_to_bars
+from trading_app.data.schemas import CorporateAction, PriceBar, Quote
+from trading_app.data.sources.aio import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_TIMEOUT,
+    as_completed_in_threads,
+)
 from trading_app.data.sources.base import MarketDataSource
+from trading_app.utils.time import ensure_utc
 
 
 class YFinanceSource:
@@ -20,8 +28,19 @@ class YFinanceSource:
     def fetch_history(
         self, symbols: Sequence[str], start: datetime | None = None, end: datetime | None = None
     ) -> Iterable[PriceBar]:
+        """Yield ``PriceBar`` objects; built on top of ``fetch_history_frame``."""
+        yield from frame_to_bars(self.fetch_history_frame(symbols, start=start, end=end))
+
+    def fetch_history_frame(
+        self, symbols: Sequence[str], start: datetime | None = None, end: datetime | None = None
+    ) -> pd.DataFrame:
+        """Download history as one price frame (``PRICE_COLUMNS``), ordered by symbol then time.
+
+        The per-ticker column blocks returned by yfinance are stacked into long
+        form in a single vectorized step, so no per-row objects are created.
+        """
         if not symbols:
-            return []
+            return pd.DataFrame(columns=PRICE_COLUMNS)
 
         data = yf.download(
             tickers=list(symbols),
@@ -32,37 +51,93 @@ class YFinanceSource:
             auto_adjust=False,
             threads=True,
         )
+        return self._history_to_frame(data, symbols)
+
+    def _history_to_frame(self, data: pd.DataFrame, symbols: Sequence[str]) -> pd.DataFrame:
+        if data is None or data.empty:
+            return pd.DataFrame(columns=PRICE_COLUMNS)
 
-        # yfinance returns MultiIndex when multiple tickers requested
+        # yfinance returns MultiIndex (ticker, field) columns when grouping by ticker
         if isinstance(data.columns, pd.MultiIndex):
-            for symbol in symbols:
-                if symbol not in data.columns.levels[0]:
-                    continue
-                sym_df = data[symbol].dropna()
-                for ts, row in sym_df.iterrows():
-                    yield PriceBar(
+            data = data.loc[:, data.columns.get_level_values(0).isin(symbols)]
+            long = data.stack(level=0)
+            long.index = long.index.set_names(["timestamp", "symbol"])
+        else:
+            long = data.set_index(pd.Index([symbols[0]] * len(data), name="symbol"), append=True)
+            long.index = long.index.set_names(["timestamp", "symbol"])
+
+        # A bar is kept only when every field is present, as with a per-ticker dropna().
+        long = long.dropna().reset_index()
+        if long.empty:
+            return pd.DataFrame(columns=PRICE_COLUMNS)
+
+        rank = {symbol: position for position, symbol in enumerate(symbols)}
+        long = long.sort_values(
+            ["symbol", "timestamp"],
+            key=lambda column: column.map(rank) if column.name == "symbol" else column,
+            kind="stable",
+        )
+        return pd.DataFrame(
+            {
+                "symbol": long["symbol"].astype(object).to_numpy(),
+                "timestamp": pd.DatetimeIndex(pd.to_datetime(long["timestamp"], utc=True)),
+                "open": long["Open"].to_numpy(dtype="float64"),
+                "high": long["High"].to_numpy(dtype="float64"),
+                "low": long["Low"].to_numpy(dtype="float64"),
+                "close": long["Close"].to_numpy(dtype="float64"),
+                "volume": long["Volume"].to_numpy(dtype="float64"),
+                "provider": self.name,
+            },
+            columns=PRICE_COLUMNS,
+        )
+
+    # ---------- Corporate actions ----------
+    def fetch_actions(
+        self, symbols: Sequence[str], start: datetime | None = None, end: datetime | None = None
+    ) -> list[CorporateAction]:
+        """Fetch splits and cash dividends with ex-dates in [start, end)."""
+        actions: list[CorporateAction] = []
+        for symbol in symbols:
+            actions.extend(self._actions_from_frame(symbol, yf.Ticker(symbol).actions, start, end))
+        return actions
+
+    def _actions_from_frame(
+        self,
+        symbol: str,
+        data: pd.DataFrame | None,
+        start: datetime | None,
+        end: datetime | None,
+    ) -> list[CorporateAction]:
+        if data is None or data.empty:
+            return []
+        # yfinance stamps events at exchange-local midnight; keep the calendar day at
+        # UTC midnight, matching how daily bars from ``yf.download`` are stored.
+        index = pd.DatetimeIndex(data.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        ex_dates = index.normalize().tz_localize("UTC")
+        mask = np.ones(len(ex_dates), dtype=bool)
+        if start is not None:
+            mask &= ex_dates >= ensure_utc(start)
+        if end is not None:
+            mask &= ex_dates < ensure_utc(end)
+
+        actions = []
+        for column, kind in (("Stock Splits", "split"), ("Dividends", "dividend")):
+            if column not in data:
+                continue
+            values = data[column].to_numpy(dtype="float64")
+            for position in np.flatnonzero(mask & (values > 0)):
+                actions.append(
+                    CorporateAction(
                         symbol=symbol,
-                        timestamp=ts.to_pydatetime(),
-                        open=float(row["Open"]),
-                        high=float(row["High"]),
-                        low=float(row["Low"]),
-                        close=float(row["Close"]),
-                        volume=float(row["Volume"]) if not pd.isna(row["Volume"]) else None,
+                        ex_date=ex_dates[position].to_pydatetime(),
+                        kind=kind,
+                        value=float(values[position]),
                         provider=self.name,
                     )
-        else:
-            sym = symbols[0]
-            for ts, row in data.dropna().iterrows():
-                yield PriceBar(
-                    symbol=sym,
-                    timestamp=ts.to_pydatetime(),
-                    open=float(row["Open"]),
-                    high=float(row["High"]),
-                    low=float(row["Low"]),
-                    close=float(row["Close"]),
-                    volume=float(row["Volume"]) if not pd.isna(row["Volume"]) else None,
-                    provider=self.name,
                 )
+        return sorted(actions, key=lambda action: action.ex_date)
 
     def stream_live(self, symbols: Sequence[str]) -> Iterable[PriceBar]:
         raise NotImplementedError("Live streaming not supported via yfinance")
@@ -78,33 +153,50 @@ class YFinanceSource:
 
     def fetch_quotes(self, symbols: Sequence[str]) -> Iterable[Quote]:
         for symbol in symbols:
-            ticker = yf.Ticker(symbol)
-            try:
-                info = ticker.fast_info
-                bid = self._coerce_float(info.get("bid"))
-                ask = self._coerce_float(info.get("ask"))
-                last_price = self._coerce_float(info.get("last_price"))
-            except Exception:
-                continue
+            quote = self._quote_for(symbol)
+            if quote is not None:
+                yield quote
+
+    def afetch_quotes(
+        self,
+        symbols: Sequence[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: float | None = DEFAULT_TIMEOUT,
+    ) -> AsyncIterator[Quote]:
+        """Quote symbols concurrently, yielding each quote as soon as it arrives."""
+        return as_completed_in_threads(
+            self._quote_for, symbols, concurrency=concurrency, timeout=timeout
+        )
 
-            if bid is None and ask is None and last_price is None:
-                continue
+    def _quote_for(self, symbol: str) -> Quote | None:
+        """Fetch one quote snapshot, or None when yfinance has no usable price."""
+        ticker = yf.Ticker(symbol)
+        try:
+            info = ticker.fast_info
+            bid = self._coerce_float(info.get("bid"))
+            ask = self._coerce_float(info.get("ask"))
+            last_price = self._coerce_float(info.get("last_price"))
+        except Exception:
+            return None
 
-            # Fill missing sides with last trade when available.
-            bid_val = bid if bid is not None else last_price
-            ask_val = ask if ask is not None else last_price
-            if bid_val is None:
-                bid_val = ask_val
-            if ask_val is None:
-                ask_val = bid_val
-            if bid_val is None or ask_val is None:
-                continue
+        if bid is None and ask is None and last_price is None:
+            return None
 
-            ts = datetime.now(timezone.utc)
-            yield Quote(
-                symbol=symbol,
-                timestamp=ts,
-                bid=bid_val,
-                ask=ask_val,
-                provider=self.name,
-            )
+        # Fill missing sides with last trade when available.
+        bid_val = bid if bid is not None else last_price
+        ask_val = ask if ask is not None else last_price
+        if bid_val is None:
+            bid_val = ask_val
+        if ask_val is None:
+            ask_val = bid_val
+        if bid_val is None or ask_val is None:
+            return None
+
+        ts = datetime.now(timezone.utc)
+        return Quote(
+            symbol=symbol,
+            timestamp=ts,
+            bid=bid_val,
+            ask=ask_val,
+            provider=self.name,
+        )
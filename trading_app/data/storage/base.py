@@ -2,22 +2,107 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Iterable, Protocol, Sequence
 
-from trading_app.data.schemas import NewsItem, PriceBar, Quote
+import pandas as pd
+
+from trading_app.data.frames import bars_to_frame, frame_to_bars, frame_to_compact_bars
+from trading_app.data.instrumentation import PipelineContext
+from trading_app.data.schemas import CompactPriceBar, CorporateAction, NewsItem, PriceBar, Quote
+from trading_app.data.storage.catalog import DateRange
 
 
 class DataStore(Protocol):
-    """Abstract storage backend (filesystem, database, object store)."""
+    """Abstract storage backend (filesystem, database, object store).
+
+    ``context`` is an optional ``PipelineContext`` that instrumented backends
+    report their per-stage timings to.
+    """
+
+    context: PipelineContext | None = None
 
     def save_prices(self, bars: Iterable[PriceBar]) -> None: ...
 
-    def load_prices(self, symbol: str, limit: int | None = None) -> Sequence[PriceBar]: ...
+    def save_price_frame(
+        self, df: pd.DataFrame, provider_priority: Sequence[str] | None = None
+    ) -> None:
+        """Persist a price frame with ``PRICE_COLUMNS``.
+
+        ``provider_priority`` lists providers from most to least preferred for
+        resolving bars already stored under the same (symbol, timestamp).
+        Backends without a columnar write path fall back to ``save_prices`` and
+        ignore the priority.
+        """
+        self.save_prices(frame_to_bars(df))
+
+    def load_prices(
+        self,
+        symbol: str,
+        limit: int | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        adjusted: bool = False,
+    ) -> Sequence[PriceBar]:
+        """Return raw bars, or split/dividend-adjusted ones with ``adjusted=True``."""
+        ...
+
+    def load_price_frame(
+        self,
+        symbol: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        adjusted: bool = False,
+    ) -> pd.DataFrame:
+        """Like ``load_prices`` but as one ``PRICE_COLUMNS`` frame.
+
+        Backends without a columnar read path build it from ``load_prices``.
+        """
+        return bars_to_frame(self.load_prices(symbol, start=start, end=end, adjusted=adjusted))
+
+    def load_compact_bars(
+        self,
+        symbol: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        adjusted: bool = False,
+    ) -> list[CompactPriceBar]:
+        """Bars as ``CompactPriceBar``s with int64 UTC-nanosecond ``ts_ns`` timestamps.
+
+        The ns fast path: timestamps go from the columnar read straight to
+        integers, and no ``datetime`` objects are created.
+        """
+        return frame_to_compact_bars(
+            self.load_price_frame(symbol, start=start, end=end, adjusted=adjusted)
+        )
+
+    def save_actions(self, actions: Iterable[CorporateAction]) -> None:
+        """Persist splits and dividends used by ``load_prices(adjusted=True)``."""
+        ...
+
+    def load_actions(self, symbol: str) -> Sequence[CorporateAction]: ...
+
+    def missing_ranges(
+        self, symbol: str, start: datetime | None = None, end: datetime | None = None
+    ) -> list[DateRange]:
+        """Return the windows of [start, end) not yet stored for ``symbol``.
+
+        Backends without coverage metadata report the whole request as missing.
+        """
+        return [(start, end)]
 
     def save_quotes(self, quotes: Iterable[Quote]) -> None: ...
 
+    def load_quotes(
+        self, symbol: str, start: datetime | None = None, end: datetime | None = None
+    ) -> Sequence[Quote]: ...
+
     def save_news(self, items: Iterable[NewsItem]) -> None: ...
 
     def load_news(
-        self, symbol: str | None = None, limit: int | None = None
+        self,
+        symbol: str | None = None,
+        limit: int | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
     ) -> Sequence[NewsItem]: ...
@@ -0,0 +1,116 @@
+"""In-process LRU cache for decoded Parquet frames."""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+
+FileSignature = tuple[int, int, int]
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how effective the cache has been."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+@dataclass
+class _CacheEntry:
+    signature: FileSignature
+    frame: pd.DataFrame
+    nbytes: int
+
+
+def file_signature(path: Path) -> FileSignature | None:
+    """Return (mtime_ns, size, inode) for a file, or None when it does not exist."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+class FrameCache:
+    """Byte-bounded LRU of frames keyed by file path.
+
+    Entries are validated against the file's signature on every lookup, so a file
+    rewritten by another process is re-read instead of served stale. Cached frames
+    are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive.")
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._entries: OrderedDict[Path, _CacheEntry] = OrderedDict()
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def current_bytes(self) -> int:
+        return self._current_bytes
+
+    def load(self, path: Path, loader: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """Return the cached frame for ``path`` or decode it with ``loader``."""
+        key = Path(path)
+        signature = file_signature(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.signature == signature:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return entry.frame
+            if entry is not None:
+                self._drop(key)
+                self.stats.invalidations += 1
+            self.stats.misses += 1
+
+        frame = loader()
+        if signature is not None:
+            self._store(key, signature, frame)
+        return frame
+
+    def invalidate(self, path: Path) -> None:
+        """Forget any cached frame for ``path``."""
+        key = Path(path)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+                self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+
+    def _store(self, key: Path, signature: FileSignature, frame: pd.DataFrame) -> None:
+        nbytes = int(frame.memory_usage(index=True, deep=True).sum())
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = _CacheEntry(signature=signature, frame=frame, nbytes=nbytes)
+            self._current_bytes += nbytes
+            while self._current_bytes > self.max_bytes:
+                evicted, _ = next(iter(self._entries.items()))
+                self._drop(evicted)
+                self.stats.evictions += 1
+
+    def _drop(self, key: Path) -> None:
+        entry = self._entries.pop(key)
+        self._current_bytes -= entry.nbytes
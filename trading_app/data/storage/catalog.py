@@ -0,0 +1,181 @@
+"""Per-symbol coverage manifest maintained alongside the Parquet store."""
+
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable
+
+from trading_app.data.schemas import PriceBar
+from trading_app.data.storage.cache import FileSignature, file_signature
+from trading_app.data.storage.locking import atomic_write, file_lock
+from trading_app.utils.time import ensure_utc
+
+CATALOG_FORMAT_VERSION = 1
+PRICE_SCHEMA_VERSION = 1
+
+DateRange = tuple[datetime | None, datetime | None]
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """Coverage metadata for one symbol's stored price history."""
+
+    symbol: str
+    first_timestamp: datetime
+    last_timestamp: datetime
+    row_count: int
+    last_bar: PriceBar
+    content_hash: str
+    schema_version: int = PRICE_SCHEMA_VERSION
+    gaps: tuple[tuple[datetime, datetime], ...] = field(default_factory=tuple)
+
+    def to_dict(self) -> dict[str, object]:
+        last_bar = asdict(self.last_bar)
+        last_bar["timestamp"] = self.last_bar.timestamp.isoformat()
+        return {
+            "symbol": self.symbol,
+            "first_timestamp": self.first_timestamp.isoformat(),
+            "last_timestamp": self.last_timestamp.isoformat(),
+            "row_count": self.row_count,
+            "last_bar": last_bar,
+            "content_hash": self.content_hash,
+            "schema_version": self.schema_version,
+            "gaps": [[start.isoformat(), end.isoformat()] for start, end in self.gaps],
+        }
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, object]) -> CatalogEntry:
+        last_bar = dict(raw["last_bar"])  # type: ignore[arg-type]
+        last_bar["timestamp"] = datetime.fromisoformat(last_bar["timestamp"])
+        return cls(
+            symbol=str(raw["symbol"]),
+            first_timestamp=datetime.fromisoformat(str(raw["first_timestamp"])),
+            last_timestamp=datetime.fromisoformat(str(raw["last_timestamp"])),
+            row_count=int(raw["row_count"]),  # type: ignore[arg-type]
+            last_bar=PriceBar(**last_bar),
+            content_hash=str(raw["content_hash"]),
+            schema_version=int(raw.get("schema_version", PRICE_SCHEMA_VERSION)),  # type: ignore[arg-type]
+            gaps=tuple(
+                (datetime.fromisoformat(start), datetime.fromisoformat(end))
+                for start, end in raw.get("gaps", [])  # type: ignore[union-attr]
+            ),
+        )
+
+
+def uncovered_windows(
+    first: datetime,
+    last: datetime,
+    gaps: Iterable[tuple[datetime, datetime]],
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> list[DateRange]:
+    """Return the parts of [start, end) outside stored coverage [first, last].
+
+    Uncovered leading history is only reported when ``start`` is given, and the
+    trailing window always starts at the last stored bar so that a re-run picks
+    up anything newer. Interior ``gaps`` are included when they overlap the
+    request. All datetimes must be timezone-aware.
+    """
+    windows: list[DateRange] = []
+    if start is not None and start < first:
+        windows.append((start, min(first, end) if end else first))
+    for gap_start, gap_end in gaps:
+        if (end is None or gap_start < end) and (start is None or gap_end > start):
+            windows.append(
+                (
+                    max(gap_start, start) if start else gap_start,
+                    min(gap_end, end) if end else gap_end,
+                )
+            )
+    if end is None or end > last:
+        windows.append((max(last, start) if start else last, end))
+    return windows
+
+
+class StoreCatalog:
+    """JSON manifest mapping each symbol to its ``CatalogEntry``.
+
+    Lookups are dictionary reads; the manifest is re-read only when the file on
+    disk changes (e.g. another process wrote to the same store).
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._entries: dict[str, CatalogEntry] = {}
+        self._signature: FileSignature | None = None
+        self._loaded = False
+        self._lock = threading.RLock()
+
+    def get(self, symbol: str) -> CatalogEntry | None:
+        self._refresh()
+        return self._entries.get(symbol)
+
+    def symbols(self) -> list[str]:
+        self._refresh()
+        return sorted(self._entries)
+
+    def update(self, entries: Iterable[CatalogEntry]) -> None:
+        """Insert or replace entries and persist the manifest.
+
+        The manifest is re-read under a file lock first, so concurrent writers
+        for different symbols do not drop each other's entries. Stored history only
+        grows, so an entry with fewer rows than the recorded one is stale (another
+        writer already recorded a newer state) and is ignored.
+        """
+        with self._lock, file_lock(self.path):
+            self._refresh()
+            for entry in entries:
+                current = self._entries.get(entry.symbol)
+                if current is not None and entry.row_count < current.row_count:
+                    continue
+                self._entries[entry.symbol] = entry
+            self._persist()
+
+    def replace_all(self, entries: Iterable[CatalogEntry]) -> None:
+        with self._lock, file_lock(self.path):
+            self._entries = {entry.symbol: entry for entry in entries}
+            self._loaded = True
+            self._persist()
+
+    def missing_ranges(
+        self, symbol: str, start: datetime | None = None, end: datetime | None = None
+    ) -> list[DateRange]:
+        """Return the sub-ranges of [start, end) not covered by stored bars."""
+        start = ensure_utc(start) if start is not None else None
+        end = ensure_utc(end) if end is not None else None
+        entry = self.get(symbol)
+        if entry is None:
+            return [(start, end)]
+        return uncovered_windows(
+            entry.first_timestamp, entry.last_timestamp, entry.gaps, start=start, end=end
+        )
+
+    # ---------- Internal helpers ----------
+    def _refresh(self) -> None:
+        with self._lock:
+            signature = file_signature(self.path)
+            if self._loaded and signature == self._signature:
+                return
+            self._entries = {}
+            if signature is not None:
+                raw = json.loads(self.path.read_text())
+                self._entries = {
+                    symbol: CatalogEntry.from_dict(entry)
+                    for symbol, entry in raw.get("prices", {}).items()
+                }
+            self._signature = signature
+            self._loaded = True
+
+    def _persist(self) -> None:
+        payload = {
+            "format_version": CATALOG_FORMAT_VERSION,
+            "prices": {symbol: entry.to_dict() for symbol, entry in sorted(self._entries.items())},
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        text = json.dumps(payload, indent=2, sort_keys=True)
+        atomic_write(self.path, lambda tmp_path: tmp_path.write_text(text))
+        self._signature = file_signature(self.path)
@@ -0,0 +1,254 @@
+"""Maintenance routines that rewrite Parquet store files into a tuned layout."""
+
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Sequence, TypeVar
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from trading_app.data.storage.locking import atomic_write, file_lock
+from trading_app.data.storage.parquet_store import (
+    NEWS_ROW_GROUP_SIZE,
+    ParquetDataStore,
+    quote_partition_lock,
+)
+
+T = TypeVar("T")
+
+DEFAULT_ROW_GROUP_SIZE = 128 * 1024
+
+# Low-cardinality string columns that benefit from dictionary encoding.
+_DICTIONARY_COLUMNS = ("symbol", "provider", "source", "sentiment")
+# Column each dataset is ordered by after compaction.
+_SORT_COLUMNS = {"prices": "timestamp", "news": "published_at"}
+
+
+@dataclass(frozen=True)
+class CompactionResult:
+    """Before/after layout statistics for one rewritten file.
+
+    Both read times are taken after a discarded warm-up read, so the OS page
+    cache holds the file in either case and only the layout differs.
+    """
+
+    path: Path
+    rows: int
+    bytes_before: int
+    bytes_after: int
+    row_groups_before: int
+    row_groups_after: int
+    read_seconds_before: float
+    read_seconds_after: float
+
+
+@dataclass(frozen=True)
+class CompactionReport:
+    """Aggregate outcome of a compaction run."""
+
+    files: list[CompactionResult]
+
+    @property
+    def bytes_before(self) -> int:
+        return sum(result.bytes_before for result in self.files)
+
+    @property
+    def bytes_after(self) -> int:
+        return sum(result.bytes_after for result in self.files)
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+    @property
+    def read_speedup(self) -> float:
+        """Ratio of total read time before compaction to read time after it."""
+        after = sum(result.read_seconds_after for result in self.files)
+        before = sum(result.read_seconds_before for result in self.files)
+        if after <= 0:
+            return 1.0
+        return before / after
+
+
+def compact_store(
+    store: ParquetDataStore,
+    *,
+    symbols: Sequence[str] | None = None,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    compression: str = "zstd",
+    compression_level: int | None = None,
+    workers: int = 4,
+) -> CompactionReport:
+    """Rewrite price and news files sorted, dictionary-encoded and re-chunked.
+
+    Quote partitions holding several append-only part files are merged into one.
+    Files are processed in parallel (pyarrow releases the GIL while encoding) and
+    each one is replaced atomically, so readers never observe a partial file.
+    Restrict the run to specific ``symbols`` to compact only their files.
+    News files keep ``NEWS_ROW_GROUP_SIZE`` row groups for indexed reads, and
+    the news ticker index is rebuilt once they have been rewritten.
+    """
+    if row_group_size <= 0:
+        raise ValueError("row_group_size must be positive.")
+
+    jobs: list[tuple[Path, str]] = []
+    for dataset, sort_column in _SORT_COLUMNS.items():
+        directory = store.root_path / dataset
+        if not directory.exists():
+            continue
+        for path in sorted(directory.glob("*.parquet")):
+            if path.name.startswith("_"):
+                # Side files such as the news ticker index keep their own ordering.
+                continue
+            if symbols is not None and path.stem not in symbols:
+                continue
+            jobs.append((path, sort_column))
+    quotes_dir = store.root_path / "quotes"
+    if quotes_dir.exists():
+        for partition in sorted(quotes_dir.glob("symbol=*/date=*")):
+            if symbols is not None and partition.parent.name.removeprefix("symbol=") not in symbols:
+                continue
+            jobs.append((partition, "timestamp"))
+
+    def run(job: tuple[Path, str]) -> CompactionResult | None:
+        path, sort_column = job
+        options = dict(
+            row_group_size=NEWS_ROW_GROUP_SIZE if path.parent.name == "news" else row_group_size,
+            compression=compression,
+            compression_level=compression_level,
+        )
+        if path.is_dir():
+            replaced = list(path.glob("part-*.parquet"))
+            result = compact_partition(path, sort_column=sort_column, **options)
+        else:
+            replaced = [path]
+            result = compact_file(path, sort_column=sort_column, **options)
+        if store.cache is not None:
+            for replaced_path in replaced:
+                store.cache.invalidate(replaced_path)
+        return result
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        results = [result for result in executor.map(run, jobs) if result is not None]
+    if any(path.parent.name == "news" for path, _sort_column in jobs):
+        # Row numbers changed, so postings of the old layout point at the wrong rows.
+        store.rebuild_news_index()
+    return CompactionReport(files=results)
+
+
+def compact_file(
+    path: Path,
+    *,
+    sort_column: str | None,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    compression: str = "zstd",
+    compression_level: int | None = None,
+) -> CompactionResult:
+    """Rewrite a single Parquet file into the tuned layout and report the change."""
+    with file_lock(path):
+        bytes_before = path.stat().st_size
+        row_groups_before = pq.ParquetFile(path).metadata.num_row_groups
+
+        table, read_seconds_before = _timed_read(lambda: pq.read_table(path))
+
+        if sort_column is not None and sort_column in table.column_names:
+            table = table.sort_by([(sort_column, "ascending")])
+        dictionary_columns = [name for name in _DICTIONARY_COLUMNS if name in table.column_names]
+        atomic_write(
+            path,
+            lambda tmp_path: pq.write_table(
+                table,
+                tmp_path,
+                row_group_size=row_group_size,
+                compression=compression,
+                compression_level=compression_level,
+                use_dictionary=dictionary_columns,
+            ),
+        )
+
+    _, read_seconds_after = _timed_read(lambda: pq.read_table(path))
+
+    return CompactionResult(
+        path=path,
+        rows=table.num_rows,
+        bytes_before=bytes_before,
+        bytes_after=path.stat().st_size,
+        row_groups_before=row_groups_before,
+        row_groups_after=pq.ParquetFile(path).metadata.num_row_groups,
+        read_seconds_before=read_seconds_before,
+        read_seconds_after=read_seconds_after,
+    )
+
+
+def compact_partition(
+    partition: Path,
+    *,
+    sort_column: str,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    compression: str = "zstd",
+    compression_level: int | None = None,
+) -> CompactionResult | None:
+    """Merge the append-only part files of one quote partition into a single file.
+
+    The partition stays locked from listing its parts until they are deleted,
+    so parts flushed meanwhile are neither lost nor merged twice. Returns None
+    for a partition without parts.
+    """
+    with file_lock(quote_partition_lock(partition)):
+        parts = sorted(partition.glob("part-*.parquet"))
+        if not parts:
+            return None
+        bytes_before = sum(path.stat().st_size for path in parts)
+        row_groups_before = sum(pq.ParquetFile(path).metadata.num_row_groups for path in parts)
+
+        df, read_seconds_before = _timed_read(
+            lambda: pd.concat(
+                [pd.read_parquet(path, engine="pyarrow") for path in parts], ignore_index=True
+            )
+        )
+
+        df = df.drop_duplicates(subset=["symbol", sort_column]).sort_values(sort_column)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        merged = partition / f"part-{time.time_ns()}-{os.getpid()}-compacted.parquet"
+        atomic_write(
+            merged,
+            lambda tmp_path: pq.write_table(
+                table,
+                tmp_path,
+                row_group_size=row_group_size,
+                compression=compression,
+                compression_level=compression_level,
+                use_dictionary=[name for name in _DICTIONARY_COLUMNS if name in table.column_names],
+            ),
+        )
+        # A crash before this loop finishes leaves duplicate rows, which readers drop.
+        for path in parts:
+            path.unlink()
+
+    # Same reader as the "before" timing, so only the layout differs.
+    _, read_seconds_after = _timed_read(lambda: pd.read_parquet(merged, engine="pyarrow"))
+
+    return CompactionResult(
+        path=partition,
+        rows=table.num_rows,
+        bytes_before=bytes_before,
+        bytes_after=merged.stat().st_size,
+        row_groups_before=row_groups_before,
+        row_groups_after=pq.ParquetFile(merged).metadata.num_row_groups,
+        read_seconds_before=read_seconds_before,
+        read_seconds_after=read_seconds_after,
+    )
+
+
+def _timed_read(read: Callable[[], T]) -> tuple[T, float]:
+    """Call ``read`` twice and time only the second, warm call."""
+    read()
+    started = time.perf_counter()
+    result = read()
+    return result, time.perf_counter() - started
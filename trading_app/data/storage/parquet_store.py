@@ -2,85 +2,599 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict
+import hashlib
+import itertools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, fields
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Callable, Iterable, Iterator, Sequence
 
+import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 
-from trading_app.data.schemas import NewsItem, PriceBar, Quote
+from trading_app.data.adjustments import (
+    AdjustmentFactors,
+    FactorCache,
+    actions_to_frame,
+    frame_to_actions,
+    previous_closes,
+)
+from trading_app.data.frames import (
+    PRICE_COLUMNS,
+    bars_to_frame,
+    frame_to_bars,
+    normalize_price_frame,
+    provider_rank,
+)
+from trading_app.data.instrumentation import PipelineContext, measure
+from trading_app.data.schemas import CorporateAction, NewsItem, PriceBar, Quote
 from trading_app.data.storage.base import DataStore
+from trading_app.data.storage.cache import FrameCache, file_signature
+from trading_app.data.storage.catalog import CatalogEntry, DateRange, StoreCatalog
+from trading_app.data.storage.locking import atomic_write, file_lock
+from trading_app.utils.time import ensure_utc
+
+# Small row groups let indexed news reads skip everything but the matching rows.
+NEWS_ROW_GROUP_SIZE = 4096
+NEWS_INDEX_ROW_GROUP_SIZE = 64 * 1024
 
 
 class ParquetDataStore(DataStore):
-    """Persists market/news data as Parquet files under a root directory."""
+    """Persists market/news data as Parquet files under a root directory.
+
+    Pass a ``FrameCache`` to keep decoded files in memory across reads; it is
+    invalidated whenever this store rewrites a file or the file changes on disk.
+    Every price write also refreshes ``catalog.json`` so coverage questions can be
+    answered without opening the data files. Runs of missing bars longer than
+    ``gap_threshold`` are recorded in the catalog as gaps.
+
+    Quotes are appended to ``quotes/symbol=<SYM>/date=<YYYY-MM-DD>/`` part files.
+    Set ``quote_buffer_rows`` to hold that many quotes in memory between flushes;
+    call ``flush()`` (or use the store as a context manager) to persist the rest.
+
+    Writes are safe to share between threads and processes: each file is rewritten
+    under a lock and swapped in atomically. ``price_buffer_rows`` (or a
+    ``coalesced_writes()`` block) merges many small ``save_prices`` calls into one
+    physical write per symbol.
 
-    def __init__(self, root_path: str) -> None:
+    When ``context`` is set (a ``PipelineContext``, attached automatically by
+    ``DataPipeline``), price writes record ``transform`` (normalization),
+    ``dedup`` (merge with the stored file) and ``write`` (bytes on disk) per symbol.
+
+    Splits and dividends saved with ``save_actions`` live in
+    ``actions/<SYM>.parquet``; price files always hold raw bars, and
+    ``load_prices(adjusted=True)`` applies cumulative factors at read time.
+    Factors are cached per symbol and rebuilt when its actions or price file change.
+    """
+
+    def __init__(
+        self,
+        root_path: str,
+        cache: FrameCache | None = None,
+        gap_threshold: timedelta = timedelta(days=7),
+        quote_buffer_rows: int = 0,
+        price_buffer_rows: int = 0,
+        context: PipelineContext | None = None,
+    ) -> None:
         self.root_path = Path(root_path)
         self.root_path.mkdir(parents=True, exist_ok=True)
+        self.cache = cache
+        self.gap_threshold = gap_threshold
+        self.catalog = StoreCatalog(self.root_path / "catalog.json")
+        self.quote_buffer_rows = quote_buffer_rows
+        self._quote_buffer: list[pd.DataFrame] = []
+        self._buffered_quote_rows = 0
+        self._quote_lock = threading.Lock()
+        self._part_counter = itertools.count()
+        self.price_buffer_rows = price_buffer_rows
+        self._price_buffer: list[tuple[pd.DataFrame, tuple[str, ...] | None, bool]] = []
+        self._buffered_price_rows = 0
+        self._coalesce_depth = 0
+        self._price_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self.context = context
+        self.adjustments = FactorCache(self._build_factors, self._factor_signature)
 
     # ---------- Prices ----------
     def _prices_path(self, symbol: str) -> Path:
         return self.root_path / "prices" / f"{symbol}.parquet"
 
     def save_prices(self, bars: Iterable[PriceBar]) -> None:
-        records = [asdict(bar) for bar in bars]
-        if not records:
+        df = bars_to_frame(bars)
+        if df.empty:
             return
-        df = pd.DataFrame(records)
-        if "timestamp" in df:
-            df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
+        self._save_price_frame(df)
+
+    def save_price_frame(
+        self,
+        df: pd.DataFrame,
+        provider_priority: Sequence[str] | None = None,
+        overwrite: bool = False,
+    ) -> None:
+        """Persist a columnar batch of bars (``PRICE_COLUMNS``) without building ``PriceBar``s.
 
+        Without ``provider_priority`` a bar already stored for the same
+        (symbol, timestamp) wins. With it, the bar whose provider appears earliest
+        in the list wins, whichever was written first; unlisted providers rank last.
+        ``overwrite=True`` makes the incoming bars win instead, e.g. for refetched
+        data the provider may have revised.
+        """
+        if provider_priority is not None and overwrite:
+            raise ValueError("Pass either provider_priority or overwrite, not both.")
+        if df.empty:
+            return
+        priority = tuple(provider_priority) if provider_priority is not None else None
+        with measure(self.context, "transform") as stage:
+            df = normalize_price_frame(df)
+            stage.rows = len(df)
+        self._save_price_frame(df, priority, overwrite)
+
+    def _save_price_frame(
+        self,
+        df: pd.DataFrame,
+        provider_priority: tuple[str, ...] | None = None,
+        overwrite: bool = False,
+    ) -> None:
+        """Write a price frame now, or park it in the coalescing buffer."""
+        with self._price_lock:
+            self._price_buffer.append((df, provider_priority, overwrite))
+            self._buffered_price_rows += len(df)
+            flush_now = (
+                self._coalesce_depth == 0 and self._buffered_price_rows >= self.price_buffer_rows
+            )
+        if flush_now:
+            self.flush_prices()
+
+    def flush_prices(self) -> None:
+        """Write buffered bars, one physical write per symbol.
+
+        Flushes run one at a time, so when this returns every bar buffered before
+        the call is on disk, even if another thread's flush picked it up. Frames
+        leave the buffer (and stop being served from it) only once written; if
+        a write fails they stay buffered for the next flush.
+        """
+        with self._flush_lock:
+            with self._price_lock:
+                # Only flushes remove entries, so this prefix stays put while we write.
+                buffered = list(self._price_buffer)
+            # Consecutive frames sharing a dedup policy are merged into one write.
+            for (provider_priority, overwrite), run in itertools.groupby(
+                buffered, key=lambda entry: entry[1:]
+            ):
+                frames = [frame for frame, *_policy in run]
+                # With ``overwrite`` the last write of a bar must win within the run too.
+                df = pd.concat(frames[::-1] if overwrite else frames, ignore_index=True)
+                self._write_price_frame(df, provider_priority, overwrite)
+                with self._price_lock:
+                    del self._price_buffer[: len(frames)]
+                    self._buffered_price_rows -= len(df)
+
+    @contextmanager
+    def coalesced_writes(self) -> Iterator[ParquetDataStore]:
+        """Buffer every ``save_prices`` call in the block and flush once at the end.
+
+        Many small writes for the same symbol collapse into a single rewrite of
+        its file. Nested blocks flush when the outermost one exits.
+        """
+        with self._price_lock:
+            self._coalesce_depth += 1
+        try:
+            yield self
+        finally:
+            with self._price_lock:
+                self._coalesce_depth -= 1
+                outermost = self._coalesce_depth == 0
+            if outermost:
+                self.flush_prices()
+
+    def _write_price_frame(
+        self,
+        df: pd.DataFrame,
+        provider_priority: Sequence[str] | None = None,
+        overwrite: bool = False,
+    ) -> None:
+        rank = (
+            (lambda frame: provider_rank(frame["provider"], provider_priority))
+            if provider_priority is not None
+            else None
+        )
+        entries: list[CatalogEntry] = []
         for symbol, sym_df in df.groupby("symbol"):
             path = self._prices_path(symbol)
-            self._write_deduped(
+            combined = self._write_deduped(
                 path=path,
                 df=sym_df,
                 time_cols=["timestamp"],
                 subset=["symbol", "timestamp"],
                 sort_by=["timestamp"],
+                rank=rank,
+                symbol=str(symbol),
+                overwrite=overwrite,
             )
+            entries.append(self._catalog_entry(str(symbol), combined))
+        self.catalog.update(entries)
 
-    def load_prices(self, symbol: str, limit: int | None = None) -> Sequence[PriceBar]:
+    def load_prices(
+        self,
+        symbol: str,
+        limit: int | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        adjusted: bool = False,
+    ) -> Sequence[PriceBar]:
+        """Return bars for ``symbol`` with ``start <= timestamp < end``, oldest first.
+
+        ``adjusted=True`` scales prices and volumes for splits and dividends.
+        """
+        return frame_to_bars(self._load_price_frame(symbol, limit, start, end, adjusted))
+
+    def load_price_frame(
+        self,
+        symbol: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        adjusted: bool = False,
+    ) -> pd.DataFrame:
+        """Like ``load_prices`` but returns the ``PRICE_COLUMNS`` frame itself."""
+        return self._load_price_frame(symbol, None, start, end, adjusted).reset_index(drop=True)
+
+    def iter_price_frames(
+        self,
+        symbol: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        batch_size: int = 65_536,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield bars in [start, end) as frames of at most ``batch_size`` rows, oldest first.
+
+        Files are stored sorted by timestamp, so row groups entirely outside the
+        window are skipped and only one batch is held in memory at a time.
+        Bars still in the write buffer are read whole, like ``load_price_frame``.
+        """
         path = self._prices_path(symbol)
-        if not path.exists():
-            return []
-        df = pd.read_parquet(path, engine="pyarrow")
+        if self._pending_prices(symbol, None, None) is not None or not path.exists():
+            df = self.load_price_frame(symbol, start=start, end=end)
+            for offset in range(0, len(df), batch_size):
+                yield df.iloc[offset : offset + batch_size].reset_index(drop=True)
+            return
+        start = pd.Timestamp(ensure_utc(start)) if start is not None else None
+        end = pd.Timestamp(ensure_utc(end)) if end is not None else None
+        parquet_file = pq.ParquetFile(path)
+        metadata = parquet_file.metadata
+        column = parquet_file.schema_arrow.get_field_index("timestamp")
+        groups = []
+        for index in range(metadata.num_row_groups):
+            stats = metadata.row_group(index).column(column).statistics
+            if stats is not None and stats.has_min_max:
+                if start is not None and pd.Timestamp(stats.max) < start:
+                    continue
+                if end is not None and pd.Timestamp(stats.min) >= end:
+                    break
+            groups.append(index)
+        if not groups:
+            return
+        for batch in parquet_file.iter_batches(batch_size=batch_size, row_groups=groups):
+            df = batch.to_pandas()
+            done = end is not None and df["timestamp"].iloc[-1] >= end
+            if start is not None:
+                df = df[df["timestamp"] >= start]
+            if end is not None:
+                df = df[df["timestamp"] < end]
+            if not df.empty:
+                yield df.reset_index(drop=True)
+            if done:
+                return
+
+    def _load_price_frame(
+        self,
+        symbol: str,
+        limit: int | None,
+        start: datetime | None,
+        end: datetime | None,
+        adjusted: bool,
+    ) -> pd.DataFrame:
+        path = self._prices_path(symbol)
+        pending = self._pending_prices(symbol, start, end)
+        if not path.exists() and pending is None:
+            return pd.DataFrame(columns=PRICE_COLUMNS)
+        df = self._read_price_frame(path, start, end) if path.exists() else pending
+        if pending is not None and df is not pending:
+            df = pd.concat([df, pending], ignore_index=True)
+            df = df.drop_duplicates(subset=["symbol", "timestamp"])
         df = df.sort_values("timestamp")
         if limit:
             df = df.tail(limit)
-        return [
-            PriceBar(
-                symbol=row.symbol,
-                timestamp=pd.to_datetime(row.timestamp).to_pydatetime(),
-                open=float(row.open),
-                high=float(row.high),
-                low=float(row.low),
-                close=float(row.close),
-                volume=float(row.volume) if pd.notna(row.volume) else None,
-                provider=row.provider,
+        if adjusted:
+            df = self.adjustments.get(symbol).apply(df)
+        return df
+
+    def _pending_prices(
+        self, symbol: str, start: datetime | None, end: datetime | None
+    ) -> pd.DataFrame | None:
+        """Buffered, not yet flushed bars for ``symbol`` within the window."""
+        with self._price_lock:
+            frames = [frame[frame["symbol"] == symbol] for frame, *_policy in self._price_buffer]
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return None
+        df = pd.concat(frames, ignore_index=True)
+        if start is not None:
+            df = df[df["timestamp"] >= ensure_utc(start)]
+        if end is not None:
+            df = df[df["timestamp"] < ensure_utc(end)]
+        return df.drop_duplicates(subset=["symbol", "timestamp"])
+
+    def _read_price_frame(
+        self, path: Path, start: datetime | None, end: datetime | None
+    ) -> pd.DataFrame:
+        if start is None and end is None:
+            return self._read_frame(path)
+        start = ensure_utc(start) if start is not None else None
+        end = ensure_utc(end) if end is not None else None
+        if self.cache is None:
+            filters = self._time_filters("timestamp", start, end)
+            return pd.read_parquet(path, engine="pyarrow", filters=filters)
+        df = self._read_frame(path)
+        mask = pd.Series(True, index=df.index)
+        if start is not None:
+            mask &= df["timestamp"] >= start
+        if end is not None:
+            mask &= df["timestamp"] < end
+        return df[mask]
+
+    # ---------- Catalog ----------
+    def list_symbols(self) -> list[str]:
+        """Return symbols with stored prices, according to the catalog."""
+        return self.catalog.symbols()
+
+    def coverage(self, symbol: str) -> CatalogEntry | None:
+        """Return catalog metadata for ``symbol`` without reading its data file."""
+        return self.catalog.get(symbol)
+
+    def latest_bar(self, symbol: str) -> PriceBar | None:
+        """Return the most recent stored bar for ``symbol`` from the catalog."""
+        entry = self.catalog.get(symbol)
+        if entry is not None:
+            return entry.last_bar
+        # Stores written before the catalog existed: fall back to the data file.
+        bars = self.load_prices(symbol, limit=1)
+        return bars[-1] if bars else None
+
+    def missing_ranges(
+        self, symbol: str, start: datetime | None = None, end: datetime | None = None
+    ) -> list[DateRange]:
+        """Return the windows of [start, end) that are not yet stored for ``symbol``."""
+        return self.catalog.missing_ranges(symbol, start=start, end=end)
+
+    def rebuild_catalog(self) -> int:
+        """Rebuild the catalog from the price files on disk; returns the symbol count."""
+        entries = []
+        for path in sorted((self.root_path / "prices").glob("*.parquet")):
+            df = self._read_frame(path).sort_values("timestamp").reset_index(drop=True)
+            if df.empty:
+                continue
+            df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
+            entries.append(self._catalog_entry(path.stem, df))
+        self.catalog.replace_all(entries)
+        return len(entries)
+
+    # ---------- Corporate actions ----------
+    def _actions_path(self, symbol: str) -> Path:
+        return self.root_path / "actions" / f"{symbol}.parquet"
+
+    def save_actions(self, actions: Iterable[CorporateAction]) -> None:
+        """Store split/dividend events; an event already stored for the same day and kind wins."""
+        df = actions_to_frame(actions)
+        for symbol, sym_df in df.groupby("symbol"):
+            self._write_deduped(
+                path=self._actions_path(str(symbol)),
+                df=sym_df,
+                time_cols=["ex_date"],
+                subset=["symbol", "ex_date", "kind"],
+                sort_by=["ex_date"],
             )
-            for row in df.itertuples()
-        ]
+            self.adjustments.invalidate(str(symbol))
+
+    def load_actions(self, symbol: str) -> list[CorporateAction]:
+        """Return stored corporate actions for ``symbol`` ordered by ex-date."""
+        path = self._actions_path(symbol)
+        if not path.exists():
+            return []
+        return frame_to_actions(self._read_frame(path))
+
+    def _build_factors(self, symbol: str) -> AdjustmentFactors:
+        actions_path = self._actions_path(symbol)
+        prices_path = self._prices_path(symbol)
+        if not actions_path.exists():
+            return AdjustmentFactors.identity()
+        actions = self._read_frame(actions_path)
+        closes = np.full(len(actions), np.nan)
+        if prices_path.exists():
+            prices = pd.read_parquet(prices_path, engine="pyarrow", columns=["timestamp", "close"])
+            closes = previous_closes(actions["ex_date"], prices["timestamp"], prices["close"])
+        return AdjustmentFactors.from_actions(actions, closes)
+
+    def _factor_signature(self, symbol: str) -> tuple[object, object]:
+        return (
+            file_signature(self._actions_path(symbol)),
+            file_signature(self._prices_path(symbol)),
+        )
 
     # ---------- Quotes ----------
     def _quotes_path(self) -> Path:
+        """Legacy single-file quote store, still read by ``load_quotes``."""
         return self.root_path / "quotes.parquet"
 
+    def _quotes_dir(self, symbol: str | None = None) -> Path:
+        base = self.root_path / "quotes"
+        return base / f"symbol={symbol}" if symbol else base
+
     def save_quotes(self, quotes: Iterable[Quote]) -> None:
+        """Buffer quotes and append them to symbol/date partitions in batches.
+
+        Each flush writes new part files only; nothing already on disk is rewritten.
+        With the default ``quote_buffer_rows=0`` every call flushes immediately.
+        """
         records = [asdict(q) for q in quotes]
         if not records:
             return
         df = pd.DataFrame(records)
         if "timestamp" in df:
             df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
-        self._write_deduped(
-            path=self._quotes_path(),
-            df=df,
-            time_cols=["timestamp"],
-            subset=["symbol", "timestamp"],
-            sort_by=["symbol", "timestamp"],
-        )
+        with self._quote_lock:
+            self._quote_buffer.append(df)
+            self._buffered_quote_rows += len(df)
+            should_flush = self._buffered_quote_rows >= self.quote_buffer_rows
+        if should_flush:
+            self.flush_quotes()
+
+    def flush_quotes(self) -> None:
+        """Write any buffered quotes to their partitions."""
+        with self._quote_lock:
+            if not self._quote_buffer:
+                return
+            df = pd.concat(self._quote_buffer, ignore_index=True)
+            self._quote_buffer = []
+            self._buffered_quote_rows = 0
+
+        df = df.drop_duplicates(subset=["symbol", "timestamp"])
+        df = df.sort_values(["symbol", "timestamp"]).reset_index(drop=True)
+        dates = df["timestamp"].dt.strftime("%Y-%m-%d")
+        for (symbol, date), part_df in df.groupby([df["symbol"], dates], sort=False):
+            partition = self._quotes_dir(str(symbol)) / f"date={date}"
+            partition.mkdir(parents=True, exist_ok=True)
+            name = f"part-{time.time_ns()}-{os.getpid()}-{next(self._part_counter)}.parquet"
+            # Compaction merges and deletes parts under the same lock.
+            with file_lock(quote_partition_lock(partition)):
+                atomic_write(
+                    partition / name,
+                    lambda tmp_path: part_df.to_parquet(
+                        tmp_path, engine="pyarrow", compression="snappy", index=False
+                    ),
+                )
+
+    def load_quotes(
+        self,
+        symbol: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> Sequence[Quote]:
+        """Return quotes for ``symbol`` with ``start <= timestamp < end``.
+
+        Only the date partitions overlapping the window are opened.
+        """
+        start = ensure_utc(start) if start is not None else None
+        end = ensure_utc(end) if end is not None else None
+        frames = self._quote_partition_frames(symbol, start, end)
+        df = self._filter_quotes(symbol, frames, start, end)
+        return self._frame_to_quotes(df)
+
+    def quote_asof(self, symbol: str, at: datetime) -> Quote | None:
+        """Return the latest quote for ``symbol`` at or before ``at``.
+
+        Partitions are scanned newest first and the scan stops at the first
+        partition holding a qualifying quote.
+        """
+        at = ensure_utc(at)
+        end = at + timedelta(microseconds=1)
+        symbol_dir = self._quotes_dir(symbol)
+        partitions = sorted(symbol_dir.glob("date=*"), reverse=True) if symbol_dir.exists() else []
+        cutoff = at.strftime("%Y-%m-%d")
+        extra = self._quote_extra_frames(symbol)
+        for partition in partitions:
+            if partition.name.removeprefix("date=") > cutoff:
+                continue
+            df = self._filter_quotes(symbol, [*self._read_parts(partition), *extra], None, end)
+            if not df.empty:
+                return self._frame_to_quotes(df.tail(1))[0]
+        df = self._filter_quotes(symbol, extra, None, end)
+        return self._frame_to_quotes(df.tail(1))[0] if not df.empty else None
+
+    def _quote_partition_frames(
+        self, symbol: str, start: datetime | None, end: datetime | None
+    ) -> list[pd.DataFrame]:
+        symbol_dir = self._quotes_dir(symbol)
+        frames: list[pd.DataFrame] = []
+        if symbol_dir.exists():
+            first = start.strftime("%Y-%m-%d") if start is not None else None
+            last = end.strftime("%Y-%m-%d") if end is not None else None
+            for partition in sorted(symbol_dir.glob("date=*")):
+                date = partition.name.removeprefix("date=")
+                if (first is not None and date < first) or (last is not None and date > last):
+                    continue
+                frames.extend(self._read_parts(partition))
+        frames.extend(self._quote_extra_frames(symbol))
+        return frames
+
+    def _quote_extra_frames(self, symbol: str) -> list[pd.DataFrame]:
+        """Legacy single-file quotes plus anything still sitting in the buffer."""
+        frames: list[pd.DataFrame] = []
+        legacy = self._quotes_path()
+        if legacy.exists():
+            frames.append(
+                pd.read_parquet(legacy, engine="pyarrow", filters=[("symbol", "==", symbol)])
+            )
+        with self._quote_lock:
+            frames.extend(self._quote_buffer)
+        return frames
+
+    def _read_parts(self, partition: Path) -> list[pd.DataFrame]:
+        return [self._read_frame(path) for path in sorted(partition.glob("part-*.parquet"))]
+
+    @staticmethod
+    def _filter_quotes(
+        symbol: str,
+        frames: Sequence[pd.DataFrame],
+        start: datetime | None,
+        end: datetime | None,
+    ) -> pd.DataFrame:
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame(columns=[field.name for field in fields(Quote)])
+        df = pd.concat(frames, ignore_index=True)
+        df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
+        mask = df["symbol"] == symbol
+        if start is not None:
+            mask &= df["timestamp"] >= start
+        if end is not None:
+            mask &= df["timestamp"] < end
+        df = df[mask].drop_duplicates(subset=["symbol", "timestamp"])
+        return df.sort_values("timestamp")
+
+    @staticmethod
+    def _frame_to_quotes(df: pd.DataFrame) -> list[Quote]:
+        return [
+            Quote(
+                symbol=row.symbol,
+                timestamp=pd.to_datetime(row.timestamp).to_pydatetime(),
+                bid=float(row.bid),
+                ask=float(row.ask),
+                bid_size=float(row.bid_size) if pd.notna(row.bid_size) else None,
+                ask_size=float(row.ask_size) if pd.notna(row.ask_size) else None,
+                provider=row.provider if pd.notna(row.provider) else None,
+            )
+            for row in df.itertuples()
+        ]
+
+    # ---------- Lifecycle ----------
+    def flush(self) -> None:
+        """Persist everything held in write buffers."""
+        self.flush_prices()
+        self.flush_quotes()
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> ParquetDataStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     # ---------- News ----------
     def _news_path(self, symbol: str | None = None) -> Path:
@@ -88,6 +602,9 @@ class ParquetDataStore(DataStore):
             return self.root_path / "news" / f"{symbol}.parquet"
         return self.root_path / "news" / "all.parquet"
 
+    def _news_index_path(self) -> Path:
+        return self.root_path / "news" / "_index.parquet"
+
     def save_news(self, items: Iterable[NewsItem]) -> None:
         records = [asdict(item) for item in items]
         if not records:
@@ -96,18 +613,54 @@ class ParquetDataStore(DataStore):
         if "published_at" in df:
             df["published_at"] = pd.to_datetime(df["published_at"], utc=True)
         symbols = df["symbol"].fillna("all").unique()
+        written: dict[str, pd.DataFrame] = {}
+        with file_lock(self._news_index_path()):
+            self._save_news_frames(df, symbols, written)
+            self._update_news_index(written)
+
+    def _save_news_frames(
+        self, df: pd.DataFrame, symbols: Sequence[str], written: dict[str, pd.DataFrame]
+    ) -> None:
         for sym in symbols:
             sym_df = df[df["symbol"].fillna("all") == sym]
             path = self._news_path(sym if sym != "all" else None)
-            self._write_deduped(
+            written[path.stem] = self._write_deduped(
                 path=path,
                 df=sym_df,
                 time_cols=["published_at"],
                 subset=["id"],
                 sort_by=["published_at"],
+                row_group_size=NEWS_ROW_GROUP_SIZE,
             )
 
-    def load_news(self, symbol: str | None = None, limit: int | None = None) -> Sequence[NewsItem]:
+    def load_news(
+        self,
+        symbol: str | None = None,
+        limit: int | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> Sequence[NewsItem]:
+        """Return news for ``symbol`` published in [start, end), oldest first.
+
+        When a ticker index exists, every stored article whose ``symbol`` or
+        ``tickers`` mention ``symbol`` is returned, and only the row groups holding
+        those articles are read. Otherwise the per-symbol file (or ``all.parquet``)
+        is scanned with the time filter pushed down to the Parquet reader.
+        """
+        start = ensure_utc(start) if start is not None else None
+        end = ensure_utc(end) if end is not None else None
+        if symbol:
+            postings = self._news_postings(symbol, start, end)
+            if postings is not None and postings.empty:
+                # The index lists every mention, so no postings means no articles.
+                return []
+            if postings is not None:
+                if limit:
+                    postings = postings.tail(limit)
+                df = self._read_news_rows(postings)
+                if df is not None:
+                    return self._frame_to_news(df)
+
         path = self._news_path(symbol)
         fallback = self._news_path(None)
         if not path.exists():
@@ -115,10 +668,136 @@ class ParquetDataStore(DataStore):
                 path = fallback
             else:
                 return []
-        df = pd.read_parquet(path, engine="pyarrow")
-        df = df.sort_values("published_at")
+        if start is None and end is None:
+            df = self._read_frame(path)
+        else:
+            df = pd.read_parquet(
+                path, engine="pyarrow", filters=self._time_filters("published_at", start, end)
+            )
+        df = df.sort_values("published_at", kind="stable")
         if limit:
             df = df.tail(limit)
+        return self._frame_to_news(df)
+
+    def rebuild_news_index(self) -> int:
+        """Rebuild the ticker index from the news files; returns the posting count."""
+        index_path = self._news_index_path()
+        with file_lock(index_path):
+            if index_path.exists():
+                index_path.unlink()
+            news_dir = self.root_path / "news"
+            written = {
+                path.stem: self._read_frame(path)
+                for path in sorted(news_dir.glob("*.parquet"))
+                if path != index_path
+            }
+            return self._update_news_index(written)
+
+    def _update_news_index(self, written: dict[str, pd.DataFrame]) -> int:
+        """Replace the postings of each rewritten news file with fresh offsets."""
+        postings = []
+        for file_key, df in written.items():
+            item_tickers = df["tickers"] if "tickers" in df else [None] * len(df)
+            tickers = [
+                self._article_tickers(sym, mentioned)
+                for sym, mentioned in zip(df["symbol"], item_tickers)
+            ]
+            file_postings = pd.DataFrame(
+                {
+                    "ticker": tickers,
+                    "id": df["id"].astype(str).to_numpy(),
+                    "file": file_key,
+                    "row": range(len(df)),
+                    "published_at": df["published_at"].to_numpy(),
+                }
+            ).explode("ticker")
+            postings.append(file_postings.dropna(subset=["ticker"]))
+
+        index_path = self._news_index_path()
+        if index_path.exists():
+            existing = pd.read_parquet(index_path, engine="pyarrow")
+            postings.insert(0, existing[~existing["file"].isin(list(written))])
+        index = pd.concat(postings, ignore_index=True)
+        index["published_at"] = pd.to_datetime(index["published_at"], utc=True)
+        index["row"] = index["row"].astype("int64")
+        index = index.sort_values(["ticker", "published_at"]).reset_index(drop=True)
+        atomic_write(
+            index_path,
+            lambda tmp_path: index.to_parquet(
+                tmp_path,
+                engine="pyarrow",
+                compression="snappy",
+                index=False,
+                row_group_size=NEWS_INDEX_ROW_GROUP_SIZE,
+            ),
+        )
+        return len(index)
+
+    @staticmethod
+    def _article_tickers(symbol: object, tickers: object) -> list[str]:
+        mentioned = set(tickers) if isinstance(tickers, (list, tuple, np.ndarray)) else set()
+        if isinstance(symbol, str) and symbol:
+            mentioned.add(symbol)
+        return sorted(str(ticker) for ticker in mentioned)
+
+    def _news_postings(
+        self, ticker: str, start: datetime | None, end: datetime | None
+    ) -> pd.DataFrame | None:
+        """Index rows for ``ticker`` in the window, one per article, oldest first."""
+        index_path = self._news_index_path()
+        if not index_path.exists():
+            return None
+        filters = [("ticker", "==", ticker), *self._time_filters("published_at", start, end)]
+        postings = pd.read_parquet(index_path, engine="pyarrow", filters=filters)
+        postings = postings.sort_values(["published_at", "file", "row"], kind="stable")
+        return postings.drop_duplicates(subset=["id"], keep="last")
+
+    def _read_news_rows(self, postings: pd.DataFrame) -> pd.DataFrame | None:
+        """Read only the row groups that hold the posted rows.
+
+        Returns None when a file no longer matches its postings (e.g. it was
+        rewritten outside this store), after rebuilding the index.
+        """
+        frames = []
+        for file_key, file_postings in postings.groupby("file", sort=False):
+            path = self.root_path / "news" / f"{file_key}.parquet"
+            if not path.exists():
+                self.rebuild_news_index()
+                return None
+            parquet_file = pq.ParquetFile(path)
+            metadata = parquet_file.metadata
+            group_starts = np.cumsum(
+                [0] + [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+            )
+            rows = file_postings["row"].to_numpy()
+            groups = np.searchsorted(group_starts, rows, side="right") - 1
+            wanted = np.unique(groups)
+            table = parquet_file.read_row_groups(wanted.tolist())
+            # Map global row offsets onto positions within the concatenated row groups.
+            local_starts = np.cumsum([0] + [metadata.row_group(g).num_rows for g in wanted])
+            positions = local_starts[np.searchsorted(wanted, groups)] + rows - group_starts[groups]
+            df = table.take(positions).to_pandas()
+            if list(df["id"].astype(str)) != list(file_postings["id"]):
+                self.rebuild_news_index()
+                return None
+            frames.append(df)
+        df = pd.concat(frames, ignore_index=True)
+        df["published_at"] = pd.to_datetime(df["published_at"], utc=True)
+        return df.sort_values("published_at", kind="stable")
+
+    @staticmethod
+    def _time_filters(
+        column: str, start: datetime | None, end: datetime | None
+    ) -> list[tuple[str, str, object]]:
+        filters: list[tuple[str, str, object]] = []
+        if start is not None:
+            filters.append((column, ">=", pd.Timestamp(start)))
+        if end is not None:
+            filters.append((column, "<", pd.Timestamp(end)))
+        return filters
+
+    @staticmethod
+    def _frame_to_news(df: pd.DataFrame) -> list[NewsItem]:
         return [
             NewsItem(
                 id=str(row.id),
@@ -138,6 +817,33 @@ class ParquetDataStore(DataStore):
         ]
 
     # ---------- Internal helpers ----------
+    def _catalog_entry(self, symbol: str, df: pd.DataFrame) -> CatalogEntry:
+        """Summarize a sorted, deduplicated price frame for the catalog."""
+        timestamps = df["timestamp"]
+        deltas = timestamps.diff()
+        gap_mask = (deltas > self.gap_threshold).to_numpy()
+        gap_ends = timestamps[gap_mask]
+        gap_starts = timestamps.shift(1)[gap_mask]
+        content = pd.util.hash_pandas_object(df[PRICE_COLUMNS], index=False).to_numpy()
+        return CatalogEntry(
+            symbol=symbol,
+            first_timestamp=timestamps.iloc[0].to_pydatetime(),
+            last_timestamp=timestamps.iloc[-1].to_pydatetime(),
+            row_count=len(df),
+            last_bar=frame_to_bars(df.tail(1))[0],
+            content_hash=hashlib.sha256(content.tobytes()).hexdigest(),
+            gaps=tuple(
+                (start.to_pydatetime(), end.to_pydatetime())
+                for start, end in zip(gap_starts, gap_ends)
+            ),
+        )
+
+    def _read_frame(self, path: Path) -> pd.DataFrame:
+        """Read a parquet file, going through the frame cache when configured."""
+        if self.cache is None:
+            return pd.read_parquet(path, engine="pyarrow")
+        return self.cache.load(path, lambda: pd.read_parquet(path, engine="pyarrow"))
+
     def _write_deduped(
         self,
         path: Path,
@@ -145,19 +851,63 @@ class ParquetDataStore(DataStore):
         time_cols: Sequence[str],
         subset: Sequence[str],
         sort_by: Sequence[str],
-    ) -> None:
-        """Write a dataframe to parquet with deduplication and ordering."""
+        row_group_size: int | None = None,
+        rank: Callable[[pd.DataFrame], np.ndarray] | None = None,
+        symbol: str | None = None,
+        overwrite: bool = False,
+    ) -> pd.DataFrame:
+        """Write a dataframe to parquet with deduplication and ordering.
+
+        Duplicates keep the existing row unless ``overwrite`` is set or ``rank``
+        is given, in which case the lowest-ranked row wins (ties still keep the
+        existing row).
+        The read-merge-write cycle runs under an exclusive lock on ``path`` and the
+        new file is renamed into place, so concurrent writers cannot lose rows and
+        a crash cannot leave a truncated file behind. With a ``context``, the merge
+        is recorded as ``dedup`` and the file write as ``write`` under ``symbol``.
+        """
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        combined = df
-        if path.exists():
-            existing = pd.read_parquet(path, engine="pyarrow")
-            combined = pd.concat([existing, df], ignore_index=True)
+        with file_lock(path):
+            with measure(self.context, "dedup", symbol=symbol) as stage:
+                combined = df
+                if path.exists():
+                    existing = self._read_frame(path)
+                    parts = [df, existing] if overwrite else [existing, df]
+                    combined = pd.concat(parts, ignore_index=True)
+
+                for col in time_cols:
+                    # Frames normalized on the way in already hold UTC datetimes.
+                    if col in combined and not _is_utc(combined[col]):
+                        combined[col] = pd.to_datetime(combined[col], utc=True)
+
+                if rank is not None:
+                    order = np.argsort(rank(combined), kind="stable")
+                    combined = combined.iloc[order]
+                combined = combined.drop_duplicates(subset=list(subset))
+                combined = combined.sort_values(list(sort_by), kind="stable").reset_index(drop=True)
+                stage.rows = len(combined)
+            options = {"row_group_size": row_group_size} if row_group_size else {}
+            with measure(self.context, "write", symbol=symbol) as stage:
+                atomic_write(
+                    path,
+                    lambda tmp_path: combined.to_parquet(
+                        tmp_path, engine="pyarrow", compression="snappy", index=False, **options
+                    ),
+                )
+                stage.rows = len(combined)
+                stage.bytes_written = path.stat().st_size
+        if self.cache is not None:
+            self.cache.invalidate(path)
+        return combined
+
+
+def quote_partition_lock(partition: Path) -> Path:
+    """Path whose ``file_lock`` guards adding and removing the parts of a quote partition."""
+    # Kept inside the partition so its sidecar never shows up among the date directories.
+    return partition / "_parts"
 
-        for col in time_cols:
-            if col in combined:
-                combined[col] = pd.to_datetime(combined[col], utc=True)
 
-        combined = combined.drop_duplicates(subset=list(subset))
-        combined = combined.sort_values(list(sort_by)).reset_index(drop=True)
-        combined.to_parquet(path, engine="pyarrow", compression="snappy", index=False)
+def _is_utc(values: pd.Series) -> bool:
+    dtype = values.dtype
+    return isinstance(dtype, pd.DatetimeTZDtype) and str(dtype.tz) == "UTC"
@@ -0,0 +1,494 @@
+"""SQLite-backed implementation of the DataStore protocol."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+import pandas as pd
+
+from trading_app.data.adjustments import (
+    AdjustmentFactors,
+    FactorCache,
+    actions_to_frame,
+    frame_to_actions,
+)
+from trading_app.data.frames import (
+    PRICE_COLUMNS,
+    bars_to_frame,
+    frame_to_bars,
+    normalize_price_frame,
+)
+from trading_app.data.schemas import CorporateAction, NewsItem, PriceBar, Quote
+from trading_app.data.storage.base import DataStore
+from trading_app.data.storage.catalog import DateRange, uncovered_windows
+from trading_app.utils.time import datetime_to_ns, ensure_utc, ns_to_datetime
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS prices (
+    symbol TEXT NOT NULL,
+    ts INTEGER NOT NULL,
+    open REAL NOT NULL,
+    high REAL NOT NULL,
+    low REAL NOT NULL,
+    close REAL NOT NULL,
+    volume REAL,
+    provider TEXT,
+    PRIMARY KEY (symbol, ts)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS quotes (
+    symbol TEXT NOT NULL,
+    ts INTEGER NOT NULL,
+    bid REAL NOT NULL,
+    ask REAL NOT NULL,
+    bid_size REAL,
+    ask_size REAL,
+    provider TEXT,
+    PRIMARY KEY (symbol, ts)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS news (
+    id TEXT PRIMARY KEY,
+    symbol TEXT,
+    published_at INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    source TEXT NOT NULL,
+    sentiment TEXT,
+    tickers TEXT
+);
+
+CREATE TABLE IF NOT EXISTS actions (
+    symbol TEXT NOT NULL,
+    ex_ts INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    value REAL NOT NULL,
+    provider TEXT,
+    PRIMARY KEY (symbol, ex_ts, kind)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS news_symbol_time ON news (symbol, published_at);
+
+CREATE TABLE IF NOT EXISTS news_tickers (
+    ticker TEXT NOT NULL,
+    published_at INTEGER NOT NULL,
+    id TEXT NOT NULL,
+    PRIMARY KEY (ticker, published_at, id)
+) WITHOUT ROWID;
+"""
+
+_PRICE_COLUMNS = "symbol, ts, open, high, low, close, volume, provider"
+_QUOTE_COLUMNS = "symbol, ts, bid, ask, bid_size, ask_size, provider"
+_NEWS_COLUMNS = "id, symbol, published_at, title, summary, source, sentiment, tickers"
+_ACTION_COLUMNS = "symbol, ex_ts, kind, value, provider"
+
+
+def _provider_rank_sql(column: str, priority: Sequence[str]) -> str:
+    """SQL expression ranking ``column`` by its position in ``priority``."""
+    if not priority:
+        return "0"
+    cases = " ".join(
+        f"WHEN '{provider.replace(chr(39), chr(39) * 2)}' THEN {position}"
+        for position, provider in enumerate(priority)
+    )
+    return f"(CASE {column} {cases} ELSE {len(priority)} END)"
+
+
+class SQLiteDataStore(DataStore):
+    """Persists market/news data in a single SQLite database file.
+
+    Rows are keyed by (symbol, timestamp) with timestamps stored as integer UTC
+    nanoseconds, so range scans and latest-bar lookups are primary-key seeks.
+    Duplicate keys are resolved with ``ON CONFLICT DO NOTHING``, matching the
+    keep-existing semantics of ``ParquetDataStore``. The database runs in WAL
+    mode so readers are not blocked by a concurrent writer.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = 10_000,
+        gap_threshold: timedelta = timedelta(days=7),
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.gap_threshold = gap_threshold
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._writes = 0
+        self.adjustments = FactorCache(self._build_factors, self._factor_signature)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> SQLiteDataStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    # ---------- Prices ----------
+    def save_prices(self, bars: Iterable[PriceBar]) -> None:
+        rows = (
+            (
+                bar.symbol,
+                datetime_to_ns(bar.timestamp),
+                bar.open,
+                bar.high,
+                bar.low,
+                bar.close,
+                bar.volume,
+                bar.provider,
+            )
+            for bar in bars
+        )
+        self._insert_prices(rows)
+
+    def save_price_frame(
+        self, df: pd.DataFrame, provider_priority: Sequence[str] | None = None
+    ) -> None:
+        """Insert a price frame, converting timestamps to nanoseconds column-wise.
+
+        With ``provider_priority`` an existing bar is replaced when the incoming
+        bar's provider ranks earlier in the list (unlisted providers rank last).
+        """
+        if df.empty:
+            return
+        df = normalize_price_frame(df)
+        volume = df["volume"].astype(object).where(df["volume"].notna(), None)
+        rows = zip(
+            df["symbol"].tolist(),
+            df["timestamp"].dt.as_unit("ns").astype("int64").tolist(),
+            df["open"].tolist(),
+            df["high"].tolist(),
+            df["low"].tolist(),
+            df["close"].tolist(),
+            volume.tolist(),
+            df["provider"].tolist(),
+        )
+        self._insert_prices(rows, provider_priority)
+
+    def _insert_prices(
+        self, rows: Iterable[tuple[object, ...]], provider_priority: Sequence[str] | None = None
+    ) -> None:
+        conflict = "DO NOTHING"
+        if provider_priority is not None:
+            conflict = (
+                "DO UPDATE SET open = excluded.open, high = excluded.high, low = excluded.low, "
+                "close = excluded.close, volume = excluded.volume, provider = excluded.provider "
+                f"WHERE {_provider_rank_sql('excluded.provider', provider_priority)} "
+                f"< {_provider_rank_sql('prices.provider', provider_priority)}"
+            )
+        self._writes += 1
+        self._insert_batched(
+            f"INSERT INTO prices ({_PRICE_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+            f"ON CONFLICT (symbol, ts) {conflict}",
+            rows,
+        )
+
+    def load_prices(
+        self,
+        symbol: str,
+        limit: int | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        adjusted: bool = False,
+    ) -> Sequence[PriceBar]:
+        where, params = self._range_clause("ts", start, end)
+        query = f"SELECT {_PRICE_COLUMNS} FROM prices WHERE symbol = ?{where}"
+        rows = self._select_tail(query, "ts", [symbol, *params], limit)
+        bars = [self._row_to_bar(row) for row in rows]
+        if adjusted and bars:
+            factors = self.adjustments.get(symbol)
+            if not factors.empty:
+                return frame_to_bars(factors.apply(bars_to_frame(bars)))
+        return bars
+
+    def load_price_frame(
+        self,
+        symbol: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        adjusted: bool = False,
+    ) -> pd.DataFrame:
+        """Like ``load_prices`` but as one ``PRICE_COLUMNS`` frame, without ``PriceBar``s."""
+        where, params = self._range_clause("ts", start, end)
+        query = f"SELECT {_PRICE_COLUMNS} FROM prices WHERE symbol = ?{where}"
+        rows = self._select_tail(query, "ts", [symbol, *params], None)
+        df = pd.DataFrame(rows, columns=PRICE_COLUMNS)
+        df["timestamp"] = pd.to_datetime(df["timestamp"].astype("int64"), unit="ns", utc=True)
+        for column in ("open", "high", "low", "close", "volume"):
+            df[column] = df[column].astype("float64")
+        if adjusted:
+            df = self.adjustments.get(symbol).apply(df)
+        return df
+
+    def latest_bar(self, symbol: str) -> PriceBar | None:
+        """Return the most recent stored bar for ``symbol``."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_PRICE_COLUMNS} FROM prices WHERE symbol = ? ORDER BY ts DESC LIMIT 1",
+                (symbol,),
+            ).fetchone()
+        return self._row_to_bar(row) if row is not None else None
+
+    def list_symbols(self) -> list[str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT DISTINCT symbol FROM prices ORDER BY symbol")
+            return [row[0] for row in rows]
+
+    def missing_ranges(
+        self, symbol: str, start: datetime | None = None, end: datetime | None = None
+    ) -> list[DateRange]:
+        """Return the windows of [start, end) not yet stored for ``symbol``.
+
+        Coverage bounds come from the primary key; interior gaps longer than
+        ``gap_threshold`` are found with a single ordered pass over the symbol.
+        """
+        start = ensure_utc(start) if start is not None else None
+        end = ensure_utc(end) if end is not None else None
+        threshold_ns = int(self.gap_threshold.total_seconds() * 1_000_000_000)
+        with self._lock:
+            first, last = self._conn.execute(
+                "SELECT MIN(ts), MAX(ts) FROM prices WHERE symbol = ?", (symbol,)
+            ).fetchone()
+            if first is None:
+                return [(start, end)]
+            gaps = self._conn.execute(
+                "SELECT prev_ts, ts FROM ("
+                "SELECT ts, LAG(ts) OVER (ORDER BY ts) AS prev_ts FROM prices WHERE symbol = ?"
+                ") WHERE ts - prev_ts > ?",
+                (symbol, threshold_ns),
+            ).fetchall()
+        return uncovered_windows(
+            ns_to_datetime(first),
+            ns_to_datetime(last),
+            [(ns_to_datetime(gap_start), ns_to_datetime(gap_end)) for gap_start, gap_end in gaps],
+            start=start,
+            end=end,
+        )
+
+    # ---------- Corporate actions ----------
+    def save_actions(self, actions: Iterable[CorporateAction]) -> None:
+        """Store split/dividend events; an event already stored for the same day and kind wins."""
+        df = actions_to_frame(actions)
+        rows = zip(
+            df["symbol"].tolist(),
+            df["ex_date"].dt.as_unit("ns").astype("int64").tolist(),
+            df["kind"].tolist(),
+            df["value"].tolist(),
+            df["provider"].tolist(),
+        )
+        self._writes += 1
+        self._insert_batched(
+            f"INSERT INTO actions ({_ACTION_COLUMNS}) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (symbol, ex_ts, kind) DO NOTHING",
+            rows,
+        )
+        for symbol in df["symbol"].unique():
+            self.adjustments.invalidate(symbol)
+
+    def load_actions(self, symbol: str) -> list[CorporateAction]:
+        return frame_to_actions(self._actions_frame(symbol))
+
+    def _actions_frame(self, symbol: str) -> pd.DataFrame:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_ACTION_COLUMNS} FROM actions WHERE symbol = ? ORDER BY ex_ts, kind",
+                (symbol,),
+            ).fetchall()
+        df = pd.DataFrame(rows, columns=["symbol", "ex_ts", "kind", "value", "provider"])
+        df.insert(1, "ex_date", pd.to_datetime(df.pop("ex_ts"), unit="ns", utc=True))
+        return df
+
+    def _build_factors(self, symbol: str) -> AdjustmentFactors:
+        actions = self._actions_frame(symbol)
+        if actions.empty:
+            return AdjustmentFactors.identity()
+        with self._lock:
+            closes = [
+                self._conn.execute(
+                    "SELECT close FROM prices WHERE symbol = ? AND ts < ? ORDER BY ts DESC LIMIT 1",
+                    (symbol, ex_ts),
+                ).fetchone()
+                for ex_ts in actions["ex_date"].dt.as_unit("ns").astype("int64").tolist()
+            ]
+        previous = np.array([row[0] if row else np.nan for row in closes], dtype="float64")
+        return AdjustmentFactors.from_actions(actions, previous)
+
+    def _factor_signature(self, symbol: str) -> tuple[int, int]:
+        """Changes after any write here or a commit from another connection."""
+        with self._lock:
+            (data_version,) = self._conn.execute("PRAGMA data_version").fetchone()
+        return self._writes, data_version
+
+    # ---------- Quotes ----------
+    def save_quotes(self, quotes: Iterable[Quote]) -> None:
+        rows = (
+            (
+                quote.symbol,
+                datetime_to_ns(quote.timestamp),
+                quote.bid,
+                quote.ask,
+                quote.bid_size,
+                quote.ask_size,
+                quote.provider,
+            )
+            for quote in quotes
+        )
+        self._insert_batched(
+            f"INSERT INTO quotes ({_QUOTE_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (symbol, ts) DO NOTHING",
+            rows,
+        )
+
+    def load_quotes(
+        self, symbol: str, start: datetime | None = None, end: datetime | None = None
+    ) -> Sequence[Quote]:
+        where, params = self._range_clause("ts", start, end)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_QUOTE_COLUMNS} FROM quotes WHERE symbol = ?{where} ORDER BY ts",
+                (symbol, *params),
+            ).fetchall()
+        return [
+            Quote(
+                symbol=row[0],
+                timestamp=ns_to_datetime(row[1]),
+                bid=row[2],
+                ask=row[3],
+                bid_size=row[4],
+                ask_size=row[5],
+                provider=row[6],
+            )
+            for row in rows
+        ]
+
+    # ---------- News ----------
+    def save_news(self, items: Iterable[NewsItem]) -> None:
+        items = list(items)
+        news_rows = [
+            (
+                item.id,
+                item.symbol,
+                datetime_to_ns(item.published_at),
+                item.title,
+                item.summary,
+                item.source,
+                item.sentiment,
+                json.dumps(list(item.tickers)) if item.tickers is not None else None,
+            )
+            for item in items
+        ]
+        ticker_rows = [
+            (ticker, datetime_to_ns(item.published_at), item.id)
+            for item in items
+            for ticker in {*(item.tickers or ()), *([item.symbol] if item.symbol else ())}
+        ]
+        self._insert_batched(
+            f"INSERT INTO news ({_NEWS_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (id) DO NOTHING",
+            news_rows,
+        )
+        self._insert_batched(
+            "INSERT INTO news_tickers (ticker, published_at, id) VALUES (?, ?, ?) "
+            "ON CONFLICT DO NOTHING",
+            ticker_rows,
+        )
+
+    def load_news(
+        self,
+        symbol: str | None = None,
+        limit: int | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> Sequence[NewsItem]:
+        """Return news mentioning ``symbol`` (or untagged news when None), oldest first."""
+        where, params = self._range_clause("published_at", start, end)
+        if symbol:
+            query = (
+                f"SELECT {_NEWS_COLUMNS} FROM news WHERE id IN "
+                f"(SELECT id FROM news_tickers WHERE ticker = ?{where})"
+            )
+            args = [symbol, *params]
+        else:
+            query = f"SELECT {_NEWS_COLUMNS} FROM news WHERE symbol IS NULL{where}"
+            args = list(params)
+        rows = self._select_tail(query, "published_at", args, limit)
+        return [
+            NewsItem(
+                id=row[0],
+                symbol=row[1],
+                published_at=ns_to_datetime(row[2]),
+                title=row[3],
+                summary=row[4],
+                source=row[5],
+                sentiment=row[6],
+                tickers=json.loads(row[7]) if row[7] is not None else None,
+            )
+            for row in rows
+        ]
+
+    # ---------- Internal helpers ----------
+    def _insert_batched(self, statement: str, rows: Iterable[tuple[object, ...]]) -> None:
+        """Insert rows with ``executemany`` in chunks, one transaction per call."""
+        batch: list[tuple[object, ...]] = []
+        with self._lock, self._conn:
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= self.batch_size:
+                    self._conn.executemany(statement, batch)
+                    batch = []
+            if batch:
+                self._conn.executemany(statement, batch)
+
+    def _select_tail(
+        self, query: str, order_column: str, params: Sequence[object], limit: int | None
+    ) -> list[tuple[object, ...]]:
+        """Run ``query`` ordered ascending, keeping only the last ``limit`` rows."""
+        with self._lock:
+            if limit:
+                rows = self._conn.execute(
+                    f"{query} ORDER BY {order_column} DESC LIMIT ?", (*params, limit)
+                ).fetchall()
+                rows.reverse()
+                return rows
+            return self._conn.execute(f"{query} ORDER BY {order_column}", params).fetchall()
+
+    @staticmethod
+    def _range_clause(
+        column: str, start: datetime | None, end: datetime | None
+    ) -> tuple[str, list[int]]:
+        clause = ""
+        params: list[int] = []
+        if start is not None:
+            clause += f" AND {column} >= ?"
+            params.append(datetime_to_ns(start))
+        if end is not None:
+            clause += f" AND {column} < ?"
+            params.append(datetime_to_ns(end))
+        return clause, params
+
+    @staticmethod
+    def _row_to_bar(row: Sequence[Any]) -> PriceBar:
+        return PriceBar(
+            symbol=row[0],
+            timestamp=ns_to_datetime(row[1]),
+            open=row[2],
+            high=row[3],
+            low=row[4],
+            close=row[5],
+            volume=row[6],
+            provider=row[7],
+        )
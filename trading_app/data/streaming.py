@@ -0,0 +1,226 @@
+"""Fan-in of several live market streams into one arrival-ordered stream."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Iterator, Literal, Sequence
+
+from trading_app.data.schemas import PriceBar
+from trading_app.data.sources.base import MarketDataSource
+
+OverflowPolicy = Literal["block", "drop_oldest", "coalesce"]
+OVERFLOW_POLICIES: tuple[str, ...] = ("block", "drop_oldest", "coalesce")
+
+# How often a producer blocked on a full buffer re-checks for shutdown.
+_POLL_SECONDS = 0.05
+
+
+@dataclass
+class SourceStreamStats:
+    """Per-source counters of a fan-in run.
+
+    Lag is the time a bar spent buffered between arriving from its source and
+    being handed to the consumer.
+    """
+
+    received: int = 0
+    emitted: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    high_water: int = 0
+    total_lag_seconds: float = 0.0
+    max_lag_seconds: float = 0.0
+    finished: bool = False
+    error: BaseException | None = None
+
+    @property
+    def mean_lag_seconds(self) -> float:
+        return self.total_lag_seconds / self.emitted if self.emitted else 0.0
+
+
+class _Entry:
+    __slots__ = ("seq", "arrived", "bar")
+
+    def __init__(self, seq: int, arrived: float, bar: PriceBar) -> None:
+        self.seq = seq
+        self.arrived = arrived
+        self.bar = bar
+
+
+class _SourceBuffer:
+    """Bounded per-source buffer; every method runs under the fan-in's lock."""
+
+    def __init__(self, capacity: int, policy: str, stats: SourceStreamStats) -> None:
+        self.capacity = capacity
+        self.policy = policy
+        self.stats = stats
+        self.entries: deque[_Entry] = deque()
+        self.by_symbol: dict[str, _Entry] = {}
+        self.done = False
+
+    def full(self) -> bool:
+        return len(self.entries) >= self.capacity
+
+    def offer(self, bar: PriceBar, seq: int, arrived: float) -> None:
+        """Add ``bar``, applying the overflow policy."""
+        if self.policy == "coalesce":
+            waiting = self.by_symbol.get(bar.symbol)
+            if waiting is not None:
+                waiting.bar = bar
+                waiting.arrived = arrived
+                self.stats.coalesced += 1
+                return
+        if self.full():
+            self._discard(self.entries.popleft())
+            self.stats.dropped += 1
+        entry = _Entry(seq, arrived, bar)
+        self.entries.append(entry)
+        if self.policy == "coalesce":
+            self.by_symbol[bar.symbol] = entry
+        self.stats.high_water = max(self.stats.high_water, len(self.entries))
+
+    def pop(self) -> _Entry:
+        entry = self.entries.popleft()
+        self._discard(entry)
+        return entry
+
+    def _discard(self, entry: _Entry) -> None:
+        if self.by_symbol.get(entry.bar.symbol) is entry:
+            del self.by_symbol[entry.bar.symbol]
+
+
+class LiveFanIn:
+    """Reads every source's ``stream_live`` concurrently and merges them by arrival.
+
+    Each source is drained by its own thread into a buffer of at most
+    ``buffer_size`` bars, so an infinite or stalled source never starves the
+    others. ``policy`` decides what happens when the consumer falls behind:
+    ``"block"`` pauses that source until there is room, ``"drop_oldest"``
+    discards the oldest buffered bar, and ``"coalesce"`` keeps only the newest
+    waiting bar per symbol (dropping the oldest when the buffer is full of
+    distinct symbols). ``stats`` holds a ``SourceStreamStats`` per source name.
+
+    A failing source is recorded in its stats and the others keep streaming;
+    the error is raised only if every source failed. Threads reading sources
+    that never return cannot be interrupted and are left to finish as daemons.
+    """
+
+    def __init__(
+        self,
+        sources: Sequence[MarketDataSource],
+        buffer_size: int = 1024,
+        policy: OverflowPolicy = "block",
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        if buffer_size <= 0:
+            raise ValueError("buffer_size must be positive.")
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"policy must be one of {', '.join(OVERFLOW_POLICIES)}.")
+        self.sources = list(sources)
+        self.buffer_size = buffer_size
+        self.policy = policy
+        self.stats: dict[str, SourceStreamStats] = {}
+        self._clock = clock
+
+    # ---------- Async stream ----------
+    async def astream(self, symbols: Sequence[str]) -> AsyncIterator[PriceBar]:
+        """Yield bars from all sources in the order they arrived."""
+        self.stats.clear()
+        if not symbols or not self.sources:
+            return
+        loop = asyncio.get_running_loop()
+        ready = asyncio.Event()
+        lock = threading.Condition()
+        stop = threading.Event()
+        buffers = [
+            _SourceBuffer(
+                self.buffer_size,
+                self.policy,
+                self.stats.setdefault(source.name, SourceStreamStats()),
+            )
+            for source in self.sources
+        ]
+        counter = itertools.count()
+
+        def notify() -> None:
+            try:
+                loop.call_soon_threadsafe(ready.set)
+            except RuntimeError:  # loop already closed
+                pass
+
+        def produce(source: MarketDataSource, buffer: _SourceBuffer) -> None:
+            try:
+                for bar in source.stream_live(symbols):
+                    with lock:
+                        while self.policy == "block" and buffer.full() and not stop.is_set():
+                            lock.wait(_POLL_SECONDS)
+                        if stop.is_set():
+                            return
+                        buffer.stats.received += 1
+                        buffer.offer(bar, next(counter), self._clock())
+                    notify()
+            except BaseException as exc:  # noqa: BLE001 - surfaced through stats
+                buffer.stats.error = exc
+            finally:
+                with lock:
+                    buffer.done = True
+                    buffer.stats.finished = True
+                notify()
+
+        for source, buffer in zip(self.sources, buffers):
+            threading.Thread(target=produce, args=(source, buffer), daemon=True).start()
+
+        try:
+            while True:
+                ready.clear()
+                with lock:
+                    entry, done = self._next_entry(buffers)
+                    if entry is not None:
+                        lock.notify_all()
+                if entry is not None:
+                    yield entry.bar
+                elif done:
+                    break
+                else:
+                    await ready.wait()
+        finally:
+            stop.set()
+            with lock:
+                lock.notify_all()
+
+        errors = [buffer.stats.error for buffer in buffers if buffer.stats.error is not None]
+        if errors and len(errors) == len(buffers):
+            raise errors[0]
+
+    def _next_entry(self, buffers: list[_SourceBuffer]) -> tuple[_Entry | None, bool]:
+        """Pop the earliest-arrived bar across buffers; also report whether all are done."""
+        candidates = [buffer for buffer in buffers if buffer.entries]
+        if not candidates:
+            return None, all(buffer.done for buffer in buffers)
+        buffer = min(candidates, key=lambda candidate: candidate.entries[0].seq)
+        entry = buffer.pop()
+        lag = self._clock() - entry.arrived
+        buffer.stats.emitted += 1
+        buffer.stats.total_lag_seconds += lag
+        buffer.stats.max_lag_seconds = max(buffer.stats.max_lag_seconds, lag)
+        return entry, False
+
+    # ---------- Sync adapter ----------
+    def stream(self, symbols: Sequence[str]) -> Iterator[PriceBar]:
+        """Blocking iterator over ``astream`` for callers without an event loop."""
+        loop = asyncio.new_event_loop()
+        stream = self.astream(symbols)
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(stream.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            loop.run_until_complete(stream.aclose())
+            loop.close()
@@ -0,0 +1,336 @@
+"""Vectorized data-quality checks for price batches before they are stored."""
+
+from __future__ import annotations
+
+import itertools
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Mapping
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from trading_app.data.frames import PRICE_COLUMNS
+from trading_app.data.storage.locking import atomic_write
+
+# A custom rule maps a price frame to a boolean mask of rows that fail it.
+Rule = Callable[[pd.DataFrame], np.ndarray]
+
+BUILTIN_RULES: tuple[str, ...] = (
+    "non_finite",
+    "non_positive_price",
+    "negative_volume",
+    "ohlc_inconsistent",
+    "conflicting_duplicate",
+    "spike",
+)
+
+# Scales a median absolute deviation to a normal standard deviation.
+_MAD_TO_SIGMA = 1.4826
+# Returns sampled per symbol to estimate its scale; the median barely moves beyond this.
+_SCALE_SAMPLE = 2048
+
+
+@dataclass(frozen=True)
+class ValidationRules:
+    """Which built-in checks run, and their thresholds.
+
+    ``spike_sigma`` flags closes whose log return is that many robust standard
+    deviations (1.4826 × median absolute return of the symbol within the batch)
+    away from zero; the move back from a flagged spike is not flagged again.
+    Symbols with fewer than ``spike_min_bars`` returns in a batch skip the
+    spike check. ``ohlc_tolerance`` is the relative slack allowed when comparing
+    high/low against open/close.
+    """
+
+    non_finite: bool = True
+    non_positive_price: bool = True
+    negative_volume: bool = True
+    ohlc_inconsistent: bool = True
+    conflicting_duplicate: bool = True
+    spike_sigma: float | None = 50.0
+    spike_min_bars: int = 20
+    ohlc_tolerance: float = 1e-9
+
+
+@dataclass
+class ValidationSummary:
+    """Row counts of one or more validated batches, with failures per rule."""
+
+    rows: int = 0
+    quarantined: int = 0
+    seconds: float = 0.0
+    failures: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    def merge(self, other: ValidationSummary) -> None:
+        self.rows += other.rows
+        self.quarantined += other.quarantined
+        self.seconds += other.seconds
+        for rule, count in other.failures.items():
+            self.failures[rule] = self.failures.get(rule, 0) + count
+
+
+@dataclass
+class ValidationResult:
+    """A validated batch split into rows to keep and rows set aside."""
+
+    clean: pd.DataFrame
+    quarantined: pd.DataFrame
+    summary: ValidationSummary
+
+
+class PriceValidator:
+    """Checks whole price frames (``PRICE_COLUMNS``) with NumPy array operations.
+
+    Rows failing any enabled rule are removed from the batch. When
+    ``quarantine_dir`` is set they are also appended there as Parquet part
+    files, with a ``reasons`` column naming every rule they failed. ``rules``
+    selects the built-in checks and ``custom_rules`` adds named checks of
+    the form ``frame -> bool mask``. ``summary`` accumulates over every batch
+    and is safe to share between threads.
+
+    Return-based checks look at consecutive bars of a symbol within the batch,
+    so they are most effective on batches holding whole per-symbol histories.
+    """
+
+    def __init__(
+        self,
+        rules: ValidationRules = ValidationRules(),
+        custom_rules: Mapping[str, Rule] | None = None,
+        quarantine_dir: str | Path | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.rules = rules
+        self.custom_rules = dict(custom_rules or {})
+        self.quarantine_dir = Path(quarantine_dir) if quarantine_dir is not None else None
+        self.summary = ValidationSummary()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._part_counter = itertools.count()
+
+    def validate(self, df: pd.DataFrame) -> ValidationResult:
+        """Split ``df`` into clean and quarantined rows and record the outcome."""
+        started = self._clock()
+        failures = self.check(df)
+        bad = np.zeros(len(df), dtype=bool)
+        for mask in failures.values():
+            bad |= mask
+
+        quarantined = df.iloc[np.flatnonzero(bad)]
+        clean = df.iloc[np.flatnonzero(~bad)] if bad.any() else df
+        summary = ValidationSummary(
+            rows=len(df),
+            quarantined=int(bad.sum()),
+            failures={rule: int(mask.sum()) for rule, mask in failures.items()},
+        )
+        if summary.quarantined and self.quarantine_dir is not None:
+            self._quarantine(quarantined, {rule: mask[bad] for rule, mask in failures.items()})
+        summary.seconds = self._clock() - started
+        with self._lock:
+            self.summary.merge(summary)
+        return ValidationResult(clean=clean, quarantined=quarantined, summary=summary)
+
+    def check(self, df: pd.DataFrame) -> dict[str, np.ndarray]:
+        """Return one boolean failure mask per enabled rule."""
+        rules = self.rules
+        count = len(df)
+        failures: dict[str, np.ndarray] = {}
+        if count == 0:
+            return failures
+        open_ = df["open"].to_numpy(dtype="float64")
+        high = df["high"].to_numpy(dtype="float64")
+        low = df["low"].to_numpy(dtype="float64")
+        close = df["close"].to_numpy(dtype="float64")
+        volume = df["volume"].to_numpy(dtype="float64", na_value=np.nan, copy=False)
+
+        with np.errstate(invalid="ignore", over="ignore"):
+            # The sum is finite exactly when every price is (barring overflow near 1e308).
+            finite = np.isfinite(open_ + high + low + close)
+            if rules.non_finite:
+                failures["non_finite"] = ~finite | np.isinf(volume)
+            bottom = np.minimum(open_, close)
+            if rules.non_positive_price:
+                failures["non_positive_price"] = np.minimum(np.minimum(bottom, low), high) <= 0
+            if rules.negative_volume:
+                failures["negative_volume"] = volume < 0
+            if rules.ohlc_inconsistent:
+                slack = 1.0 + rules.ohlc_tolerance
+                top = np.maximum(open_, close)
+                failures["ohlc_inconsistent"] = (high * slack < top) | (low > bottom * slack)
+
+        if rules.conflicting_duplicate or rules.spike_sigma is not None:
+            order, starts = _symbol_runs(df)
+            if rules.conflicting_duplicate:
+                failures["conflicting_duplicate"] = _conflicting_duplicates(
+                    df, order, starts, (open_, high, low, close, volume)
+                )
+            if rules.spike_sigma is not None:
+                failures["spike"] = _spikes(
+                    np.where(finite & (close > 0), close, np.nan),
+                    order,
+                    starts,
+                    rules.spike_sigma,
+                    rules.spike_min_bars,
+                )
+
+        for name, rule in self.custom_rules.items():
+            failures[name] = np.asarray(rule(df), dtype=bool)
+        return failures
+
+    def reset(self) -> ValidationSummary:
+        """Return the accumulated summary and start a new one."""
+        with self._lock:
+            summary, self.summary = self.summary, ValidationSummary()
+        return summary
+
+    def _quarantine(self, rows: pd.DataFrame, failures: dict[str, np.ndarray]) -> None:
+        reasons = np.full(len(rows), "", dtype=object)
+        for rule, mask in failures.items():
+            reasons[mask] = np.where(reasons[mask] == "", rule, reasons[mask] + "," + rule)
+        out = rows.reindex(columns=PRICE_COLUMNS).reset_index(drop=True)
+        out["reasons"] = reasons
+        self.quarantine_dir.mkdir(parents=True, exist_ok=True)
+        name = f"part-{time.time_ns()}-{os.getpid()}-{next(self._part_counter)}.parquet"
+        atomic_write(
+            self.quarantine_dir / name,
+            lambda tmp_path: out.to_parquet(tmp_path, engine="pyarrow", index=False),
+        )
+
+
+def load_quarantine(quarantine_dir: str | Path) -> pd.DataFrame:
+    """Read every quarantined row written under ``quarantine_dir``."""
+    parts = sorted(Path(quarantine_dir).glob("part-*.parquet"))
+    if not parts:
+        return pd.DataFrame(columns=[*PRICE_COLUMNS, "reasons"])
+    return pd.concat([pd.read_parquet(part, engine="pyarrow") for part in parts], ignore_index=True)
+
+
+# ---------- Internal helpers ----------
+def _symbol_runs(df: pd.DataFrame) -> tuple[np.ndarray | None, np.ndarray]:
+    """Row order grouping symbols with ascending timestamps, plus run start offsets.
+
+    Batches that already hold each symbol as one time-ordered run (the usual
+    case) need no sort, and ``order`` is ``None``; others are sorted stably.
+    """
+    symbols = df["symbol"]
+    stamps = _timestamps(df)
+    starts = np.flatnonzero(np.concatenate(([True], _changes(symbols))))
+    within = _same_run_as_previous(len(df), starts)
+    ordered = not (within[1:] & (stamps[1:] < stamps[:-1])).any()
+    if ordered and symbols.iloc[starts].nunique(dropna=False) == len(starts):
+        return None, starts
+    codes = pd.factorize(symbols.to_numpy(dtype=object))[0]
+    order = np.lexsort((stamps, codes))
+    codes = codes[order]
+    starts = np.flatnonzero(np.concatenate(([True], codes[1:] != codes[:-1])))
+    return order, starts
+
+
+def _changes(symbols: pd.Series) -> np.ndarray:
+    """``symbols[i + 1] != symbols[i]`` without materializing Python strings when possible."""
+    dtype = symbols.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        codes = symbols.cat.codes.to_numpy()
+        return codes[1:] != codes[:-1]
+    if isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow":
+        values = pa.array(symbols.array)
+        return np.asarray(pc.not_equal(values[1:], values[:-1]).fill_null(True))
+    values = symbols.to_numpy(dtype=object)
+    return values[1:] != values[:-1]
+
+
+def _timestamps(df: pd.DataFrame) -> np.ndarray:
+    """Integer timestamps (in the column's own unit) for ordering and equality tests."""
+    values = df["timestamp"].array
+    if isinstance(values, pd.arrays.DatetimeArray):
+        return values.asi8
+    return pd.DatetimeIndex(df["timestamp"]).asi8
+
+
+def _in_order(values: np.ndarray, order: np.ndarray | None) -> np.ndarray:
+    return values if order is None else values[order]
+
+
+def _to_rows(mask: np.ndarray, order: np.ndarray | None) -> np.ndarray:
+    """Map a mask over ordered rows back to the batch's row positions."""
+    if order is None:
+        return mask
+    out = np.zeros_like(mask)
+    out[order] = mask
+    return out
+
+
+def _same_run_as_previous(count: int, starts: np.ndarray) -> np.ndarray:
+    same = np.ones(count, dtype=bool)
+    same[starts] = False
+    return same
+
+
+def _conflicting_duplicates(
+    df: pd.DataFrame,
+    order: np.ndarray | None,
+    starts: np.ndarray,
+    columns: tuple[np.ndarray, ...],
+) -> np.ndarray:
+    """Flag every row sharing (symbol, timestamp) with a row holding different values."""
+    count = len(df)
+    stamps = _in_order(_timestamps(df), order)
+    repeat = _same_run_as_previous(count, starts)[1:] & (stamps[1:] == stamps[:-1])
+    if not repeat.any():
+        return np.zeros(count, dtype=bool)
+    differs = np.zeros(count - 1, dtype=bool)
+    for values in columns:
+        ordered = _in_order(values, order)
+        before, after = ordered[:-1], ordered[1:]
+        differs |= (before != after) & ~(np.isnan(before) & np.isnan(after))
+    conflict = repeat & differs
+    # A (symbol, timestamp) with any conflicting pair quarantines all of its rows.
+    group = np.cumsum(np.concatenate(([True], ~repeat)))
+    bad_groups = np.unique(group[1:][conflict])
+    return _to_rows(np.isin(group, bad_groups), order)
+
+
+def _spikes(
+    close: np.ndarray,
+    order: np.ndarray | None,
+    starts: np.ndarray,
+    sigma: float,
+    min_bars: int,
+) -> np.ndarray:
+    """Flag bars whose close jumps ``sigma`` robust deviations and is not a reversion."""
+    count = len(close)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        returns = np.diff(np.log(_in_order(close, order)), prepend=np.nan)
+    returns[starts] = np.nan
+    magnitude = np.abs(returns)
+
+    big = np.zeros(count, dtype=bool)
+    ends = np.append(starts[1:], count)
+    with np.errstate(invalid="ignore"):
+        for start, end in zip(starts, ends):
+            if end - start <= min_bars:
+                continue
+            sample = magnitude[start : end : max(1, (end - start) // _SCALE_SAMPLE)]
+            sample = sample[np.isfinite(sample)]
+            if len(sample) < min_bars:
+                continue
+            scale = _MAD_TO_SIGMA * np.median(sample)
+            if scale > 0:
+                np.greater(magnitude[start:end], sigma * scale, out=big[start:end])
+
+    # Spikes are rare, so only flagged bars are tested for being the move back from one.
+    flagged = np.flatnonzero(big)
+    if len(flagged):
+        previous = flagged - 1
+        reverts = big[previous] & (np.sign(returns[flagged]) != np.sign(returns[previous]))
+        big[flagged[reverts]] = False
+    return _to_rows(big, order)
@@ -0,0 +1,68 @@
+"""Commission and slippage models for simulated execution."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Protocol
+
+from trading_app.execution.orders import Order, OrderSide
+
+
+class CommissionModel(Protocol):
+    """Prices the fee charged for one fill."""
+
+    def commission(self, order: Order, price: float, quantity: float) -> float:
+        """Fee in cash for filling ``quantity`` of ``order`` at ``price``."""
+        ...
+
+
+class SlippageModel(Protocol):
+    """Moves the reference price to the price a fill actually gets."""
+
+    def fill_price(self, order: Order, price: float) -> float:
+        """Execution price for ``order`` when the market trades at ``price``."""
+        ...
+
+
+@dataclass(frozen=True)
+class NoCommission:
+    def commission(self, order: Order, price: float, quantity: float) -> float:
+        return 0.0
+
+
+@dataclass(frozen=True)
+class PerShareCommission:
+    """``per_share`` per unit filled, but at least ``minimum`` per fill."""
+
+    per_share: float
+    minimum: float = 0.0
+
+    def commission(self, order: Order, price: float, quantity: float) -> float:
+        return max(self.per_share * quantity, self.minimum)
+
+
+@dataclass(frozen=True)
+class PercentCommission:
+    """``rate`` of the fill's notional (``0.001`` is 10 bps)."""
+
+    rate: float
+
+    def commission(self, order: Order, price: float, quantity: float) -> float:
+        return self.rate * price * quantity
+
+
+@dataclass(frozen=True)
+class NoSlippage:
+    def fill_price(self, order: Order, price: float) -> float:
+        return price
+
+
+@dataclass(frozen=True)
+class FixedBpsSlippage:
+    """Buys pay ``bps`` basis points above the price, sells receive as much below."""
+
+    bps: float
+
+    def fill_price(self, order: Order, price: float) -> float:
+        shift = price * self.bps / 10_000.0
+        return price + shift if order.side is OrderSide.BUY else price - shift
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from enum import Enum
 from typing import Literal
@@ -39,3 +40,78 @@ class Fill:
     fill_price: float
     fill_qty: float
     commission: float | None = None
+
+
+# ---------- Compact variants ----------
+# Slotted records with interned symbols and an optional integer UTC-nanosecond
+# timestamp, for simulations that keep millions of orders and fills in memory.
+
+
+@dataclass(slots=True)
+class CompactOrder:
+    """Memory-compact ``Order``; ``ts_ns`` optionally records when it was created."""
+
+    symbol: str
+    quantity: float
+    side: OrderSide
+    type: OrderType = OrderType.MARKET
+    limit_price: float | None = None
+    stop_price: float | None = None
+    time_in_force: Literal["DAY", "GTC"] = "DAY"
+    ts_ns: int | None = None
+
+    @classmethod
+    def from_order(cls, order: Order, ts_ns: int | None = None) -> CompactOrder:
+        return cls(
+            symbol=sys.intern(order.symbol),
+            quantity=order.quantity,
+            side=order.side,
+            type=order.type,
+            limit_price=order.limit_price,
+            stop_price=order.stop_price,
+            time_in_force=order.time_in_force,
+            ts_ns=ts_ns,
+        )
+
+    def to_order(self) -> Order:
+        return Order(
+            symbol=self.symbol,
+            quantity=self.quantity,
+            side=self.side,
+            type=self.type,
+            limit_price=self.limit_price,
+            stop_price=self.stop_price,
+            time_in_force=self.time_in_force,
+        )
+
+
+@dataclass(slots=True)
+class CompactFill:
+    """Memory-compact ``Fill``; ``ts_ns`` optionally records the execution time."""
+
+    order: CompactOrder
+    fill_price: float
+    fill_qty: float
+    commission: float | None = None
+    ts_ns: int | None = None
+
+    @classmethod
+    def from_fill(
+        cls, fill: Fill, ts_ns: int | None = None, order_ts_ns: int | None = None
+    ) -> CompactFill:
+        """``ts_ns`` stamps the execution; ``order_ts_ns`` is when the order was created."""
+        return cls(
+            order=CompactOrder.from_order(fill.order, ts_ns=order_ts_ns),
+            fill_price=fill.fill_price,
+            fill_qty=fill.fill_qty,
+            commission=fill.commission,
+            ts_ns=ts_ns,
+        )
+
+    def to_fill(self) -> Fill:
+        return Fill(
+            order=self.order.to_order(),
+            fill_price=self.fill_price,
+            fill_qty=self.fill_qty,
+            commission=self.commission,
+        )
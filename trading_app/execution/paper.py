@@ -0,0 +1,67 @@
+"""Paper trading: a strategy on a live bar stream with simulated execution."""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from trading_app.data.schemas import CompactPriceBar, PriceBar
+from trading_app.execution.orders import Fill, Order
+from trading_app.execution.simulated_broker import SimulatedBroker
+from trading_app.portfolio.models import PortfolioState
+from trading_app.strategies.base import Strategy
+
+
+class PaperTrader:
+    """Feeds bars from a live stream (e.g. ``DataPipeline.stream_live``) to a strategy.
+
+    Orders go through a ``SimulatedBroker`` with the same rules as
+    ``BacktestEngine``, so a strategy trades the same bars the same way in
+    either. Call ``on_bar`` yourself to drive it from an event loop, or
+    ``run`` to consume a whole (possibly endless) stream.
+    """
+
+    def __init__(
+        self,
+        strategy: Strategy,
+        broker: SimulatedBroker | None = None,
+        starting_cash: float = 100_000.0,
+    ) -> None:
+        self.strategy = strategy
+        self.broker = broker if broker is not None else SimulatedBroker()
+        self.state = PortfolioState(cash=starting_cash, equity=starting_cash)
+        self.orders: list[Order] = []
+        self.fills: list[Fill] = []
+        self._started = False
+
+    def start(self) -> None:
+        """Reset the broker and book the strategy's opening orders."""
+        self.broker.reset()
+        orders = list(self.strategy.on_start(self.state))
+        self.orders.extend(orders)
+        self.broker.submit_orders(orders, self.state)
+        self._started = True
+
+    def on_bar(self, bar: PriceBar | CompactPriceBar) -> list[Fill]:
+        """Trade one bar; returns the fills it produced."""
+        if not self._started:
+            self.start()
+        fills = self.broker.process_bar(bar, self.state)
+        orders = list(self.strategy.on_bar(bar, self.state))
+        self.orders.extend(orders)
+        fills.extend(self.broker.submit_orders(orders, self.state))
+        self.state.equity = self.broker.mark_to_market(self.state)
+        self.fills.extend(fills)
+        return fills
+
+    def run(
+        self, bars: Iterable[PriceBar | CompactPriceBar], max_bars: int | None = None
+    ) -> PortfolioState:
+        """Trade bars until the stream ends or ``max_bars`` were seen, then finish the strategy."""
+        try:
+            for count, bar in enumerate(bars, 1):
+                self.on_bar(bar)
+                if max_bars is not None and count >= max_bars:
+                    break
+        finally:
+            self.strategy.on_finish(self.state)
+        return self.state
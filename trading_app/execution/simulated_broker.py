@@ -0,0 +1,312 @@
+"""Simulated execution against bar prices with a per-symbol, price-indexed order book."""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterable
+
+from trading_app.data.schemas import CompactPriceBar, PriceBar
+from trading_app.execution.costs import CommissionModel, NoCommission, NoSlippage, SlippageModel
+from trading_app.execution.orders import Fill, Order, OrderSide, OrderType
+from trading_app.portfolio.models import PortfolioState, Position
+
+
+@dataclass
+class BrokerStats:
+    """Order counters since the last ``reset``."""
+
+    submitted: int = 0
+    fills: int = 0
+    rejected: int = 0
+    cancelled: int = 0
+
+
+@dataclass
+class Execution:
+    """A fill together with the account it left behind."""
+
+    fill: Fill
+    cash_after: float
+    position_after: float
+
+
+class _Resting:
+    __slots__ = ("order", "remaining")
+
+    def __init__(self, order: Order) -> None:
+        self.order = order
+        self.remaining = order.quantity
+
+
+class _Levels:
+    """Resting orders queued per price, with the prices kept sorted for range lookups."""
+
+    __slots__ = ("prices", "queues")
+
+    def __init__(self) -> None:
+        self.prices: list[float] = []
+        self.queues: dict[float, deque[_Resting]] = {}
+
+    def reached(self, price: float, from_above: bool) -> list[float]:
+        """Levels at or above ``price`` (highest first) or at or below it (lowest first)."""
+        if from_above:
+            return self.prices[bisect_left(self.prices, price) :][::-1]
+        return self.prices[: bisect_right(self.prices, price)]
+
+    def remove(self, price: float) -> deque[_Resting]:
+        del self.prices[bisect_left(self.prices, price)]
+        return self.queues.pop(price)
+
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self.queues.values())
+
+
+class _SymbolBook:
+    """Open orders of one symbol: market orders FIFO, limits and stops by price."""
+
+    __slots__ = ("market", "bids", "asks", "buy_stops", "sell_stops")
+
+    def __init__(self) -> None:
+        self.market: deque[_Resting] = deque()
+        self.bids = _Levels()
+        self.asks = _Levels()
+        self.buy_stops = _Levels()
+        self.sell_stops = _Levels()
+
+    def add(self, entry: _Resting) -> None:
+        order = entry.order
+        if order.type is OrderType.MARKET:
+            self.market.append(entry)
+            return
+        buy = order.side is OrderSide.BUY
+        if order.type is OrderType.LIMIT:
+            levels, price = (self.bids if buy else self.asks), order.limit_price
+        else:
+            levels, price = (self.buy_stops if buy else self.sell_stops), order.stop_price
+        queue = levels.queues.get(price)
+        if queue is None:
+            insort(levels.prices, price)
+            queue = levels.queues[price] = deque()
+        queue.append(entry)
+
+    def orders(self) -> list[Order]:
+        entries = list(self.market)
+        for levels in (self.bids, self.asks, self.buy_stops, self.sell_stops):
+            for queue in levels.queues.values():
+                entries.extend(queue)
+        return [entry.order for entry in entries]
+
+    def __len__(self) -> int:
+        return (
+            len(self.market)
+            + len(self.bids)
+            + len(self.asks)
+            + len(self.buy_stops)
+            + len(self.sell_stops)
+        )
+
+
+def _well_formed(order: Order) -> bool:
+    if not order.quantity > 0:
+        return False
+    if order.type is OrderType.LIMIT:
+        return order.limit_price is not None
+    if order.type is OrderType.STOP:
+        return order.stop_price is not None
+    return True
+
+
+class SimulatedBroker:
+    """``Broker`` that fills orders against bar prices for backtests and paper trading.
+
+    A symbol trades only while its bar is current: ``process_bar`` marks the
+    symbol at the bar's close and fills the resting orders that price reaches,
+    and orders submitted before the next bar trade at that price too. Orders
+    for other symbols rest in their symbol's book until its next bar. Market
+    orders fill first-in first-out; buy (sell) limits fill, best price first,
+    once the price is at or below (above) the limit, never at a worse price
+    than the limit; stops turn into market orders once the price crosses them.
+    ``time_in_force`` is not simulated: orders rest until filled or cancelled.
+
+    ``max_participation`` caps the quantity filled per bar at that fraction of
+    the bar's volume; the rest of an order stays in the book and fills on later
+    bars. Buys that cost more than the available cash are rejected, and sells
+    are clipped to the position held (no shorting). Every ``Fill`` carries the
+    ``commission_model``'s fee, and the ``slippage_model`` sets its price.
+    Every fill is also appended to ``executions`` with the cash and position
+    of its symbol right after it, so callers need not redo the accounting.
+    """
+
+    name = "simulated"
+
+    def __init__(
+        self,
+        commission_model: CommissionModel | None = None,
+        slippage_model: SlippageModel | None = None,
+        max_participation: float | None = None,
+    ) -> None:
+        if max_participation is not None and max_participation <= 0:
+            raise ValueError("max_participation must be positive (or None for no cap).")
+        self.commission_model = commission_model or NoCommission()
+        self.slippage_model = slippage_model or NoSlippage()
+        self.max_participation = max_participation
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop every open order, price and counter."""
+        self._books: dict[str, _SymbolBook] = {}
+        self._prices: dict[str, float] = {}
+        self._symbol: str | None = None
+        self._liquidity = math.inf
+        self.stats = BrokerStats()
+        self.executions: list[Execution] = []
+
+    # ---------- Broker protocol ----------
+    def submit_orders(self, orders: Iterable[Order], state: PortfolioState) -> list[Fill]:
+        """Book ``orders``; those for the current bar's symbol trade immediately."""
+        books = self._books
+        current = None
+        submitted = rejected = 0
+        for order in orders:
+            submitted += 1
+            if not _well_formed(order):
+                rejected += 1
+                continue
+            book = books.get(order.symbol)
+            if book is None:
+                book = books[order.symbol] = _SymbolBook()
+            book.add(_Resting(order))
+            if order.symbol == self._symbol:
+                current = book
+        self.stats.submitted += submitted
+        self.stats.rejected += rejected
+        if current is None:
+            return []
+        return self._match(current, self._prices[self._symbol], state)
+
+    def cancel_all(self, symbols: Iterable[str]) -> None:
+        """Cancel every open order of ``symbols``."""
+        for symbol in symbols:
+            book = self._books.pop(symbol, None)
+            if book is not None:
+                self.stats.cancelled += len(book)
+
+    # ---------- Market data ----------
+    def process_bar(self, bar: PriceBar | CompactPriceBar, state: PortfolioState) -> list[Fill]:
+        """Make ``bar`` current and fill the resting orders of its symbol."""
+        self._symbol = bar.symbol
+        self._prices[bar.symbol] = bar.close
+        volume = bar.volume
+        if self.max_participation is None or volume is None or math.isnan(volume):
+            self._liquidity = math.inf
+        else:
+            self._liquidity = self.max_participation * volume
+        book = self._books.get(bar.symbol)
+        if book is None:
+            return []
+        return self._match(book, bar.close, state)
+
+    def last_price(self, symbol: str) -> float | None:
+        return self._prices.get(symbol)
+
+    def mark_to_market(self, state: PortfolioState) -> float:
+        """Cash plus positions at their last traded price (cost basis if none yet)."""
+        equity = state.cash
+        for position in state.positions.values():
+            equity += position.quantity * self._prices.get(position.symbol, position.cost_basis)
+        return equity
+
+    def open_orders(self, symbol: str | None = None) -> list[Order]:
+        """Orders still resting, for one symbol or all of them."""
+        if symbol is not None:
+            book = self._books.get(symbol)
+            return book.orders() if book is not None else []
+        return [order for book in self._books.values() for order in book.orders()]
+
+    # ---------- Matching ----------
+    def _match(self, book: _SymbolBook, price: float, state: PortfolioState) -> list[Fill]:
+        fills: list[Fill] = []
+        # Triggered stops join the market queue behind the orders already waiting.
+        for levels, from_above in ((book.buy_stops, False), (book.sell_stops, True)):
+            for level in levels.reached(price, from_above):
+                book.market.extend(levels.remove(level))
+        self._fill_queue(book.market, price, None, state, fills)
+        for levels, from_above in ((book.bids, True), (book.asks, False)):
+            for level in levels.reached(price, from_above):
+                if self._liquidity <= 0:
+                    break
+                queue = levels.queues[level]
+                self._fill_queue(queue, price, level, state, fills)
+                if not queue:
+                    levels.remove(level)
+        return fills
+
+    def _fill_queue(
+        self,
+        queue: deque[_Resting],
+        price: float,
+        limit: float | None,
+        state: PortfolioState,
+        fills: list[Fill],
+    ) -> None:
+        while queue and self._liquidity > 0:
+            entry = queue[0]
+            fill = self._execute(entry, price, limit, state)
+            if fill is None:
+                queue.popleft()
+                self.stats.rejected += 1
+                continue
+            fills.append(fill)
+            self.stats.fills += 1
+            if entry.remaining <= 0:
+                queue.popleft()
+
+    def _execute(
+        self, entry: _Resting, price: float, limit: float | None, state: PortfolioState
+    ) -> Fill | None:
+        """Fill as much of ``entry`` as liquidity allows; None if it must be rejected."""
+        order = entry.order
+        symbol = order.symbol
+        fill_price = self.slippage_model.fill_price(order, price)
+        quantity = min(entry.remaining, self._liquidity)
+        existing = state.positions.get(symbol)
+        if order.side is OrderSide.BUY:
+            if limit is not None:
+                fill_price = min(fill_price, limit)
+            commission = self.commission_model.commission(order, fill_price, quantity)
+            cost = quantity * fill_price + commission
+            if cost > state.cash:
+                return None
+            state.cash -= cost
+            if existing is None:
+                held = quantity
+                state.positions[symbol] = Position(symbol, quantity, fill_price)
+            else:
+                held = existing.quantity + quantity
+                basis = (existing.quantity * existing.cost_basis + quantity * fill_price) / held
+                state.positions[symbol] = Position(symbol, held, basis)
+        else:
+            if existing is None or existing.quantity <= 0:
+                return None
+            if limit is not None:
+                fill_price = max(fill_price, limit)
+            if quantity >= existing.quantity:
+                # Selling more than is held: sell it all and drop the rest.
+                quantity = existing.quantity
+                entry.remaining = quantity
+            commission = self.commission_model.commission(order, fill_price, quantity)
+            state.cash += quantity * fill_price - commission
+            held = existing.quantity - quantity
+            if held <= 0:
+                held = 0.0
+                del state.positions[symbol]
+            else:
+                state.positions[symbol] = Position(symbol, held, existing.cost_basis)
+        self._liquidity -= quantity
+        entry.remaining = 0.0 if quantity >= entry.remaining else entry.remaining - quantity
+        fill = Fill(order=order, fill_price=fill_price, fill_qty=quantity, commission=commission)
+        self.executions.append(Execution(fill, state.cash, held))
+        return fill
@@ -1,10 +1,13 @@
-"""Risk management policies and checks (placeholder)."""
+"""Risk management policies and pre-trade checks."""
 
 from __future__ import annotations
 
-from typing import Protocol
+from dataclasses import dataclass, field
+from typing import Iterable, Mapping, Protocol
 
-from trading_app.execution.orders import Order
+import numpy as np
+
+from trading_app.execution.orders import Order, OrderSide
 from trading_app.portfolio.models import PortfolioState
 
 
@@ -16,3 +19,235 @@ class RiskModel(Protocol):
     def validate(self, orders: list[Order], state: PortfolioState) -> list[Order]:
         """Return approved orders, potentially adjusted or filtered."""
         ...
+
+
+@dataclass(frozen=True)
+class RiskLimits:
+    """Pre-trade limits; ``None`` disables a check.
+
+    Weights and exposures are fractions of portfolio equity, notionals are in
+    cash. ``lot_size`` rounds scaled-down quantities down to whole lots.
+    """
+
+    max_order_notional: float | None = None
+    max_position_weight: float | None = None
+    max_sector_weight: float | None = None
+    max_gross_exposure: float | None = None
+    max_net_exposure: float | None = None
+    require_cash: bool = True
+    lot_size: float | None = None
+
+
+@dataclass
+class RiskCheck:
+    """Outcome of checking one order batch.
+
+    ``scale`` holds the approved fraction of every submitted order (0 when it
+    was rejected), ``binding`` how many orders each limit scaled down.
+    """
+
+    orders: list[Order]
+    scale: np.ndarray
+    binding: dict[str, int] = field(default_factory=dict)
+
+
+def _headroom_ratio(headroom: np.ndarray | float, demand: np.ndarray | float) -> np.ndarray:
+    """Fraction of ``demand`` that fits in ``headroom``, within [0, 1]."""
+    headroom = np.asarray(headroom, dtype="float64")
+    demand = np.asarray(demand, dtype="float64")
+    ratio = np.divide(
+        headroom, demand, out=np.ones(np.broadcast(headroom, demand).shape), where=demand > 0
+    )
+    return np.clip(ratio, 0.0, 1.0)
+
+
+def _resized(order: Order, quantity: float) -> Order:
+    # Spelled out: ``dataclasses.replace`` costs several times more per order.
+    return Order(
+        order.symbol,
+        quantity,
+        order.side,
+        order.type,
+        order.limit_price,
+        order.stop_price,
+        order.time_in_force,
+    )
+
+
+class PreTradeRiskModel:
+    """Checks a whole order batch against ``limits`` in a few NumPy passes.
+
+    Orders are valued at the last price given to ``update_prices`` (falling back
+    to the position's cost basis, then to the order's limit or stop price);
+    orders that cannot be valued are rejected. Breaching orders are scaled down
+    proportionally rather than dropped: when the buys of a symbol, a sector or
+    the whole batch need more room than a limit leaves, each of them keeps the
+    same fraction. Limits apply in this order, each to what the previous ones
+    left: order notional (both sides), position weight, sector weight, gross
+    and net exposure, and cash. Sells reduce exposure and free cash for the
+    buys of the same batch (positions are long-only, as in ``SimulatedBroker``),
+    so they are only subject to the order-notional cap.
+    """
+
+    name = "pre_trade"
+
+    def __init__(
+        self,
+        limits: RiskLimits,
+        sectors: Mapping[str, str] | None = None,
+        prices: Mapping[str, float] | None = None,
+    ) -> None:
+        self.limits = limits
+        self.prices: dict[str, float] = dict(prices or {})
+        self._sector_codes: dict[str, int] = {}
+        if sectors:
+            names = {name: code for code, name in enumerate(sorted(set(sectors.values())))}
+            self._sector_codes = {symbol: names[name] for symbol, name in sectors.items()}
+        self._sector_count = len(set(self._sector_codes.values()))
+
+    def update_prices(self, prices: Mapping[str, float]) -> None:
+        """Record the latest prices used to value orders and positions."""
+        self.prices.update(prices)
+
+    def validate(self, orders: list[Order], state: PortfolioState) -> list[Order]:
+        """Approved orders, with quantities scaled down where a limit binds."""
+        return self.check(orders, state).orders
+
+    def check(self, orders: Iterable[Order], state: PortfolioState) -> RiskCheck:
+        """Check ``orders`` against ``state`` and report what each limit did."""
+        orders = list(orders)
+        count = len(orders)
+        if count == 0:
+            return RiskCheck(orders=[], scale=np.ones(0))
+        limits = self.limits
+        index: dict[str, int] = {}
+        codes = np.fromiter(
+            (index.setdefault(order.symbol, len(index)) for order in orders), np.intp, count
+        )
+        quantity = np.fromiter((order.quantity for order in orders), "float64", count)
+        buy = np.fromiter((order.side is OrderSide.BUY for order in orders), bool, count)
+        symbols = list(index)
+        prices = self._symbol_prices(symbols, orders, codes, state)
+        held = np.array(
+            [
+                state.positions[symbol].quantity if symbol in state.positions else 0.0
+                for symbol in symbols
+            ]
+        )
+        held_value = held * np.nan_to_num(prices)
+        notional = quantity * prices[codes]
+
+        scale = np.where((quantity > 0) & ~np.isnan(notional), 1.0, 0.0)
+        binding: dict[str, int] = {}
+
+        def bind(name: str, factor: np.ndarray, applies: np.ndarray) -> None:
+            nonlocal scale
+            tighter = applies & (factor < 1.0) & (scale > 0)
+            if tighter.any():
+                binding[name] = int(tighter.sum())
+                scale = np.where(applies, scale * factor, scale)
+
+        if limits.max_order_notional is not None:
+            cap = _headroom_ratio(limits.max_order_notional, notional)
+            bind("max_order_notional", cap, np.ones(count, dtype=bool))
+
+        # Sells free exposure and cash up to the value actually held.
+        sells = np.minimum(
+            np.bincount(codes, weights=np.where(buy, 0.0, notional * scale), minlength=len(index)),
+            np.maximum(held_value, 0.0),
+        )
+        sells = np.nan_to_num(sells)
+        position_symbols, position_values = self._position_values(state)
+        equity = state.equity if state.equity is not None else state.cash + position_values.sum()
+
+        def buys_by_symbol() -> np.ndarray:
+            return np.bincount(
+                codes,
+                weights=np.where(buy, np.nan_to_num(notional) * scale, 0.0),
+                minlength=len(index),
+            )
+
+        if limits.max_position_weight is not None:
+            headroom = limits.max_position_weight * equity - (held_value - sells)
+            bind("max_position_weight", _headroom_ratio(headroom, buys_by_symbol())[codes], buy)
+
+        if limits.max_sector_weight is not None and self._sector_codes:
+            sector_of = np.array([self._sector_codes.get(symbol, -1) for symbol in symbols])
+            known = sector_of >= 0
+            held_sector = np.array(
+                [self._sector_codes.get(symbol, -1) for symbol in position_symbols], np.intp
+            )
+            held_known = held_sector >= 0
+            exposure = np.bincount(
+                held_sector[held_known],
+                weights=position_values[held_known],
+                minlength=self._sector_count,
+            ) - np.bincount(sector_of[known], weights=sells[known], minlength=self._sector_count)
+            demand = np.bincount(
+                sector_of[known], weights=buys_by_symbol()[known], minlength=self._sector_count
+            )
+            ratio = _headroom_ratio(limits.max_sector_weight * equity - exposure, demand)
+            factor = np.where(known, ratio[np.maximum(sector_of, 0)], 1.0)
+            bind("max_sector_weight", factor[codes], buy)
+
+        gross, net = np.abs(position_values).sum(), position_values.sum()
+        for name, cap, current in (
+            ("max_gross_exposure", limits.max_gross_exposure, gross),
+            ("max_net_exposure", limits.max_net_exposure, net),
+        ):
+            if cap is not None:
+                headroom = cap * equity - (current - sells.sum())
+                bind(name, np.full(count, _headroom_ratio(headroom, buys_by_symbol().sum())), buy)
+
+        if limits.require_cash:
+            available = state.cash + sells.sum()
+            bind("cash", np.full(count, _headroom_ratio(available, buys_by_symbol().sum())), buy)
+
+        approved = quantity * scale
+        if limits.lot_size is not None:
+            # Only quantities this check changed are rounded; the rest stay as submitted.
+            lots = np.floor(approved / limits.lot_size + 1e-9) * limits.lot_size
+            lots = np.where(scale < 1.0, lots, approved)
+            if (lots < approved).any():
+                binding["lot_size"] = int((lots < approved).sum())
+            approved = lots
+            scale = np.divide(approved, quantity, out=np.zeros(count), where=quantity > 0)
+        kept = [
+            order if ratio == 1.0 else _resized(order, size)
+            for order, ratio, size in zip(orders, scale.tolist(), approved.tolist())
+            if size > 0
+        ]
+        return RiskCheck(orders=kept, scale=scale, binding=binding)
+
+    # ---------- Valuation ----------
+    def _symbol_prices(
+        self, symbols: list[str], orders: list[Order], codes: np.ndarray, state: PortfolioState
+    ) -> np.ndarray:
+        prices = np.array(
+            [
+                self.prices.get(
+                    symbol,
+                    state.positions[symbol].cost_basis if symbol in state.positions else np.nan,
+                )
+                for symbol in symbols
+            ],
+            dtype="float64",
+        )
+        for position in np.flatnonzero(np.isnan(prices)):
+            # Unknown symbol: value it at the first order's own limit or stop price.
+            order = orders[int(np.argmax(codes == position))]
+            quoted = order.limit_price if order.limit_price is not None else order.stop_price
+            if quoted is not None:
+                prices[position] = quoted
+        return prices
+
+    def _position_values(self, state: PortfolioState) -> tuple[list[str], np.ndarray]:
+        symbols = list(state.positions)
+        values = np.array(
+            [
+                position.quantity * self.prices.get(symbol, position.cost_basis)
+                for symbol, position in state.positions.items()
+            ],
+            dtype="float64",
+        )
+        return symbols, values
@@ -2,9 +2,42 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 
 def utc_now() -> datetime:
     """Return current UTC time (implement when needed)."""
     raise NotImplementedError("Provide timezone-aware now() implementation")
+
+
+def ensure_utc(value: datetime) -> datetime:
+    """Return ``value`` as an aware UTC datetime, treating naive input as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def datetime_to_ns(value: datetime) -> int:
+    """Convert a datetime to integer nanoseconds since the Unix epoch (UTC)."""
+    delta = ensure_utc(value) - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1_000
+
+
+def ns_to_datetime(value: int) -> datetime:
+    """Convert integer nanoseconds since the Unix epoch to an aware UTC datetime."""
+    return _EPOCH + timedelta(microseconds=int(value) // 1_000)
+
+
+def to_datetime(value: datetime | int) -> datetime:
+    """Display-boundary conversion: pass datetimes through, read ints as UTC nanoseconds."""
+    return ns_to_datetime(value) if isinstance(value, int) else value
+
+
+def elapsed_seconds(start: datetime | int, end: datetime | int) -> float:
+    """Seconds from ``start`` to ``end``; both datetimes or both UTC-nanosecond ints."""
+    if isinstance(start, int) and isinstance(end, int):
+        return (end - start) / 1_000_000_000
+    return (to_datetime(end) - to_datetime(start)).total_seconds()